@@ -1,25 +1,91 @@
 import os
+from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 import logging
+from datetime import datetime
 
 class Config:
     # Base URL of the application under test
-    BASE_URL = "https://www.saucedemo.com/"
+    BASE_URL = os.getenv("BASE_URL", "https://www.saucedemo.com/")
+
+    # Application to run against: "remote" (BASE_URL) or "local" (bundled stand-in in local_app/)
+    APP_TARGET = os.getenv("APP_TARGET", "remote").lower()
+
+    # Local stand-in server settings (port 0 picks a free port, one server per xdist worker)
+    LOCAL_APP_HOST = "127.0.0.1"
+    LOCAL_APP_PORT = int(os.getenv("LOCAL_APP_PORT", "0"))
+    LOCAL_APP_GLITCH_DELAY = float(os.getenv("LOCAL_APP_GLITCH_DELAY", "5"))
     
     # Browser to use for automation (chrome, firefox, edge)
-    BROWSER = "chrome"
+    BROWSER = os.getenv("BROWSER", "chrome")
     
     # Run browser in headless mode (without UI) if set to True
     HEADLESS = False
     
     # Run browser in incognito/private mode
     INCOGNITO = True
+
+    # Named browser launch profiles (select with LAUNCH_PROFILE=<name> or --launch-profile <name>)
+    #   debug:      visible browser, maximized window, everything loads (HEADLESS still applies)
+    #   ci:         headless, fixed viewport, no extensions or background traffic
+    #   throughput: ci + no images/web fonts and 'eager' page loads (DOMContentLoaded)
+    LAUNCH_PROFILES = {
+        "debug": {
+            "headless": None,  # None: follow Config.HEADLESS
+            "maximize": True,
+            "window_size": (1920, 1080),
+            "page_load_strategy": "normal",
+            "block_images": False,
+            "block_fonts": False,
+            "disable_extensions": False,
+            "disable_background_networking": False,
+        },
+        "ci": {
+            "headless": True,
+            "maximize": False,
+            "window_size": (1920, 1080),
+            "page_load_strategy": "normal",
+            "block_images": False,
+            "block_fonts": False,
+            "disable_extensions": True,
+            "disable_background_networking": True,
+        },
+        "throughput": {
+            "headless": True,
+            "maximize": False,
+            "window_size": (1366, 768),
+            "page_load_strategy": "eager",
+            "block_images": True,
+            "block_fonts": True,
+            "disable_extensions": True,
+            "disable_background_networking": True,
+        },
+    }
+    LAUNCH_PROFILE = os.getenv("LAUNCH_PROFILE", "debug").lower()
     
-    # Implicit wait (applies globally to find_element) in seconds
-    IMPLICIT_WAIT = 10
+    # Implicit wait (applies globally to find_element) in seconds.
+    # Kept at 0: all waiting is done by the explicit wait engine (utils/wait_engine.py),
+    # mixing both makes every negative check block for the implicit wait on each poll
+    # (IMPLICIT_WAIT=10 reproduces the legacy setup, e.g. for the suite wall-clock benchmark)
+    IMPLICIT_WAIT = float(os.getenv("IMPLICIT_WAIT", "0"))
     
     # Explicit wait (for specific conditions/elements) in seconds
     EXPLICIT_WAIT = 15
+
+    # Wait engine polling: first poll interval, back-off factor and poll interval cap (seconds)
+    WAIT_POLL_INTERVAL = float(os.getenv("WAIT_POLL_INTERVAL", "0.05"))
+    WAIT_BACKOFF = 1.5
+    WAIT_MAX_POLL_INTERVAL = 0.5
+
+    # Time budgets (seconds) per kind of condition, used when no explicit timeout is given
+    WAIT_BUDGETS = {
+        "default": 10,
+        "visible": 10,
+        "present": 10,
+        "invisible": 10,
+        "url": 10,
+        "probe": 2,   # "Is it there?" checks that are expected to fail quickly
+    }
     
     # Path to save screenshots (inside "reports/screenshots" folder)
     SCREENSHOT_PATH = os.path.join(
@@ -28,30 +94,238 @@ class Config:
         "screenshots"
     )
     
+    # Background screenshot pipeline: output format ("png", "jpeg", "webp"; the
+    # last two need Pillow), optional downscale width, worker threads and the
+    # number of screenshots allowed in flight before take_screenshot blocks
+    SCREENSHOT_FORMAT = os.getenv("SCREENSHOT_FORMAT", "png")
+    SCREENSHOT_MAX_WIDTH = int(os.environ["SCREENSHOT_MAX_WIDTH"]) if os.getenv("SCREENSHOT_MAX_WIDTH") else None
+    SCREENSHOT_QUALITY = 80
+    ARTIFACT_WORKERS = 2
+    ARTIFACT_QUEUE_SIZE = 16
+
+    # Content-addressed screenshot store: max dHash bit distance treated as the
+    # same image (0 = exact sha256 matches only, the default; above 0 a near-identical
+    # screenshot reuses an earlier image and needs Pillow), and retention limits
+    SCREENSHOT_DHASH_DISTANCE = int(os.getenv("SCREENSHOT_DHASH_DISTANCE", "0"))
+    SCREENSHOT_KEEP_RUNS = int(os.getenv("SCREENSHOT_KEEP_RUNS", "20"))
+    SCREENSHOT_MAX_BYTES = int(os.getenv("SCREENSHOT_MAX_BYTES", str(200 * 1024 * 1024)))
+
+    # Incremental HTML report written while tests run (None = off; see --stream-report)
+    STREAM_REPORT_PATH = os.getenv("STREAM_REPORT_PATH")
+
+    # Record every WebDriver command (latency, locator, calling page-object method)
+    PROFILE_COMMANDS = os.getenv("PROFILE_COMMANDS", "false").lower() == "true"
+
+    # Where command profiles and flame-graph traces are written
+    PROFILE_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "reports", "profile")
+
+    # Number of slowest commands listed in the HTML report
+    PROFILE_TOP_N = 20
+
+    # Page-object benchmarks: timed repetitions per operation, JSON history of
+    # runs/baselines, allowed p50/p95 growth over the baseline (0.25 = +25%) and
+    # allowed p99 growth (looser: with few repetitions p99 is close to the slowest sample)
+    BENCHMARK_REPEAT = int(os.getenv("BENCHMARK_REPEAT", "10"))
+    BENCHMARK_HISTORY_PATH = os.getenv(
+        "BENCHMARK_HISTORY_PATH",
+        os.path.join(os.path.dirname(os.path.dirname(__file__)), "reports", "benchmarks", "history.json")
+    )
+    BENCHMARK_REGRESSION_THRESHOLD = float(os.getenv("BENCHMARK_REGRESSION_THRESHOLD", "0.25"))
+    BENCHMARK_TAIL_REGRESSION_THRESHOLD = float(os.getenv("BENCHMARK_TAIL_REGRESSION_THRESHOLD", "0.5"))
+
     # Logging level configuration (INFO, DEBUG, WARNING, ERROR, CRITICAL)
     LOG_LEVEL = logging.INFO
 
+    # Per-process log files go to logs/<run id>/; the merged run log to logs/
+    LOG_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "logs")
+
+    # Structured JSONL events from page objects and test hooks (logs/events/<run id>/<worker>.jsonl),
+    # and the SQLite index built over them by 'python -m utils.event_index'
+    EVENT_LOG = os.getenv("EVENT_LOG", "true").lower() == "true"
+    EVENT_LOG_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "logs", "events")
+    EVENT_INDEX_PATH = os.getenv("EVENT_INDEX_PATH", os.path.join(EVENT_LOG_PATH, "index.sqlite"))
+
+    # Log records buffered for the background writer before records below
+    # WARNING are dropped, and records written to the log file per batch
+    LOG_QUEUE_SIZE = 10000
+    LOG_BATCH_SIZE = 200
+
+    # Where resolved browser driver paths/versions are pinned (shared by all runs on the machine)
+    DRIVER_CACHE_DIR = os.getenv(
+        "DRIVER_CACHE_DIR",
+        os.path.join(os.path.expanduser("~"), ".cache", "saucedemo-automation", "drivers")
+    )
+
+    # The installed browser version is probed again when the browser binary changes; when the
+    # binary cannot be located, after this many seconds
+    BROWSER_VERSION_TTL = int(os.getenv("BROWSER_VERSION_TTL", "3600"))
+
+    # Block heavy/third-party requests in Chromium browsers via CDP (per-test override:
+    # @pytest.mark.network_policy(block=[...], unblock=[...]))
+    NETWORK_BLOCKING = os.getenv("NETWORK_BLOCKING", "false").lower() == "true"
+
+    # Launch Chromium with the performance log, which network blocking reads its
+    # counts from (switched on by conftest when any collected test uses a network_policy)
+    NETWORK_PERFORMANCE_LOG = NETWORK_BLOCKING
+
+    # Estimate the size of blocked resources never seen unblocked with one HEAD
+    # request each (off: such resources are reported as of unknown size)
+    NETWORK_ESTIMATE_SIZES = os.getenv("NETWORK_ESTIMATE_SIZES", "false").lower() == "true"
+    NETWORK_BLOCK_PATTERNS = [
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.webp",
+        "*.woff", "*.woff2", "*.ttf", "*.otf",
+        "*google-analytics.com*", "*googletagmanager.com*", "*backtrace.io*",
+    ]
+
+    # Number of warm browsers kept per test process (per pytest-xdist worker)
+    BROWSER_POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "1"))
+
+    # Bulk cart operations, sort selection and checkout form filling run as one
+    # script each; set NATIVE_CLICKS=true to click and type element by element
+    # instead (for browsers/apps that only react to native WebDriver input)
+    NATIVE_CLICKS = os.getenv("NATIVE_CLICKS", "false").lower() == "true"
+
+    # Sales tax the application adds on the checkout overview (item total * rate)
+    TAX_RATE = 0.08
+
+    # Seed for random product selection; set it to reproduce a basket across runs
+    RANDOM_SEED = int(os.environ["RANDOM_SEED"]) if os.getenv("RANDOM_SEED") else None
+
+    # Synthetic data (utils/data_generator.py): seed of the generated records and
+    # number of cases per generated test (0 = generated tests are skipped; set
+    # SOAK_VOLUME or --soak-volume for load-style runs)
+    DATA_SEED = int(os.getenv("DATA_SEED", "1337"))
+    SOAK_VOLUME = int(os.getenv("SOAK_VOLUME", "0"))
+
+    # Seed logged-in sessions from a cached cookie/localStorage snapshot instead
+    # of typing credentials through the login form for every test
+    SESSION_BOOTSTRAP = os.getenv("SESSION_BOOTSTRAP", "false").lower() == "true"
+
+    @staticmethod
+    def run_id():
+        """
+        Identifier of the current test run, shared by every process of the run.
+        Created by the first caller (the pytest controller) and handed to
+        pytest-xdist workers through the environment.
+        """
+        return os.environ.setdefault("TEST_RUN_ID", datetime.now().strftime("%Y%m%d_%H%M%S_%f"))
+
+    @classmethod
+    def url(cls, path=""):
+        """Build an absolute application URL, e.g. Config.url("inventory.html")."""
+        return cls.BASE_URL + path
+
+    @classmethod
+    def use_base_url(cls, base_url):
+        """Point every page object at another application instance (e.g. the local stand-in)."""
+        cls.BASE_URL = base_url if base_url.endswith("/") else base_url + "/"
+
+    @classmethod
+    def get_launch_profile(cls, name=None):
+        """Return the settings of the named (or currently selected) launch profile."""
+        name = (name or cls.LAUNCH_PROFILE).lower()
+        if name not in cls.LAUNCH_PROFILES:
+            raise ValueError(f"Unknown launch profile: {name}. Choose from {sorted(cls.LAUNCH_PROFILES)}")
+        profile = dict(cls.LAUNCH_PROFILES[name])
+        if profile["headless"] is None:
+            profile["headless"] = cls.HEADLESS
+        return profile
+
     @classmethod
-    def get_chrome_options(cls):
+    def get_browser_options(cls, browser=None, profile=None):
+        """
+        Build the options object for the given browser with a launch profile applied.
+        Supports chrome, firefox and edge; defaults to Config.BROWSER and Config.LAUNCH_PROFILE.
+        """
+        browser = (browser or cls.BROWSER).lower()
+        if browser == "chrome":
+            return cls.get_chrome_options(profile)
+        if browser == "edge":
+            return cls._apply_chromium_profile(webdriver.EdgeOptions(), cls.get_launch_profile(profile), "--inprivate", "ms")
+        if browser == "firefox":
+            return cls.get_firefox_options(profile)
+        raise ValueError(f"Unsupported browser: {browser}")
+
+    @classmethod
+    def get_chrome_options(cls, profile=None):
         """
         Configure Chrome browser options based on the class settings.
         Returns a configured Options object.
         """
-        options = Options()
-        
-        # Run Chrome in headless mode (no GUI) if enabled
-        if cls.HEADLESS:
-            options.add_argument("--headless")
+        return cls._apply_chromium_profile(Options(), cls.get_launch_profile(profile))
+
+    @classmethod
+    def _apply_chromium_profile(cls, options, profile, private_flag="--incognito", vendor_prefix="goog"):
+        """
+        Apply a launch profile to Chrome or Edge (both Chromium) options.
+        vendor_prefix names the driver's capability namespace ("goog" for chromedriver, "ms" for msedgedriver).
+        """
+        # Run the browser in headless mode (no GUI) if enabled
+        if profile["headless"]:
+            options.add_argument("--headless=new")
         
-        # Run Chrome in incognito/private mode if enabled
+        # Run the browser in incognito/private mode if enabled
         if cls.INCOGNITO:
-            options.add_argument("--incognito")
+            options.add_argument(private_flag)
         
-        # Recommended flags for running Chrome in containers/CI
+        # Recommended flags for running Chromium in containers/CI
         options.add_argument("--no-sandbox")
         options.add_argument("--disable-dev-shm-usage")
         
         # Set browser window size
-        options.add_argument("--window-size=1920,1080")
+        width, height = profile["window_size"]
+        options.add_argument(f"--window-size={width},{height}")
+
+        options.page_load_strategy = profile["page_load_strategy"]
+
+        if profile["block_images"]:
+            options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+            options.add_argument("--blink-settings=imagesEnabled=false")
+        if profile["block_fonts"]:
+            options.add_argument("--disable-remote-fonts")
+        if profile["disable_extensions"]:
+            options.add_argument("--disable-extensions")
+        if cls.NETWORK_BLOCKING or cls.NETWORK_PERFORMANCE_LOG:
+            # Performance log lets utils/network_policy.py count blocked requests
+            options.set_capability(f"{vendor_prefix}:loggingPrefs", {"performance": "ALL"})
+        if profile["disable_background_networking"]:
+            for flag in ("--disable-background-networking", "--disable-component-update", "--disable-sync",
+                         "--disable-default-apps", "--no-first-run", "--metrics-recording-only"):
+                options.add_argument(flag)
         
         return options
+
+    @classmethod
+    def get_firefox_options(cls, profile=None):
+        """
+        Configure Firefox browser options with a launch profile applied.
+        Returns a configured FirefoxOptions object.
+        """
+        profile = cls.get_launch_profile(profile)
+        options = webdriver.FirefoxOptions()
+
+        if profile["headless"]:
+            options.add_argument("-headless")
+        if cls.INCOGNITO:
+            options.add_argument("-private")
+
+        width, height = profile["window_size"]
+        options.add_argument(f"--width={width}")
+        options.add_argument(f"--height={height}")
+
+        options.page_load_strategy = profile["page_load_strategy"]
+
+        if profile["block_images"]:
+            options.set_preference("permissions.default.image", 2)
+        if profile["block_fonts"]:
+            options.set_preference("gfx.downloadable_fonts.enabled", False)
+        if profile["disable_extensions"]:
+            options.set_preference("extensions.enabledScopes", 0)
+            options.set_preference("xpinstall.enabled", False)
+        if profile["disable_background_networking"]:
+            for preference in ("app.update.auto", "browser.safebrowsing.malware.enabled",
+                               "browser.safebrowsing.phishing.enabled", "network.prefetch-next",
+                               "datareporting.healthreport.uploadEnabled", "toolkit.telemetry.enabled"):
+                options.set_preference(preference, False)
+
+        return options
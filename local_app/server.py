@@ -0,0 +1,185 @@
+import asyncio
+import logging
+import mimetypes
+import os
+import threading
+from http.cookies import SimpleCookie
+from config.config import Config
+
+logger = logging.getLogger(__name__)
+
+# Directory holding the HTML/JS/CSS of the stand-in application
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+
+# Pages that render the product inventory (delayed for performance_glitch_user)
+GLITCH_PAGES = {"/inventory.html"}
+
+REASONS = {200: "OK", 404: "Not Found", 405: "Method Not Allowed"}
+
+
+class LocalApp:
+    """
+    Local, asyncio-based stand-in for https://www.saucedemo.com/.
+
+    - Serves login, inventory, cart, checkout and completion pages that use
+      the same element IDs and classes as the real site.
+    - Session and cart state live in the browser (session-username cookie and
+      cart-contents localStorage entry), exactly like the real application.
+    - Models the special users from test_data/users.json; the server delays
+      the inventory page for performance_glitch_user.
+
+    Usage:
+        app = LocalApp()
+        app.start()          # runs in a background thread
+        Config.use_base_url(app.url)
+        ...
+        app.stop()
+    """
+
+    def __init__(self, host=None, port=None, glitch_delay=None):
+        self.host = host or Config.LOCAL_APP_HOST
+        self.port = Config.LOCAL_APP_PORT if port is None else port
+        self.glitch_delay = Config.LOCAL_APP_GLITCH_DELAY if glitch_delay is None else glitch_delay
+        self._files = {}
+        self._loop = None
+        self._server = None
+        self._thread = None
+        self._ready = threading.Event()
+        self._error = None
+
+    @property
+    def url(self):
+        """Base URL of the running server, with a trailing slash like Config.BASE_URL."""
+        return f"http://{self.host}:{self.port}/"
+
+    # ---------------------- Lifecycle ----------------------
+
+    def start(self, timeout=10):
+        """
+        Start serving in a daemon thread and return once the port is bound.
+        Raises the bind error (e.g. port already in use) or a RuntimeError if
+        the server does not come up within 'timeout' seconds.
+        """
+        self._thread = threading.Thread(target=self._run, name="local-app", daemon=True)
+        self._thread.start()
+        if not self._ready.wait(timeout):
+            raise RuntimeError(f"Local stand-in app did not start within {timeout} seconds")
+        if self._error is not None:
+            raise self._error
+        logger.info(f"Local stand-in app listening on {self.url}")
+        return self
+
+    def stop(self):
+        """Stop the server and wait for its thread to exit."""
+        if self._loop is None:
+            return
+        self._loop.call_soon_threadsafe(self._server.close)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        logger.info("Local stand-in app stopped")
+
+    def _run(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            self._server = loop.run_until_complete(
+                asyncio.start_server(self._handle_connection, self.host, self.port)
+            )
+            # Pick up the real port when an ephemeral one (0) was requested
+            self.port = self._server.sockets[0].getsockname()[1]
+            self._loop = loop
+        except Exception as e:
+            # Hand the error to start() instead of leaving it waiting forever
+            self._error = e
+            loop.close()
+            return
+        finally:
+            self._ready.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.run_until_complete(self._server.wait_closed())
+            self._loop.close()
+
+    # ---------------------- HTTP handling ----------------------
+
+    async def _handle_connection(self, reader, writer):
+        """Serve requests on one keep-alive connection until the client closes it."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                status, content_type, body = await self._respond(method, target, headers)
+                writer.write(
+                    f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                    f"Content-Type: {content_type}\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    "Cache-Control: no-cache\r\n"
+                    "\r\n".encode("latin-1")
+                )
+                if method != "HEAD":
+                    writer.write(body)
+                await writer.drain()
+
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, method, target, headers):
+        if method not in ("GET", "HEAD"):
+            return 405, "text/plain", b"Method Not Allowed"
+
+        path = target.split("?", 1)[0]
+        if path == "/":
+            path = "/index.html"
+
+        body = self._read_static(path)
+        if body is None:
+            return 404, "text/plain", b"Not Found"
+
+        if path in GLITCH_PAGES and self._session_user(headers) == "performance_glitch_user":
+            await asyncio.sleep(self.glitch_delay)
+
+        content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        return 200, content_type, body
+
+    def _read_static(self, path):
+        """Return a static file's bytes (cached after the first read) or None."""
+        if path not in self._files:
+            file_path = os.path.normpath(os.path.join(STATIC_DIR, path.lstrip("/")))
+            inside = os.path.commonpath([STATIC_DIR, file_path]) == STATIC_DIR
+            if not inside or not os.path.isfile(file_path):
+                return None
+            with open(file_path, "rb") as file:
+                self._files[path] = file.read()
+        return self._files[path]
+
+    @staticmethod
+    def _session_user(headers):
+        cookie = SimpleCookie(headers.get("cookie", ""))
+        morsel = cookie.get("session-username")
+        return morsel.value if morsel else None
+
+
+if __name__ == "__main__":
+    # Run the stand-in on its own, e.g. for manual exploration:
+    #   LOCAL_APP_PORT=8000 python -m local_app.server
+    app = LocalApp(port=Config.LOCAL_APP_PORT or 8000).start()
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        app.stop()
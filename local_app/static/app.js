@@ -0,0 +1,531 @@
+/*
+ * Client side of the local SauceDemo stand-in (see local_app/server.py).
+ * Renders every page with the same IDs, classes and data-test attributes as
+ * https://www.saucedemo.com/ and keeps state where the real site keeps it:
+ * the "session-username" cookie and the "cart-contents" localStorage entry.
+ */
+(function () {
+    "use strict";
+
+    var PASSWORD = "secret_sauce";
+    var USERS = ["standard_user", "locked_out_user", "problem_user",
+                 "performance_glitch_user", "error_user", "visual_user"];
+    var TAX_RATE = 0.08;
+
+    var PRODUCTS = [
+        {id: 4, name: "Sauce Labs Backpack", price: 29.99,
+         desc: "carry.allTheThings() with the sleek, streamlined Sly Pack that melds uncompromising style with unequaled laptop and tablet protection."},
+        {id: 0, name: "Sauce Labs Bike Light", price: 9.99,
+         desc: "A red light isn't the desired state in testing but it sure helps when riding your bike at night. Water-resistant with 3 lighting modes, 1 AAA battery included."},
+        {id: 1, name: "Sauce Labs Bolt T-Shirt", price: 15.99,
+         desc: "Get your testing superhero on with the Sauce Labs bolt T-shirt. From American Apparel, 100% ringspun combed cotton, heather gray with red bolt."},
+        {id: 5, name: "Sauce Labs Fleece Jacket", price: 49.99,
+         desc: "It's not every day that you come across a midweight quarter-zip fleece jacket capable of handling everything from a relaxing day outdoors to a busy day at the office."},
+        {id: 2, name: "Sauce Labs Onesie", price: 7.99,
+         desc: "Rib snap infant onesie for the junior automation engineer in development. Reinforced 3-snap bottom closure, two-needle hemmed sleeved and bottom won't unravel."},
+        {id: 3, name: "Test.allTheThings() T-Shirt (Red)", price: 15.99,
+         desc: "This classic Sauce Labs t-shirt is perfect to wear when cozying up to your keyboard to automate a few tests. Super-soft and comfy ringspun combed cotton."}
+    ];
+
+    // problem_user: these add-to-cart buttons silently do nothing
+    var PROBLEM_BROKEN_ADDS = [1, 5, 3];
+
+    // ---------------------- State ----------------------
+
+    function getUser() {
+        var match = document.cookie.match(/(?:^|;\s*)session-username=([^;]*)/);
+        return match ? decodeURIComponent(match[1]) : null;
+    }
+
+    function setUser(username) {
+        if (username) {
+            document.cookie = "session-username=" + encodeURIComponent(username) + "; path=/";
+        } else {
+            document.cookie = "session-username=; path=/; expires=Thu, 01 Jan 1970 00:00:00 GMT";
+        }
+    }
+
+    function getCart() {
+        try {
+            return JSON.parse(window.localStorage.getItem("cart-contents")) || [];
+        } catch (e) {
+            return [];
+        }
+    }
+
+    function setCart(ids) {
+        if (ids.length) {
+            window.localStorage.setItem("cart-contents", JSON.stringify(ids));
+        } else {
+            window.localStorage.removeItem("cart-contents");
+        }
+    }
+
+    function product(id) {
+        for (var i = 0; i < PRODUCTS.length; i++) {
+            if (PRODUCTS[i].id === id) {
+                return PRODUCTS[i];
+            }
+        }
+        return null;
+    }
+
+    function slug(name) {
+        return name.toLowerCase().replace(/ /g, "-");
+    }
+
+    function money(value) {
+        return "$" + value.toFixed(2);
+    }
+
+    // ---------------------- DOM helpers ----------------------
+
+    function el(tag, attrs, children) {
+        var node = document.createElement(tag);
+        var key;
+        for (key in (attrs || {})) {
+            if (key === "text") {
+                node.textContent = attrs[key];
+            } else if (key === "className") {
+                node.className = attrs[key];
+            } else {
+                node.setAttribute(key, attrs[key]);
+            }
+        }
+        (children || []).forEach(function (child) {
+            if (child) {
+                node.appendChild(child);
+            }
+        });
+        return node;
+    }
+
+    function navigate(path) {
+        window.location.href = path;
+    }
+
+    function showError(container, message) {
+        var existing = container.querySelector("[data-test='error']");
+        if (existing) {
+            existing.parentNode.removeChild(existing);
+        }
+        var error = el("h3", {"data-test": "error", text: message},
+                       [el("button", {className: "error-button", "data-test": "error-button", text: "x"})]);
+        error.lastChild.addEventListener("click", function () {
+            error.parentNode.removeChild(error);
+        });
+        container.insertBefore(error, container.firstChild);
+    }
+
+    // ---------------------- Shared header ----------------------
+
+    function renderBadge() {
+        var link = document.querySelector(".shopping_cart_link");
+        if (!link) {
+            return;
+        }
+        var count = getCart().length;
+        var badge = link.querySelector(".shopping_cart_badge");
+        if (count === 0 && badge) {
+            link.removeChild(badge);
+        } else if (count > 0) {
+            if (!badge) {
+                badge = el("span", {className: "shopping_cart_badge", "data-test": "shopping-cart-badge"});
+                link.appendChild(badge);
+            }
+            badge.textContent = String(count);
+        }
+    }
+
+    function header(title, withSort) {
+        var menu = el("div", {className: "bm-menu-wrap", "aria-hidden": "true", style: "display: none;"}, [
+            el("nav", {className: "bm-item-list"}, [
+                el("a", {id: "inventory_sidebar_link", className: "bm-item menu-item", href: "#", text: "All Items"}),
+                el("a", {id: "about_sidebar_link", className: "bm-item menu-item", href: "#", text: "About"}),
+                el("a", {id: "logout_sidebar_link", className: "bm-item menu-item", href: "#", text: "Logout"}),
+                el("a", {id: "reset_sidebar_link", className: "bm-item menu-item", href: "#", text: "Reset App State"})
+            ]),
+            el("button", {id: "react-burger-cross-btn", type: "button", text: "Close Menu"})
+        ]);
+
+        function closeMenu() {
+            menu.style.display = "none";
+            menu.setAttribute("aria-hidden", "true");
+        }
+
+        var burger = el("button", {id: "react-burger-menu-btn", type: "button", text: "Open Menu"});
+        burger.addEventListener("click", function () {
+            menu.style.display = "block";
+            menu.setAttribute("aria-hidden", "false");
+        });
+        menu.querySelector("#react-burger-cross-btn").addEventListener("click", closeMenu);
+        menu.querySelector("#inventory_sidebar_link").addEventListener("click", function (event) {
+            event.preventDefault();
+            navigate("inventory.html");
+        });
+        menu.querySelector("#logout_sidebar_link").addEventListener("click", function (event) {
+            event.preventDefault();
+            setCart([]);
+            setUser(null);
+            navigate("./");
+        });
+        menu.querySelector("#reset_sidebar_link").addEventListener("click", function (event) {
+            event.preventDefault();
+            setCart([]);
+            closeMenu();
+            renderBadge();
+            document.querySelectorAll(".btn_inventory").forEach(function (button) {
+                setButtonState(button, Number(button.getAttribute("data-product-id")), false);
+            });
+        });
+
+        var cartLink = el("a", {className: "shopping_cart_link", "data-test": "shopping-cart-link", href: "cart.html"});
+        var secondary = el("div", {className: "header_secondary_container"}, [
+            el("span", {className: "title", "data-test": "title", text: title})
+        ]);
+        if (withSort) {
+            secondary.appendChild(sortSelect());
+        }
+
+        var node = el("div", {id: "header_container", className: "header_container"}, [
+            el("div", {className: "primary_header"}, [
+                el("div", {id: "menu_button_container"}, [burger, menu]),
+                el("div", {className: "header_label"}, [el("div", {className: "app_logo", text: "Swag Labs"})]),
+                el("div", {id: "shopping_cart_container", className: "shopping_cart_container"}, [cartLink])
+            ]),
+            secondary
+        ]);
+        return node;
+    }
+
+    // ---------------------- Login ----------------------
+
+    function renderLogin(root) {
+        var form = el("form", {}, [
+            el("div", {className: "form_group"}, [
+                el("input", {id: "user-name", name: "user-name", "data-test": "username", className: "input_error form_input",
+                             placeholder: "Username", type: "text", autocorrect: "off", autocapitalize: "none"})
+            ]),
+            el("div", {className: "form_group"}, [
+                el("input", {id: "password", name: "password", "data-test": "password", className: "input_error form_input",
+                             placeholder: "Password", type: "password", autocorrect: "off", autocapitalize: "none"})
+            ]),
+            el("div", {className: "error-message-container"}),
+            el("input", {id: "login-button", name: "login-button", "data-test": "login-button",
+                         className: "submit-button btn_action", type: "submit", value: "Login"})
+        ]);
+
+        form.addEventListener("submit", function (event) {
+            event.preventDefault();
+            var username = form.querySelector("#user-name").value;
+            var password = form.querySelector("#password").value;
+            var errors = form.querySelector(".error-message-container");
+
+            if (!username) {
+                showError(errors, "Epic sadface: Username is required");
+            } else if (!password) {
+                showError(errors, "Epic sadface: Password is required");
+            } else if (USERS.indexOf(username) === -1 || password !== PASSWORD) {
+                showError(errors, "Epic sadface: Username and password do not match any user in this service");
+            } else if (username === "locked_out_user") {
+                showError(errors, "Epic sadface: Sorry, this user has been locked out.");
+            } else {
+                setUser(username);
+                navigate("inventory.html");
+            }
+        });
+
+        root.appendChild(el("div", {className: "login_container"}, [
+            el("div", {className: "login_logo", text: "Swag Labs"}),
+            el("div", {className: "login_wrapper"}, [form])
+        ]));
+    }
+
+    // ---------------------- Inventory ----------------------
+
+    function sortSelect() {
+        var select = el("select", {className: "product_sort_container", "data-test": "product-sort-container"}, [
+            el("option", {value: "az", text: "Name (A to Z)"}),
+            el("option", {value: "za", text: "Name (Z to A)"}),
+            el("option", {value: "lohi", text: "Price (low to high)"}),
+            el("option", {value: "hilo", text: "Price (high to low)"})
+        ]);
+        select.addEventListener("change", function () {
+            // problem_user: sorting is broken, the list never changes order
+            if (getUser() !== "problem_user") {
+                renderInventoryList(select.value);
+            }
+        });
+        return select;
+    }
+
+    function sorted(key) {
+        var items = PRODUCTS.slice();
+        var compare = {
+            az: function (a, b) { return a.name < b.name ? -1 : a.name > b.name ? 1 : 0; },
+            za: function (a, b) { return a.name < b.name ? 1 : a.name > b.name ? -1 : 0; },
+            lohi: function (a, b) { return a.price - b.price; },
+            hilo: function (a, b) { return b.price - a.price; }
+        }[key];
+        return items.sort(compare);
+    }
+
+    function setButtonState(button, id, inCart) {
+        var base = slug(product(id).name);
+        button.id = (inCart ? "remove-" : "add-to-cart-") + base;
+        button.setAttribute("name", button.id);
+        button.setAttribute("data-test", button.id);
+        button.className = "btn " + (inCart ? "btn_secondary" : "btn_primary") + " btn_small btn_inventory";
+        button.textContent = inCart ? "Remove" : "Add to cart";
+    }
+
+    function cartButton(id) {
+        var button = el("button", {"data-product-id": String(id)});
+        setButtonState(button, id, getCart().indexOf(id) !== -1);
+        button.addEventListener("click", function () {
+            var cart = getCart();
+            var index = cart.indexOf(id);
+            if (index === -1) {
+                if (getUser() === "problem_user" && PROBLEM_BROKEN_ADDS.indexOf(id) !== -1) {
+                    return;
+                }
+                cart.push(id);
+            } else {
+                cart.splice(index, 1);
+            }
+            setCart(cart);
+            setButtonState(button, id, index === -1);
+            renderBadge();
+        });
+        return button;
+    }
+
+    function inventoryItem(item) {
+        // problem_user: every product shows the same wrong image
+        var image = getUser() === "problem_user" ? "img/sl-404.svg" : "img/product-" + item.id + ".svg";
+        return el("div", {className: "inventory_item", "data-test": "inventory-item"}, [
+            el("div", {className: "inventory_item_img"}, [
+                el("a", {id: "item_" + item.id + "_img_link", href: "#"}, [
+                    el("img", {className: "inventory_item_img", alt: item.name, src: image})
+                ])
+            ]),
+            el("div", {className: "inventory_item_description", "data-test": "inventory-item-description"}, [
+                el("div", {className: "inventory_item_label"}, [
+                    el("a", {id: "item_" + item.id + "_title_link", href: "#"}, [
+                        el("div", {className: "inventory_item_name", "data-test": "inventory-item-name", text: item.name})
+                    ]),
+                    el("div", {className: "inventory_item_desc", "data-test": "inventory-item-desc", text: item.desc})
+                ]),
+                el("div", {className: "pricebar"}, [
+                    el("div", {className: "inventory_item_price", "data-test": "inventory-item-price", text: money(item.price)}),
+                    cartButton(item.id)
+                ])
+            ])
+        ]);
+    }
+
+    function renderInventoryList(sortKey) {
+        var list = document.querySelector(".inventory_list");
+        list.innerHTML = "";
+        sorted(sortKey).forEach(function (item) {
+            list.appendChild(inventoryItem(item));
+        });
+    }
+
+    function renderInventory(root) {
+        root.appendChild(el("div", {id: "page_wrapper", className: "page_wrapper"}, [
+            header("Products", true),
+            el("div", {id: "inventory_container", className: "inventory_container"}, [
+                el("div", {className: "inventory_list", "data-test": "inventory-list"})
+            ])
+        ]));
+        renderInventoryList("az");
+    }
+
+    // ---------------------- Cart ----------------------
+
+    function cartItem(item, removable) {
+        var details = [
+            el("a", {id: "item_" + item.id + "_title_link", href: "#"}, [
+                el("div", {className: "inventory_item_name", "data-test": "inventory-item-name", text: item.name})
+            ]),
+            el("div", {className: "inventory_item_desc", "data-test": "inventory-item-desc", text: item.desc}),
+            el("div", {className: "item_pricebar"}, [
+                el("div", {className: "inventory_item_price", "data-test": "inventory-item-price", text: money(item.price)})
+            ])
+        ];
+        var row = el("div", {className: "cart_item", "data-test": "inventory-item"}, [
+            el("div", {className: "cart_quantity", "data-test": "item-quantity", text: "1"}),
+            el("div", {className: "cart_item_label"}, details)
+        ]);
+        if (removable) {
+            var remove = el("button", {id: "remove-" + slug(item.name), name: "remove-" + slug(item.name),
+                                       "data-test": "remove-" + slug(item.name),
+                                       className: "btn btn_secondary btn_small cart_button", text: "Remove"});
+            remove.addEventListener("click", function () {
+                var cart = getCart();
+                cart.splice(cart.indexOf(item.id), 1);
+                setCart(cart);
+                row.parentNode.removeChild(row);
+                renderBadge();
+            });
+            row.lastChild.lastChild.appendChild(remove);
+        }
+        return row;
+    }
+
+    function cartList(removable) {
+        var list = el("div", {className: "cart_list", "data-test": "cart-list"}, [
+            el("div", {className: "cart_quantity_label", text: "QTY"}),
+            el("div", {className: "cart_desc_label", text: "Description"})
+        ]);
+        getCart().forEach(function (id) {
+            list.appendChild(cartItem(product(id), removable));
+        });
+        return list;
+    }
+
+    function renderCart(root) {
+        var continueShopping = el("button", {id: "continue-shopping", "data-test": "continue-shopping",
+                                             className: "btn btn_secondary back btn_medium", text: "Continue Shopping"});
+        continueShopping.addEventListener("click", function () { navigate("inventory.html"); });
+        var checkout = el("button", {id: "checkout", "data-test": "checkout",
+                                     className: "btn btn_action btn_medium checkout_button", text: "Checkout"});
+        checkout.addEventListener("click", function () { navigate("checkout-step-one.html"); });
+
+        root.appendChild(el("div", {id: "page_wrapper", className: "page_wrapper"}, [
+            header("Your Cart", false),
+            el("div", {id: "cart_contents_container", className: "cart_contents_container"}, [
+                cartList(true),
+                el("div", {className: "cart_footer"}, [continueShopping, checkout])
+            ])
+        ]));
+    }
+
+    // ---------------------- Checkout ----------------------
+
+    function renderCheckoutStepOne(root) {
+        var form = el("form", {}, [
+            el("div", {className: "checkout_info"}, [
+                el("div", {className: "form_group"}, [
+                    el("input", {id: "first-name", name: "firstName", "data-test": "firstName",
+                                 className: "input_error form_input", placeholder: "First Name", type: "text"})
+                ]),
+                el("div", {className: "form_group"}, [
+                    el("input", {id: "last-name", name: "lastName", "data-test": "lastName",
+                                 className: "input_error form_input", placeholder: "Last Name", type: "text"})
+                ]),
+                el("div", {className: "form_group"}, [
+                    el("input", {id: "postal-code", name: "postalCode", "data-test": "postalCode",
+                                 className: "input_error form_input", placeholder: "Zip/Postal Code", type: "text"})
+                ]),
+                el("div", {className: "error-message-container"})
+            ]),
+            el("div", {className: "checkout_buttons"}, [
+                el("button", {id: "cancel", "data-test": "cancel", type: "button",
+                              className: "btn btn_secondary back btn_medium cart_cancel_link", text: "Cancel"}),
+                el("input", {id: "continue", name: "continue", "data-test": "continue", type: "submit",
+                             className: "submit-button btn btn_primary cart_button btn_action", value: "Continue"})
+            ])
+        ]);
+
+        // problem_user: typing into the last name field overwrites the first name instead
+        if (getUser() === "problem_user") {
+            form.querySelector("#last-name").addEventListener("input", function (event) {
+                form.querySelector("#first-name").value = event.target.value;
+                event.target.value = "";
+            });
+        }
+
+        form.querySelector("#cancel").addEventListener("click", function () { navigate("cart.html"); });
+        form.addEventListener("submit", function (event) {
+            event.preventDefault();
+            var errors = form.querySelector(".error-message-container");
+            if (!form.querySelector("#first-name").value) {
+                showError(errors, "Error: First Name is required");
+            } else if (!form.querySelector("#last-name").value) {
+                showError(errors, "Error: Last Name is required");
+            } else if (!form.querySelector("#postal-code").value) {
+                showError(errors, "Error: Postal Code is required");
+            } else {
+                navigate("checkout-step-two.html");
+            }
+        });
+
+        root.appendChild(el("div", {id: "page_wrapper", className: "page_wrapper"}, [
+            header("Checkout: Your Information", false),
+            el("div", {id: "checkout_info_container", className: "checkout_info_container"}, [form])
+        ]));
+    }
+
+    function renderCheckoutStepTwo(root) {
+        var subtotal = getCart().reduce(function (sum, id) { return sum + product(id).price; }, 0);
+        var tax = Math.round(subtotal * TAX_RATE * 100) / 100;
+
+        var cancel = el("button", {id: "cancel", "data-test": "cancel",
+                                   className: "btn btn_secondary back btn_medium cart_cancel_link", text: "Cancel"});
+        cancel.addEventListener("click", function () { navigate("inventory.html"); });
+        var finish = el("button", {id: "finish", "data-test": "finish",
+                                   className: "btn btn_action btn_medium cart_button", text: "Finish"});
+        finish.addEventListener("click", function () {
+            setCart([]);
+            navigate("checkout-complete.html");
+        });
+
+        root.appendChild(el("div", {id: "page_wrapper", className: "page_wrapper"}, [
+            header("Checkout: Overview", false),
+            el("div", {id: "checkout_summary_container", className: "checkout_summary_container"}, [
+                cartList(false),
+                el("div", {className: "summary_info"}, [
+                    el("div", {className: "summary_info_label", "data-test": "payment-info-label", text: "Payment Information:"}),
+                    el("div", {className: "summary_value_label", "data-test": "payment-info-value", text: "SauceCard #31337"}),
+                    el("div", {className: "summary_info_label", "data-test": "shipping-info-label", text: "Shipping Information:"}),
+                    el("div", {className: "summary_value_label", "data-test": "shipping-info-value", text: "Free Pony Express Delivery!"}),
+                    el("div", {className: "summary_info_label", "data-test": "total-info-label", text: "Price Total"}),
+                    el("div", {className: "summary_subtotal_label", "data-test": "subtotal-label", text: "Item total: " + money(subtotal)}),
+                    el("div", {className: "summary_tax_label", "data-test": "tax-label", text: "Tax: " + money(tax)}),
+                    el("div", {className: "summary_info_label summary_total_label", "data-test": "total-label",
+                               text: "Total: " + money(subtotal + tax)}),
+                    el("div", {className: "cart_footer"}, [cancel, finish])
+                ])
+            ])
+        ]));
+    }
+
+    function renderCheckoutComplete(root) {
+        var back = el("button", {id: "back-to-products", "data-test": "back-to-products",
+                                 className: "btn btn_primary btn_small", text: "Back Home"});
+        back.addEventListener("click", function () { navigate("inventory.html"); });
+
+        root.appendChild(el("div", {id: "page_wrapper", className: "page_wrapper"}, [
+            header("Checkout: Complete!", false),
+            el("div", {id: "checkout_complete_container", className: "checkout_complete_container"}, [
+                el("h2", {className: "complete-header", "data-test": "complete-header", text: "Thank you for your order!"}),
+                el("div", {className: "complete-text", "data-test": "complete-text",
+                           text: "Your order has been dispatched, and will arrive just as fast as the pony can get there!"}),
+                back
+            ])
+        ]));
+    }
+
+    // ---------------------- Bootstrap ----------------------
+
+    var PAGES = {
+        "login": renderLogin,
+        "inventory": renderInventory,
+        "cart": renderCart,
+        "checkout-step-one": renderCheckoutStepOne,
+        "checkout-step-two": renderCheckoutStepTwo,
+        "checkout-complete": renderCheckoutComplete
+    };
+
+    var page = document.body.getAttribute("data-page");
+    if (page !== "login" && !getUser()) {
+        // Pages behind the login redirect to the login form, like the real site
+        navigate("./");
+        return;
+    }
+    var root = document.getElementById("root");
+    PAGES[page](root);
+    renderBadge();
+})();
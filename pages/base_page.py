@@ -1,11 +1,36 @@
-from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
-import os
-from datetime import datetime
+from utils.artifacts import get_pipeline
+from utils.events import page_action
+from utils.wait_engine import WaitEngine
 import logging
 
 class BasePage:
+    # Script that reads every row of a container/field spec in one round trip.
+    # arguments[0]: container CSS selector
+    # arguments[1]: list of [field name, CSS selector or null, attribute or null]
+    _EXTRACT_RECORDS_SCRIPT = """
+        var containers = document.querySelectorAll(arguments[0]);
+        var fields = arguments[1];
+        var rows = [];
+        for (var i = 0; i < containers.length; i++) {
+            var row = {};
+            for (var j = 0; j < fields.length; j++) {
+                var el = fields[j][1] ? containers[i].querySelector(fields[j][1]) : containers[i];
+                if (!el) {
+                    row[fields[j][0]] = null;
+                } else if (fields[j][2]) {
+                    row[fields[j][0]] = el.getAttribute(fields[j][2]);
+                } else {
+                    row[fields[j][0]] = el.innerText.trim();
+                }
+            }
+            rows.push(row);
+        }
+        return rows;
+    """
+
     def __init__(self, driver):
         """
         Base class for all page objects.
@@ -13,36 +38,41 @@ class BasePage:
         """
         self.driver = driver
         self.logger = logging.getLogger(self.__class__.__name__)  # Logger for debugging
+        self.waits = WaitEngine(driver)  # Owns all waiting; see utils/wait_engine.py
+
+    def wait_until(self, condition, timeout=None, budget="default", message=""):
+        """
+        Wait until condition(driver) returns a truthy value and return it.
+        Uses the named time budget from Config.WAIT_BUDGETS when no timeout is given.
+        """
+        return self.waits.until(condition, timeout, budget, message)
     
-    def find_element(self, locator, timeout=10):
+    def find_element(self, locator, timeout=None):
         """
         Wait until the element is visible on the page and return it.
         """
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(locator)
-            )
+            element = self.wait_until(EC.visibility_of_element_located(locator), timeout, "visible")
             self.logger.debug(f"Found element: {locator}")
             return element
         except TimeoutException:
-            self.logger.error(f"Element {locator} not found within {timeout} seconds")
+            self.logger.error(f"Element {locator} not found within {timeout or WaitEngine.budget('visible')} seconds")
             raise
     
-    def find_elements(self, locator, timeout=10):
+    def find_elements(self, locator, timeout=None):
         """
         Wait until multiple elements are visible and return them as a list.
         """
         try:
-            elements = WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_any_elements_located(locator)
-            )
+            elements = self.wait_until(EC.visibility_of_any_elements_located(locator), timeout, "visible")
             self.logger.debug(f"Found {len(elements)} elements: {locator}")
             return elements
         except TimeoutException:
-            self.logger.error(f"Elements {locator} not found within {timeout} seconds")
+            self.logger.error(f"Elements {locator} not found within {timeout or WaitEngine.budget('visible')} seconds")
             raise
     
-    def click(self, locator, timeout=10):
+    @page_action
+    def click(self, locator, timeout=None):
         """
         Click an element. Handles stale element exceptions by retrying once.
         """
@@ -57,7 +87,8 @@ class BasePage:
             element.click()
             self.logger.debug(f"Clicked element after retry: {locator}")
     
-    def send_keys(self, locator, text, timeout=10):
+    @page_action
+    def send_keys(self, locator, text, timeout=None):
         """
         Clear the input field and send text to it.
         """
@@ -66,7 +97,8 @@ class BasePage:
         element.send_keys(text)
         self.logger.debug(f"Entered text '{text}' in element: {locator}")
     
-    def get_text(self, locator, timeout=10):
+    @page_action
+    def get_text(self, locator, timeout=None):
         """
         Get and return the text content of an element.
         """
@@ -75,24 +107,39 @@ class BasePage:
         self.logger.debug(f"Got text '{text}' from element: {locator}")
         return text
     
-    def is_element_present(self, locator, timeout=5):
+    @page_action
+    def is_element_present(self, locator, timeout=None):
         """
         Check if an element is present in the DOM (not necessarily visible).
+        Probes once first, so an element that is already there costs a single call.
         """
+        if self.waits.probe(locator):
+            self.logger.debug(f"Element present: {locator}")
+            return True
         try:
-            self.find_element(locator, timeout)
+            self.wait_until(lambda driver: self.waits.probe(locator), timeout, "probe")
             self.logger.debug(f"Element present: {locator}")
             return True
-        except (TimeoutException, NoSuchElementException):
+        except TimeoutException:
             self.logger.debug(f"Element not present: {locator}")
             return False
     
-    def is_element_visible(self, locator, timeout=5):
+    def is_element_absent(self, locator):
+        """
+        Fast negative check: True if the element is not in the DOM right now.
+        Issues a single lookup and never waits.
+        """
+        absent = not self.waits.probe(locator)
+        self.logger.debug(f"Element absent {absent}: {locator}")
+        return absent
+    
+    @page_action
+    def is_element_visible(self, locator, timeout=None):
         """
         Check if an element is visible on the page.
         """
         try:
-            element = self.find_element(locator, timeout)
+            element = self.wait_until(EC.visibility_of_element_located(locator), timeout, "probe")
             visible = element.is_displayed()
             self.logger.debug(f"Element visible {visible}: {locator}")
             return visible
@@ -100,69 +147,123 @@ class BasePage:
             self.logger.debug(f"Element not visible: {locator}")
             return False
     
-    def wait_for_element_to_disappear(self, locator, timeout=10):
+    @page_action
+    def wait_for_element_to_disappear(self, locator, timeout=None):
         """
         Wait until an element becomes invisible or is removed from the DOM.
         """
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.invisibility_of_element_located(locator)
-            )
+            self.wait_until(EC.invisibility_of_element_located(locator), timeout, "invisible")
             self.logger.debug(f"Element disappeared: {locator}")
             return True
         except TimeoutException:
-            self.logger.warning(f"Element {locator} did not disappear within {timeout} seconds")
+            self.logger.warning(f"Element {locator} did not disappear within {timeout or WaitEngine.budget('invisible')} seconds")
             return False
     
-    def wait_for_url_to_contain(self, text, timeout=10):
+    @page_action
+    def wait_for_url_to_contain(self, text, timeout=None):
         """
         Wait until the current URL contains the given substring.
         """
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.url_contains(text)
-            )
+            self.wait_until(EC.url_contains(text), timeout, "url")
             self.logger.debug(f"URL contains '{text}'")
             return True
         except TimeoutException:
-            self.logger.warning(f"URL did not contain '{text}' within {timeout} seconds")
+            self.logger.warning(f"URL did not contain '{text}' within {timeout or WaitEngine.budget('url')} seconds")
             return False
     
-    def wait_for_url_to_be(self, url, timeout=10):
+    @page_action
+    def wait_for_url_to_be(self, url, timeout=None):
         """
         Wait until the current URL exactly matches the expected URL.
         """
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.url_to_be(url)
-            )
+            self.wait_until(EC.url_to_be(url), timeout, "url")
             self.logger.debug(f"URL is '{url}'")
             return True
         except TimeoutException:
-            self.logger.warning(f"URL did not become '{url}' within {timeout} seconds")
+            self.logger.warning(f"URL did not become '{url}' within {timeout or WaitEngine.budget('url')} seconds")
             return False
     
+    @staticmethod
+    def to_css_selector(locator):
+        """
+        Convert an (By, value) locator into an equivalent CSS selector.
+        Only locator strategies with a direct CSS equivalent are supported.
+        """
+        by, value = locator
+        if by == By.CSS_SELECTOR:
+            return value
+        if by == By.ID:
+            return f"[id='{value}']"
+        if by == By.CLASS_NAME:
+            return f".{value}"
+        if by == By.NAME:
+            return f"[name='{value}']"
+        if by == By.TAG_NAME:
+            return value
+        raise ValueError(f"Locator {locator} has no CSS equivalent")
+
+    @page_action
+    def extract_records(self, container, fields, timeout=None):
+        """
+        Read all rows matching a declarative spec in a single execute_script call.
+
+        Args:
+            container: Locator of the repeating row element (e.g. each product card).
+            fields (dict): Maps field name to (locator, parser) or (locator, parser, attribute).
+                A locator of None reads the container itself; parser may be None to
+                keep the raw string; attribute reads an attribute instead of the text.
+            timeout (int): Seconds to wait for at least one row to appear.
+
+        Returns:
+            list[dict]: One plain dict per row with parsed field values.
+        """
+        field_specs = []
+        parsers = {}
+        for name, spec in fields.items():
+            locator, parser = spec[0], spec[1]
+            attribute = spec[2] if len(spec) > 2 else None
+            field_specs.append([name, self.to_css_selector(locator) if locator else None, attribute])
+            parsers[name] = parser
+
+        container_css = self.to_css_selector(container)
+        try:
+            # Each poll is a single script call; the first successful poll returns the data
+            rows = self.wait_until(
+                lambda driver: driver.execute_script(self._EXTRACT_RECORDS_SCRIPT, container_css, field_specs),
+                timeout, "present"
+            )
+        except TimeoutException:
+            self.logger.error(f"No rows {container} found within {timeout or WaitEngine.budget('present')} seconds")
+            raise
+
+        records = [
+            {name: parsers[name](value) if parsers[name] and value is not None else value
+             for name, value in row.items()}
+            for row in rows
+        ]
+        self.logger.debug(f"Extracted {len(records)} records from {container}")
+        return records
+
+    @staticmethod
+    def parse_price(text):
+        """Convert a price label such as '$29.99' into a float."""
+        return float(text.replace('$', ''))
+
+    @staticmethod
+    def parse_product_id(element_id):
+        """Extract the product id from an element id such as 'item_4_title_link'."""
+        return int(element_id.split('_')[1])
+
     def take_screenshot(self, name):
         """
-        Capture a screenshot with a timestamp and save it in the reports/screenshots folder.
-        Returns the file path of the saved screenshot.
-        """
-        # Create a timestamp-based filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{name}_{timestamp}.png"
-        
-        # Define screenshot storage path
-        filepath = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)), 
-            "reports", 
-            "screenshots", 
-            filename
-        )
-        
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        
-        # Save screenshot
-        self.driver.save_screenshot(filepath)
-        self.logger.info(f"Screenshot saved: {filepath}")
-        return filepath
+        Capture a screenshot into the content-addressed store under reports/screenshots.
+        Only the capture happens here; the file is written in the background.
+        Returns the screenshot's path as a path-like ScreenshotHandle: using it as a
+        path waits for the write; handle.ref() waits for the stable "sha256:..." reference.
+        """
+        handle = get_pipeline().screenshot(self.driver, name)
+        self.logger.info(f"Screenshot captured: {name}")
+        return handle
@@ -1,7 +1,8 @@
 from selenium.webdriver.common.by import By
 from .base_page import BasePage
+from utils.events import page_action
+from config.config import Config
 import logging
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import TimeoutException
 
 class CartPage(BasePage):
@@ -13,6 +14,32 @@ class CartPage(BasePage):
     CHECKOUT_BUTTON = (By.ID, "checkout")
     CONTINUE_SHOPPING_BUTTON = (By.ID, "continue-shopping")
     REMOVE_BUTTONS = (By.CLASS_NAME, "cart_button")
+
+    # Clicks the remove button of several cart rows in one call and returns the post-state.
+    # Rows are resolved before any click, so indices refer to the cart as it was.
+    # arguments[0]: item names or row indices
+    _REMOVE_ITEMS_SCRIPT = """
+        var rows = Array.prototype.slice.call(document.querySelectorAll(".cart_item"));
+        var nameOf = function (row) { return row.querySelector(".inventory_item_name").innerText.trim(); };
+        var targets = arguments[0].map(function (wanted) {
+            return typeof wanted === "number" ? rows[wanted] : rows.filter(function (row) { return nameOf(row) === wanted; })[0];
+        });
+        var removed = targets.map(function (row, i) {
+            var button = row && row.querySelector(".cart_button");
+            // Skip rows that are missing or were already requested earlier in the list
+            if (!button || targets.indexOf(row) !== i) { return null; }
+            var name = nameOf(row);
+            button.dispatchEvent(new MouseEvent("click", {bubbles: true, cancelable: true, view: window}));
+            return name;
+        });
+        return {removed: removed, remaining: Array.prototype.map.call(document.querySelectorAll(".cart_item"), nameOf)};
+    """
+
+    # Field spec for reading cart rows in one round trip (see BasePage.extract_records)
+    CART_ITEM_FIELDS = {
+        "name": (ITEM_NAMES, None),
+        "price": (ITEM_PRICES, BasePage.parse_price),
+    }
     
     def __init__(self, driver):
         """
@@ -34,16 +61,14 @@ class CartPage(BasePage):
         Wait until at least one cart item is visible.
         """
         try:
-            WebDriverWait(self.driver, timeout).until(
-                lambda driver: len(self.get_cart_items(timeout=5)) > 0
-            )
+            self.wait_until(lambda driver: self.waits.probe(self.CART_ITEMS), timeout)
             self.logger.info("Cart items are visible on the page")
             return True
         except TimeoutException:
             self.logger.warning("No cart items found within timeout")
             return False
     
-    def get_cart_items(self, timeout=10):
+    def get_cart_items(self, timeout=None):
         """
         Return all cart item elements.
         """
@@ -55,32 +80,34 @@ class CartPage(BasePage):
             self.logger.warning(f"Could not find cart items: {e}")
             return []
     
-    def get_item_names(self, timeout=10):
+    @page_action
+    def get_item_records(self, timeout=None):
         """
-        Get names of all items in the cart.
+        Get every cart row as a dict of name and price.
         """
         try:
-            elements = self.find_elements(self.ITEM_NAMES, timeout)
-            names = [element.text for element in elements]
-            self.logger.info(f"Cart item names: {names}")
-            return names
+            return self.extract_records(self.CART_ITEMS, self.CART_ITEM_FIELDS, timeout)
         except Exception as e:
-            self.logger.warning(f"Could not find item names: {e}")
+            self.logger.warning(f"Could not read cart items: {e}")
             return []
     
-    def get_item_prices(self, timeout=10):
+    def get_item_names(self, timeout=None):
+        """
+        Get names of all items in the cart.
+        """
+        names = [item['name'] for item in self.get_item_records(timeout)]
+        self.logger.debug(f"Cart item names: {names}")
+        return names
+    
+    def get_item_prices(self, timeout=None):
         """
         Get prices of all items in the cart as floats.
         """
-        try:
-            elements = self.find_elements(self.ITEM_PRICES, timeout)
-            prices = [float(element.text.replace('$', '')) for element in elements]
-            self.logger.info(f"Cart item prices: {prices}")
-            return prices
-        except Exception as e:
-            self.logger.warning(f"Could not find item prices: {e}")
-            return []
+        prices = [item['price'] for item in self.get_item_records(timeout)]
+        self.logger.debug(f"Cart item prices: {prices}")
+        return prices
     
+    @page_action
     def proceed_to_checkout(self):
         """
         Click the checkout button and wait until URL changes to checkout page.
@@ -97,21 +124,56 @@ class CartPage(BasePage):
         self.logger.info("Clicked on Continue Shopping button")
         self.wait_for_url_to_contain("inventory")
     
+    @page_action
     def remove_item(self, index=0):
         """
         Remove an item from the cart based on its index (default first item).
         """
-        remove_buttons = self.find_elements(self.REMOVE_BUTTONS)
-        if index < len(remove_buttons):
-            remove_buttons[index].click()
-            self.logger.info(f"Removed item at index {index}")
+        state = self.remove_items([index])
+        if state['removed'][0] is None:
+            self.logger.warning(f"Tried to remove item at index {index}, but only {len(state['remaining'])} items exist")
+        return state
+
+    @page_action
+    def remove_items(self, items):
+        """
+        Remove several cart rows, given by name or row index, in one batch.
+        All clicks are dispatched by a single script (per-element WebDriver
+        clicks when Config.NATIVE_CLICKS is set).
+
+        Returns:
+            dict: {"removed": [name or None per requested item], "remaining": [names left in the cart]},
+            read back from the page after the clicks.
+        """
+        items = list(items)
+        if Config.NATIVE_CLICKS:
+            state = self._remove_items_natively(items)
         else:
-            self.logger.warning(f"Tried to remove item at index {index}, but only {len(remove_buttons)} items exist")
+            state = self.driver.execute_script(self._REMOVE_ITEMS_SCRIPT, items)
+        self.logger.info(f"Removed from cart: {[name for name in state['removed'] if name]}")
+        return state
+
+    def _remove_items_natively(self, items):
+        """Fallback for remove_items: one native WebDriver click per row"""
+        names = [record['name'] for record in self.get_item_records()]
+        targets = []
+        for item in items:
+            name = names[item] if isinstance(item, int) and item < len(names) else item if item in names else None
+            targets.append(name if name not in targets else None)
+        # Remove buttons are identified by id ("remove-<slug>"), so earlier clicks cannot shift them
+        buttons = {name: button.get_attribute("id")
+                   for name, button in zip(names, self.driver.find_elements(*self.REMOVE_BUTTONS))}
+        for name in dict.fromkeys(targets):
+            if name is not None:
+                self.click((By.ID, buttons[name]))
+        remaining = [name for name in names if name not in targets]
+        self.wait_until(lambda driver: len(driver.find_elements(*self.CART_ITEMS)) == len(remaining))
+        return {"removed": targets, "remaining": remaining}
     
     def is_cart_empty(self):
         """
         Check if the cart is empty.
         """
-        empty = len(self.get_cart_items(timeout=5)) == 0
+        empty = self.is_element_absent(self.CART_ITEMS)
         self.logger.info(f"Cart empty status: {empty}")
         return empty
@@ -0,0 +1,114 @@
+from .base_page import BasePage
+from .cart_page import CartPage
+from .checkout_page import CheckoutPage
+from .order_complete_page import OrderCompletePage
+from .products_page import ProductsPage
+from config.config import Config
+from utils.events import get_event_log, page_action
+import logging
+import math
+import time
+from contextlib import contextmanager
+
+class CheckoutFlow(BasePage):
+    """
+    The whole checkout as one macro: cart -> info -> overview -> complete.
+
+    - cart: open the cart, snapshot its rows (one read), start checkout.
+    - info: fill and submit the form in one script call.
+    - overview: read items and totals in one call and check them against the
+      cart snapshot (item total, tax at Config.TAX_RATE, total).
+    - complete: finish the order and read the confirmation header.
+    Each stage is timed (timings_ms) and emitted as a "checkout.<stage>" event.
+    """
+
+    STAGES = ("cart", "info", "overview", "complete")
+
+    def __init__(self, driver):
+        super().__init__(driver)
+        self.logger = logging.getLogger(__name__)
+        self.timings_ms = {}
+
+    @contextmanager
+    def _stage(self, name):
+        """Time one stage of the flow"""
+        start = time.perf_counter()
+        outcome = "ok"
+        try:
+            yield
+        except Exception as e:
+            outcome = type(e).__name__
+            raise
+        finally:
+            self.timings_ms[name] = round((time.perf_counter() - start) * 1000, 1)
+            events = get_event_log()
+            if events is not None:
+                events.emit(f"checkout.{name}", page=type(self).__name__,
+                            duration_ms=self.timings_ms[name], outcome=outcome)
+
+    @page_action
+    def run(self, checkout_info, finish=True, screenshot=None):
+        """
+        Check out the current cart with the given CheckoutInfo.
+        'screenshot' names an optional screenshot of the overview page.
+
+        Returns:
+            dict: "cart" (list of (name, price) before checkout), "form" (values
+            read back from the form), "summary" (see CheckoutPage.get_summary),
+            "header" (confirmation header, None if not finished), "mismatches"
+            (list of problems found; empty when the order checks out) and
+            "timings_ms" per stage.
+        """
+        self.timings_ms = {}
+        result = {"cart": None, "form": None, "summary": None, "header": None,
+                  "mismatches": [], "timings_ms": self.timings_ms}
+
+        with self._stage("cart"):
+            ProductsPage(self.driver).go_to_cart()
+            cart_page = CartPage(self.driver)
+            result["cart"] = [(item['name'], item['price']) for item in cart_page.get_item_records()]
+            cart_page.proceed_to_checkout()
+
+        with self._stage("info"):
+            checkout_page = CheckoutPage(self.driver)
+            result["form"] = checkout_page.fill_checkout_info(
+                checkout_info.first_name, checkout_info.last_name, checkout_info.postal_code, submit=True
+            )
+            if not checkout_page.wait_for_url_to_contain("checkout-step-two"):
+                result["mismatches"].append(f"Checkout information rejected: {checkout_page.get_error_message()}")
+                return result
+
+        with self._stage("overview"):
+            result["summary"] = checkout_page.get_summary()
+            result["mismatches"].extend(self.verify_summary(result["cart"], result["summary"]))
+            if screenshot:
+                self.take_screenshot(screenshot)
+
+        if finish:
+            with self._stage("complete"):
+                checkout_page.finish()
+                result["header"] = OrderCompletePage(self.driver).get_complete_header()
+
+        self.logger.info(f"Checkout stage timings (ms): {self.timings_ms}")
+        if result["mismatches"]:
+            self.logger.warning(f"Checkout mismatches: {result['mismatches']}")
+        return result
+
+    @staticmethod
+    def expected_totals(prices):
+        """Item total, tax and total for a list of prices, rounded like the application (half up to cents)"""
+        item_total = round(sum(prices), 2)
+        tax = math.floor(item_total * Config.TAX_RATE * 100 + 0.5) / 100
+        return item_total, tax, round(item_total + tax, 2)
+
+    @classmethod
+    def verify_summary(cls, cart, summary):
+        """Compare the overview page with the cart snapshot; returns a list of mismatches"""
+        mismatches = []
+        if summary["items"] != cart:
+            mismatches.append(f"Overview items {summary['items']} differ from cart {cart}")
+        expected = dict(zip(("item_total", "tax", "total"), cls.expected_totals([price for _, price in cart])))
+        for name, value in expected.items():
+            if abs(summary[name] - value) >= 0.005:
+                mismatches.append(f"{name} is {summary[name]:.2f}, expected {value:.2f}")
+        return mismatches
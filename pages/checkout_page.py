@@ -1,6 +1,9 @@
 from selenium.webdriver.common.by import By
 from .base_page import BasePage
+from utils.events import page_action
+from config.config import Config
 import logging
+from selenium.common.exceptions import TimeoutException
 
 class CheckoutPage(BasePage):
     # Locators for checkout page elements
@@ -11,6 +14,50 @@ class CheckoutPage(BasePage):
     CONTINUE_BUTTON = (By.ID, "continue")
     CANCEL_BUTTON = (By.ID, "cancel")
     ERROR_MESSAGE = (By.CSS_SELECTOR, "[data-test='error']")
+    FINISH_BUTTON = (By.ID, "finish")
+    SUMMARY_ITEMS = (By.CLASS_NAME, "cart_item")
+
+    # Fills form fields in one call: each value goes through the native value
+    # setter followed by bubbling input and change events, so frameworks such as
+    # React see it as typed. Returns the values read back afterwards (page
+    # scripts may have rewritten them); with arguments[1] set, also submits the form.
+    # arguments[0]: list of [element id, value]
+    _FILL_FORM_SCRIPT = """
+        var setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, "value").set;
+        var fields = arguments[0], values = {}, input;
+        fields.forEach(function (field) {
+            input = document.getElementById(field[0]);
+            input.focus();
+            setter.call(input, field[1]);
+            input.dispatchEvent(new Event("input", {bubbles: true}));
+            input.dispatchEvent(new Event("change", {bubbles: true}));
+        });
+        fields.forEach(function (field) { values[field[0]] = document.getElementById(field[0]).value; });
+        if (arguments[1]) {
+            var submit = document.getElementById(arguments[1]);
+            submit.form.requestSubmit(submit);
+        }
+        return values;
+    """
+
+    # Reads the overview page: item rows and the item total / tax / total labels
+    _READ_SUMMARY_SCRIPT = """
+        var label = function (selector) {
+            var el = document.querySelector(selector);
+            return el ? el.innerText.trim() : null;
+        };
+        var total = label(".summary_total_label");
+        if (total === null) { return null; }
+        return {
+            items: Array.prototype.map.call(document.querySelectorAll(".cart_item"), function (row) {
+                return [row.querySelector(".inventory_item_name").innerText.trim(),
+                        row.querySelector(".inventory_item_price").innerText.trim()];
+            }),
+            item_total: label(".summary_subtotal_label"),
+            tax: label(".summary_tax_label"),
+            total: total
+        };
+    """
     
     def __init__(self, driver):
         """
@@ -27,19 +74,38 @@ class CheckoutPage(BasePage):
         self.logger.info(f"Checkout page title: {title}")
         return title
     
-    def fill_checkout_info(self, first_name, last_name, postal_code):
+    @page_action
+    def fill_checkout_info(self, first_name, last_name, postal_code, submit=False):
         """
         Fill out the checkout form with customer information.
+        All fields are set in one script call that fires input/change events
+        (typed field by field when Config.NATIVE_CLICKS is set); with submit=True
+        the same call also submits the form.
+        Returns the field values as read back from the page, keyed by element id.
         """
-        self.send_keys(self.FIRST_NAME_FIELD, first_name)
-        self.logger.info(f"Entered first name: {first_name}")
-        
-        self.send_keys(self.LAST_NAME_FIELD, last_name)
-        self.logger.info(f"Entered last name: {last_name}")
-        
-        self.send_keys(self.POSTAL_CODE_FIELD, postal_code)
-        self.logger.info(f"Entered postal code: {postal_code}")
+        fields = [
+            (self.FIRST_NAME_FIELD, first_name),
+            (self.LAST_NAME_FIELD, last_name),
+            (self.POSTAL_CODE_FIELD, postal_code),
+        ]
+        if Config.NATIVE_CLICKS:
+            for locator, value in fields:
+                self.send_keys(locator, value)
+            values = {locator[1]: self.driver.find_element(*locator).get_attribute("value") for locator, _ in fields}
+            if submit:
+                self.continue_to_overview()
+        else:
+            self.wait_until(lambda driver: self.waits.probe(self.FIRST_NAME_FIELD), None, "present")
+            values = self.driver.execute_script(
+                self._FILL_FORM_SCRIPT,
+                [[locator[1], value] for locator, value in fields],
+                self.CONTINUE_BUTTON[1] if submit else None
+            )
+        self.logger.debug(f"Checkout form values: {values}")
+        self.logger.info("Entered checkout information")
+        return values
     
+    @page_action
     def continue_to_overview(self):
         """
         Click the Continue button to go to the overview page.
@@ -47,6 +113,32 @@ class CheckoutPage(BasePage):
         self.click(self.CONTINUE_BUTTON)
         self.logger.info("Clicked Continue button on checkout page")
     
+    @page_action
+    def get_summary(self, timeout=None):
+        """
+        Read the overview page in one script call (per poll).
+        Returns a dict with "items" (list of (name, price)) and the floats
+        "item_total", "tax" and "total" parsed from the summary labels.
+        """
+        try:
+            summary = self.wait_until(lambda driver: driver.execute_script(self._READ_SUMMARY_SCRIPT), timeout, "present")
+        except TimeoutException:
+            self.logger.error("Checkout overview summary not found")
+            raise
+        return {
+            "items": [(name, self.parse_price(price)) for name, price in summary["items"]],
+            "item_total": self.parse_price(summary["item_total"].split(":")[1].strip()),
+            "tax": self.parse_price(summary["tax"].split(":")[1].strip()),
+            "total": self.parse_price(summary["total"].split(":")[1].strip()),
+        }
+
+    @page_action
+    def finish(self):
+        """Click Finish on the overview page and wait for the order confirmation page"""
+        self.click(self.FINISH_BUTTON)
+        self.wait_for_url_to_contain("checkout-complete")
+        self.logger.info("Clicked Finish button to place order")
+
     def cancel_checkout(self):
         """
         Click the Cancel button to return to the cart page.
@@ -1,5 +1,7 @@
 from selenium.webdriver.common.by import By
 from .base_page import BasePage
+from utils.events import page_action
+from config.config import Config
 import logging
 
 class LoginPage(BasePage):
@@ -15,9 +17,10 @@ class LoginPage(BasePage):
         """
         super().__init__(driver)
         self.logger = logging.getLogger(__name__)
-        self.driver.get("https://www.saucedemo.com/")
+        self.driver.get(Config.url())
         self.logger.info("Navigated to SauceDemo login page")
     
+    @page_action
     def login(self, username, password):
         """
         Perform login action using provided username and password.
@@ -30,11 +33,17 @@ class LoginPage(BasePage):
         
         self.click(self.LOGIN_BUTTON)
         self.logger.info("Clicked Login button")
+        # Identifies the session for per-user caches such as the product catalog
+        self.driver.session_user = username
     
     def get_error_message(self):
         """
         Return the error message text if displayed, else None.
         """
+        # Fast negative path: a successful login has already left the login page
+        if "inventory" in self.driver.current_url:
+            self.logger.info("No error message displayed on login page")
+            return None
         if self.is_element_present(self.ERROR_MESSAGE):
             error_text = self.get_text(self.ERROR_MESSAGE)
             self.logger.warning(f"Login error displayed: {error_text}")
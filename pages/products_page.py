@@ -1,25 +1,191 @@
 from selenium.webdriver.common.by import By
 from .base_page import BasePage
+from utils.events import page_action
 from .login_page import LoginPage
+from config.config import Config
 import random
 import logging
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.common.exceptions import TimeoutException
+import unicodedata
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.support import expected_conditions as EC
 
+
+def collation_key(text):
+    """
+    Sort key approximating a dictionary collation without touching the process locale:
+    letters compare case- and accent-insensitively first, then accents, then case.
+
+    This is an approximation, not a locale's collation: it is Unicode NFKD
+    decomposition plus casefold, compared by code point. Language-specific rules
+    (e.g. Swedish "å" after "z", Spanish "ch", ignored punctuation) are not applied;
+    use locale.strxfrm or PyICU where such rules matter.
+    """
+    folded = unicodedata.normalize("NFKD", text.casefold())
+    base = "".join(char for char in folded if not unicodedata.combining(char))
+    return base, folded, text
+
+
 class ProductsPage(BasePage):
     # Locators
     PRODUCTS_TITLE = (By.CLASS_NAME, "title")
     CART_ICON = (By.CLASS_NAME, "shopping_cart_link")
+    CART_BADGE = (By.CLASS_NAME, "shopping_cart_badge")
     MENU_BUTTON = (By.ID, "react-burger-menu-btn")
     LOGOUT_LINK = (By.ID, "logout_sidebar_link")
     RESET_APP_LINK = (By.ID, "reset_sidebar_link")
     PRODUCT_ITEMS = (By.CLASS_NAME, "inventory_item")
     PRODUCT_NAMES = (By.CLASS_NAME, "inventory_item_name")
     PRODUCT_PRICES = (By.CLASS_NAME, "inventory_item_price")
+    PRODUCT_DESCRIPTIONS = (By.CLASS_NAME, "inventory_item_desc")
+    PRODUCT_TITLE_LINKS = (By.CSS_SELECTOR, ".inventory_item_label a[id$='_title_link']")
     ADD_TO_CART_BUTTON = (By.CLASS_NAME, "btn_inventory")
     SORT_DROPDOWN = (By.CLASS_NAME, "product_sort_container")
     MENU_CONTAINER = (By.CLASS_NAME, "bm-menu-wrap")
+
+    # localStorage key where the application keeps the cart (list of product ids)
+    CART_STORAGE_KEY = "cart-contents"
+
+    # Installs (once per document) a MutationObserver that records every change of
+    # the cart badge into window.__cartTracker.history and resolves pending
+    # wait_for_cart_count() calls; the scripts below run it before their own code.
+    # A navigation loads a new document, so the history covers the current page only.
+    _CART_TRACKER_SCRIPT = """
+        if (!window.__cartTracker) {
+            var tracker = window.__cartTracker = {history: [], waiters: [], limit: 500};
+            tracker.count = function () {
+                var link = document.querySelector(".shopping_cart_link");
+                if (!link) { return null; }
+                var badge = link.querySelector(".shopping_cart_badge");
+                return badge ? (parseInt(badge.textContent, 10) || 0) : 0;
+            };
+            tracker.record = function () {
+                var count = tracker.count();
+                var last = tracker.history[tracker.history.length - 1];
+                if (last && last.count === count) { return; }
+                tracker.history.push({count: count, ts: Date.now()});
+                if (tracker.history.length > tracker.limit) { tracker.history.shift(); }
+                tracker.waiters = tracker.waiters.filter(function (waiter) {
+                    if (waiter.target !== count) { return true; }
+                    waiter.resolve(count);
+                    return false;
+                });
+            };
+            new MutationObserver(tracker.record).observe(
+                document.documentElement, {childList: true, subtree: true, characterData: true});
+            tracker.record();
+        }
+    """
+
+    # arguments[0]: expected count, arguments[1]: timeout in ms; calls back with
+    # {count, timed_out} as soon as the badge shows the count (or on timeout)
+    _WAIT_FOR_CART_COUNT_SCRIPT = _CART_TRACKER_SCRIPT + """
+        var target = arguments[0], done = arguments[arguments.length - 1];
+        var tracker = window.__cartTracker;
+        if (tracker.count() === target) { return done({count: target, timed_out: false}); }
+        var waiter = {target: target};
+        var timer = setTimeout(function () {
+            tracker.waiters.splice(tracker.waiters.indexOf(waiter), 1);
+            done({count: tracker.count(), timed_out: true});
+        }, arguments[1]);
+        waiter.resolve = function (count) {
+            clearTimeout(timer);
+            done({count: count, timed_out: false});
+        };
+        tracker.waiters.push(waiter);
+    """
+
+    # Sets the cart state of several products in one call: clicks the add/remove
+    # button of every product not yet in the wanted state and returns the post-state.
+    # The app re-renders a product after its button is clicked, so the product is
+    # looked up again (by id or name) before its state is read back.
+    # arguments[0]: product ids or names, arguments[1]: true = in cart
+    _SET_CART_STATE_SCRIPT = _CART_TRACKER_SCRIPT + """
+        var wantedProducts = arguments[0], inCart = arguments[1];
+        function findItem(wanted) {
+            if (typeof wanted === "number") {
+                var link = document.getElementById("item_" + wanted + "_title_link");
+                return link ? link.closest(".inventory_item") : null;
+            }
+            var items = document.querySelectorAll(".inventory_item");
+            for (var i = 0; i < items.length; i++) {
+                if (items[i].querySelector(".inventory_item_name").innerText.trim() === wanted) { return items[i]; }
+            }
+            return null;
+        }
+        function isInCart(item) {
+            return item.querySelector(".btn_inventory").id.indexOf("remove-") === 0;
+        }
+        var results = [];
+        wantedProducts.forEach(function (wanted) {
+            var item = findItem(wanted);
+            if (!item) { return results.push({product: wanted, name: null, in_cart: false}); }
+            if (isInCart(item) !== inCart) {
+                item.querySelector(".btn_inventory").dispatchEvent(
+                    new MouseEvent("click", {bubbles: true, cancelable: true, view: window}));
+                window.__cartTracker.record();
+                item = findItem(wanted);
+            }
+            results.push(item ? {product: wanted, name: item.querySelector(".inventory_item_name").innerText.trim(),
+                                 in_cart: isInCart(item)}
+                              : {product: wanted, name: null, in_cart: false});
+        });
+        return {items: results, cart_count: window.__cartTracker.count()};
+    """
+
+    # Field spec for reading the catalog in one round trip (see BasePage.extract_records)
+    CATALOG_FIELDS = {
+        "id": (PRODUCT_TITLE_LINKS, BasePage.parse_product_id, "id"),
+        "name": (PRODUCT_NAMES, None),
+        "price": (PRODUCT_PRICES, BasePage.parse_price),
+        "button_id": (ADD_TO_CART_BUTTON, None, "id"),
+    }
+
+    # Product fields that do not change within a run, cached by get_catalog_snapshot
+    SNAPSHOT_FIELDS = {
+        "id": (PRODUCT_TITLE_LINKS, BasePage.parse_product_id, "id"),
+        "name": (PRODUCT_NAMES, None),
+        "price": (PRODUCT_PRICES, BasePage.parse_price),
+        "description": (PRODUCT_DESCRIPTIONS, None),
+    }
+
+    # Sort dropdown values: (field sorted on, descending), and the option labels selecting them
+    SORT_KEYS = {"az": ("name", False), "za": ("name", True), "lohi": ("price", False), "hilo": ("price", True)}
+    SORT_OPTIONS = {
+        "name (a to z)": "az",
+        "name (z to a)": "za",
+        "price (low to high)": "lohi",
+        "price (high to low)": "hilo",
+    }
+
+    # Field spec for reading the rows a sort is verified on
+    SORT_FIELDS = {
+        "id": (PRODUCT_TITLE_LINKS, BasePage.parse_product_id, "id"),
+        "name": (PRODUCT_NAMES, None),
+        "price": (PRODUCT_PRICES, BasePage.parse_price),
+    }
+
+    # Selects a sort key and, once the page has re-rendered, reads every (title link id, name, price label) row.
+    # The value is set through the native setter and a bubbling change event, like a user choice.
+    # arguments[0]: sort key
+    _SORT_AND_READ_SCRIPT = """
+        var select = document.querySelector(".product_sort_container");
+        var done = arguments[arguments.length - 1];
+        if (select.value !== arguments[0]) {
+            Object.getOwnPropertyDescriptor(HTMLSelectElement.prototype, "value").set.call(select, arguments[0]);
+            select.dispatchEvent(new Event("change", {bubbles: true}));
+        }
+        setTimeout(function () {
+            done(Array.prototype.map.call(document.querySelectorAll(".inventory_item"), function (item) {
+                return [item.querySelector(".inventory_item_label a[id$='_title_link']").id,
+                        item.querySelector(".inventory_item_name").innerText.trim(),
+                        item.querySelector(".inventory_item_price").innerText.trim()];
+            }));
+        }, 0);
+    """
+
+    # Catalog snapshots in this process by (application, logged-in user), and cache hit/miss counters
+    _catalog_cache = {}
+    catalog_cache_stats = {"hits": 0, "misses": 0}
     
     def __init__(self, driver):
         """
@@ -41,15 +207,45 @@ class ProductsPage(BasePage):
         self.logger.info(f"Cart icon visible: {visible}")
         return visible
     
+    @page_action
     def logout(self):
         """Logout using the sidebar menu"""
         self.logger.info("Attempting to log out...")
         self.click(self.MENU_BUTTON)
         self.click(self.LOGOUT_LINK)
-        self.wait_for_url_to_be("https://www.saucedemo.com/")
+        self.wait_for_url_to_be(Config.url())
+        self.driver.session_user = None
         self.logger.info("Logout successful, redirected to login page")
     
-    def reset_app_state(self):
+    @page_action
+    def reset_app_state(self, via_ui=False):
+        """
+        Reset app state by clearing the cart directly in localStorage.
+        The inventory page is then (re)loaded; once it is confirmed to be the
+        inventory (URL and product list), a single DOM read confirms the cart
+        badge is gone. Falls back to the sidebar-menu reset otherwise (e.g. the
+        session expired and the app redirected to the login page).
+        Pass via_ui=True to exercise the 'Reset App State' menu item itself.
+        """
+        if via_ui:
+            return self.reset_app_state_via_ui()
+        try:
+            self.driver.execute_script(
+                "window.localStorage.removeItem(arguments[0]);", self.CART_STORAGE_KEY
+            )
+            self.driver.get(Config.url("inventory.html"))
+            if "inventory" not in self.driver.current_url or not self.is_element_present(self.PRODUCT_ITEMS):
+                self.logger.warning(f"Inventory page not shown after storage reset (at {self.driver.current_url})")
+            elif self.is_element_absent(self.CART_BADGE):
+                self.logger.info("App state reset via storage")
+                return True
+            else:
+                self.logger.warning("Cart badge still shown after storage reset")
+        except Exception as e:
+            self.logger.warning(f"Storage reset failed: {e}")
+        return self.reset_app_state_via_ui()
+    
+    def reset_app_state_via_ui(self):
         """
         Reset app state by clicking 'Reset App State' in the sidebar menu.
         Falls back to simple reset if it fails.
@@ -57,7 +253,7 @@ class ProductsPage(BasePage):
         try:
             if "inventory" not in self.driver.current_url:
                 self.logger.warning("Not on Products page. Navigating there first...")
-                self.driver.get("https://www.saucedemo.com/inventory.html")
+                self.driver.get(Config.url("inventory.html"))
                 self.wait_for_element_to_be_present(self.PRODUCTS_TITLE)
             
             self.logger.info("Opening menu for reset...")
@@ -90,136 +286,382 @@ class ProductsPage(BasePage):
             self.logger.error(f"Simple reset failed: {e}")
             return False
     
-    def wait_for_element_to_be_present(self, locator, timeout=10):
+    @page_action
+    def wait_for_element_to_be_present(self, locator, timeout=None):
         """Wait until element is present in the DOM"""
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located(locator)
-            )
+            self.wait_until(EC.presence_of_element_located(locator), timeout, "present")
             self.logger.debug(f"Element present: {locator}")
             return True
         except TimeoutException:
-            self.logger.warning(f"Element not present within {timeout} seconds: {locator}")
+            self.logger.warning(f"Element not present within {timeout or self.waits.budget('present')} seconds: {locator}")
             return False
     
-    def wait_for_element_to_be_visible(self, locator, timeout=10):
+    def wait_for_element_to_be_visible(self, locator, timeout=None):
         """Wait until element is visible on the page"""
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(locator)
-            )
+            self.wait_until(EC.visibility_of_element_located(locator), timeout, "visible")
             self.logger.debug(f"Element visible: {locator}")
             return True
         except TimeoutException:
-            self.logger.warning(f"Element not visible within {timeout} seconds: {locator}")
+            self.logger.warning(f"Element not visible within {timeout or self.waits.budget('visible')} seconds: {locator}")
             return False
     
-    def wait_for_element_to_be_not_visible(self, locator, timeout=10):
+    def wait_for_element_to_be_not_visible(self, locator, timeout=None):
         """Wait until element is no longer visible"""
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.invisibility_of_element_located(locator)
-            )
+            self.wait_until(EC.invisibility_of_element_located(locator), timeout, "invisible")
             self.logger.debug(f"Element no longer visible: {locator}")
             return True
         except TimeoutException:
-            self.logger.warning(f"Element still visible after {timeout} seconds: {locator}")
+            self.logger.warning(f"Element still visible after {timeout or self.waits.budget('invisible')} seconds: {locator}")
             return False
     
-    def wait_for_cart_to_be_empty(self, timeout=10):
+    def wait_for_cart_to_be_empty(self, timeout=None):
         """Wait until the cart is empty (count = 0)"""
-        try:
-            WebDriverWait(self.driver, timeout).until(
-                lambda driver: self.get_cart_count() == 0
-            )
+        if self.wait_for_cart_count(0, timeout):
             self.logger.info("Cart is now empty")
             return True
-        except TimeoutException:
-            self.logger.warning("Cart did not reset to empty within timeout")
-            return False
+        self.logger.warning("Cart did not reset to empty within timeout")
+        return False
     
     def get_products_count(self):
-        """Return the total number of products on the page"""
-        count = len(self.find_elements(self.PRODUCT_ITEMS))
+        """Return the total number of products in the catalog"""
+        count = len(self.get_catalog_snapshot()['products'])
         self.logger.info(f"Total products found: {count}")
         return count
-    
+
+    def catalog_key(self):
+        """
+        Return the catalog cache key: (application base URL, logged-in user).
+        The key is known on the Python side (see LoginPage.login), so a cache hit
+        costs no round trip and survives navigation and sorting; it is None while
+        no user is known to be logged in on this driver, which bypasses the cache.
+        """
+        user = getattr(self.driver, "session_user", None)
+        return (Config.BASE_URL, user) if user else None
+
+    @page_action
+    def get_catalog_snapshot(self):
+        """
+        Return the catalog, read from the page once per application and user.
+        The snapshot does not depend on the displayed order or on the loaded
+        document, so it is reused across page loads, sorting and browsers.
+
+        Returns:
+            dict: "products": tuple of product dicts (id, name, price, description)
+            in name order; "orders": for each SORT_KEYS value, the expected product
+            ids as a tuple of tie groups (products with equal sort values share a group).
+            The snapshot is shared between calls and must not be modified.
+        """
+        key = self.catalog_key()
+        snapshot = self._catalog_cache.get(key) if key else None
+        if snapshot is not None:
+            self.catalog_cache_stats["hits"] += 1
+            return snapshot
+
+        self.catalog_cache_stats["misses"] += 1
+        records = self.extract_records(self.PRODUCT_ITEMS, self.SNAPSHOT_FIELDS)
+        products = tuple(sorted(records, key=lambda product: product['name']))
+        snapshot = {
+            "products": products,
+            "orders": {sort_key: self.expected_order(products, sort_key) for sort_key in self.SORT_KEYS},
+        }
+        if key:
+            self._catalog_cache[key] = snapshot
+            self.logger.debug(f"Catalog cached for {key}: {len(products)} products")
+        return snapshot
+
+    @classmethod
+    def expected_order(cls, products, sort_key):
+        """Product ids ordered by a sort key, grouped into tuples of ties"""
+        field, descending = cls.SORT_KEYS[sort_key]
+        groups = []
+        for product in sorted(products, key=lambda product: product[field], reverse=descending):
+            if groups and groups[-1][0] == product[field]:
+                groups[-1][1].append(product['id'])
+            else:
+                groups.append((product[field], [product['id']]))
+        return tuple(tuple(ids) for _, ids in groups)
+
+    @classmethod
+    def invalidate_catalog_cache(cls):
+        """Drop every cached catalog snapshot (e.g. after the catalog itself changed)"""
+        cls._catalog_cache.clear()
+
+    @page_action
+    def get_catalog(self):
+        """Return every product on the page as a dict of name and price"""
+        return self.extract_records(self.PRODUCT_ITEMS, self.CATALOG_FIELDS)
+
     def get_all_product_names(self):
-        """Return a list of all product names"""
-        elements = self.find_elements(self.PRODUCT_NAMES)
-        names = [element.text for element in elements]
-        self.logger.info(f"Product names: {names}")
+        """Return a list of all product names, in the order the page displays them"""
+        names = [product['name'] for product in self.get_catalog()]
+        self.logger.debug(f"Product names: {names}")
         return names
     
     def get_all_product_prices(self):
-        """Return a list of all product prices as floats"""
-        elements = self.find_elements(self.PRODUCT_PRICES)
-        prices = [float(element.text.replace('$', '')) for element in elements]
-        self.logger.info(f"Product prices: {prices}")
+        """Return a list of all product prices as floats, in the order the page displays them"""
+        prices = [product['price'] for product in self.get_catalog()]
+        self.logger.debug(f"Product prices: {prices}")
         return prices
+
+    def get_snapshot_product_names(self):
+        """Return all product names from the cached catalog snapshot (name order, not display order)"""
+        return [product['name'] for product in self.get_catalog_snapshot()['products']]
+
+    def get_snapshot_product_prices(self):
+        """Return all product prices from the cached catalog snapshot (name order, not display order)"""
+        return [product['price'] for product in self.get_catalog_snapshot()['products']]
     
-    def select_random_products(self, count=4):
+    def select_random_products(self, count=4, seed=None):
         """
         Randomly select 'count' number of products.
-        Returns a list of dicts with product details.
+        The selection happens in memory on the cached catalog snapshot, so the
+        same seed (argument or Config.RANDOM_SEED) reproduces the same basket.
+        Returns a list of dicts with product id, name and price; products are
+        identified by id only, never by a position in the snapshot or on the page.
         """
-        products = self.find_elements(self.PRODUCT_ITEMS)
-        if len(products) == 0:
+        catalog = self.get_catalog_snapshot()['products']
+        if len(catalog) == 0:
             self.logger.warning("No products found on the page")
             return []
-            
-        selected_indices = random.sample(range(len(products)), min(count, len(products)))
-        selected_products = []
-        
-        for idx in selected_indices:
-            name = self.find_elements(self.PRODUCT_NAMES)[idx].text
-            price = float(self.find_elements(self.PRODUCT_PRICES)[idx].text.replace('$', ''))
-            selected_products.append({
-                'name': name,
-                'price': price,
-                'element': products[idx],
-                'index': idx
-            })
+
+        rng = random.Random(seed if seed is not None else Config.RANDOM_SEED)
+        selected_indices = rng.sample(range(len(catalog)), min(count, len(catalog)))
+        selected_products = [
+            {
+                'id': catalog[idx]['id'],
+                'name': catalog[idx]['name'],
+                'price': catalog[idx]['price'],
+            }
+            for idx in selected_indices
+        ]
         
         self.logger.info(f"Selected random products: {selected_products}")
         return selected_products
     
+    @page_action
     def add_products_to_cart(self, products):
-        """Add given list of product dicts to cart"""
-        for product in products:
-            add_button = product['element'].find_element(*self.ADD_TO_CART_BUTTON)
-            add_button.click()
-            self.logger.info(f"Added to cart: {product['name']} (${product['price']})")
+        """
+        Add products to the cart in one batch.
+        'products' may hold product dicts (from select_random_products), product ids or names.
+        Returns the confirmed post-state (see set_cart_state).
+        """
+        state = self.set_cart_state(products, in_cart=True)
+        self.logger.info(f"Added to cart: {[item['name'] for item in state['items'] if item['in_cart']]}")
+        return state
+
+    @page_action
+    def remove_products_from_cart(self, products):
+        """Remove products (dicts, product ids or names) from the cart in one batch"""
+        state = self.set_cart_state(products, in_cart=False)
+        self.logger.info(f"Removed from cart: {[item['name'] for item in state['items'] if not item['in_cart']]}")
+        return state
+
+    def set_cart_state(self, products, in_cart=True):
+        """
+        Put every given product into (or out of) the cart.
+        Products are product dicts (matched by 'id'), product ids (int) or names.
+        All clicks are dispatched by a single script (per-element WebDriver
+        clicks when Config.NATIVE_CLICKS is set); products already in the
+        wanted state are left alone.
+
+        Returns:
+            dict: {"items": [{"product", "name", "in_cart"}, ...], "cart_count": int},
+            read back from the page after the clicks. Products the app refused
+            (or that were not found) keep in_cart != the requested state.
+        """
+        wanted = [product['id'] if isinstance(product, dict) else product for product in products]
+        if Config.NATIVE_CLICKS:
+            state = self._set_cart_state_natively(wanted, in_cart)
+        else:
+            state = self.driver.execute_script(self._SET_CART_STATE_SCRIPT, wanted, in_cart)
+        failed = [item['product'] for item in state['items'] if item['in_cart'] != in_cart]
+        if failed:
+            self.logger.warning(f"Cart state not applied for: {failed}")
+        self.logger.debug(f"Cart count: {state['cart_count']}")
+        return state
+
+    def _set_cart_state_natively(self, wanted, in_cart):
+        """Fallback for set_cart_state: one native WebDriver click per product"""
+        self.track_cart()
+        catalog = self.get_catalog()
+        by_key = {}
+        for index, product in enumerate(catalog):
+            by_key[product['id']] = by_key[product['name']] = index
+        indices = [by_key.get(product) for product in wanted]
+        for index in indices:
+            if index is not None and catalog[index]['button_id'].startswith("remove-") != in_cart:
+                self.click((By.ID, catalog[index]['button_id']))
+        catalog = self.get_catalog()
+        items = [
+            {"product": product, "name": catalog[index]['name'], "in_cart": catalog[index]['button_id'].startswith("remove-")}
+            if index is not None else {"product": product, "name": None, "in_cart": False}
+            for product, index in zip(wanted, indices)
+        ]
+        return {"items": items, "cart_count": self.get_cart_count()}
     
+    def track_cart(self):
+        """Start recording cart badge changes on the current page (no-op if already recording)"""
+        self.driver.execute_script(self._CART_TRACKER_SCRIPT)
+
     def get_cart_count(self):
-        """Get the number of items in the cart"""
-        if self.is_element_present(self.CART_ICON):
-            cart_text = self.get_text(self.CART_ICON)
-            count = int(cart_text) if cart_text else 0
-            self.logger.info(f"Cart count: {count}")
-            return count
-        self.logger.warning("Cart icon not present")
-        return 0
+        """
+        Get the number of items in the cart.
+        One script call reads the badge (and starts cart tracking on this page).
+        """
+        count = self.driver.execute_script(self._CART_TRACKER_SCRIPT + "return window.__cartTracker.count();")
+        if count is None:
+            self.logger.warning("Cart icon not present")
+            return 0
+        self.logger.debug(f"Cart count: {count}")
+        return count
+
+    @page_action
+    def wait_for_cart_count(self, count, timeout=None):
+        """
+        Wait until the cart badge shows 'count' items (0 = no badge).
+        A single asynchronous script waits in the page for the badge change
+        reported by the cart tracker, instead of polling from Python.
+        """
+        timeout = timeout or self.waits.budget("default")
+        try:
+            result = self.driver.execute_async_script(
+                self._WAIT_FOR_CART_COUNT_SCRIPT, count, int(timeout * 1000)
+            )
+        except WebDriverException as e:
+            # e.g. the page navigated while waiting: fall back to polling the new page
+            self.logger.debug(f"Cart tracker wait interrupted ({type(e).__name__}), polling instead")
+            try:
+                self.wait_until(lambda driver: self.get_cart_count() == count, timeout)
+                return True
+            except TimeoutException:
+                result = {"count": self.get_cart_count(), "timed_out": True}
+        if result["timed_out"]:
+            self.logger.warning(f"Cart count is {result['count']}, expected {count} within {timeout} seconds")
+            return False
+        self.logger.debug(f"Cart count reached {count}")
+        return True
+
+    def get_cart_history(self):
+        """
+        Return every cart count recorded on the current page, oldest first,
+        as a list of {"count": int, "ts": epoch ms} dicts (one round trip).
+        """
+        return self.driver.execute_script(self._CART_TRACKER_SCRIPT + "return window.__cartTracker.history;")
     
+    @page_action
     def go_to_cart(self):
         """Navigate to the shopping cart page"""
         self.logger.info("Navigating to Cart page...")
         self.click(self.CART_ICON)
         self.wait_for_url_to_contain("cart")
     
+    @classmethod
+    def sort_key_for(cls, option):
+        """Return the sort key ("az", "za", "lohi", "hilo") of an option label or key"""
+        option = option.lower()
+        if option in cls.SORT_KEYS:
+            return option
+        if option not in cls.SORT_OPTIONS:
+            raise ValueError(f"Unknown sort option: {option}. Choose from {sorted(cls.SORT_OPTIONS)}")
+        return cls.SORT_OPTIONS[option]
+
+    @page_action
     def select_sort_option(self, option):
-        """Select a sorting option from the dropdown"""
+        """Select a sorting option (label such as "Name (Z to A)" or key such as "za") from the dropdown"""
         from selenium.webdriver.support.ui import Select
         dropdown = self.find_element(self.SORT_DROPDOWN)
-        select = Select(dropdown)
-        
-        if option.lower() == "name (a to z)":
-            select.select_by_value("az")
-        elif option.lower() == "name (z to a)":
-            select.select_by_value("za")
-        elif option.lower() == "price (low to high)":
-            select.select_by_value("lohi")
-        elif option.lower() == "price (high to low)":
-            select.select_by_value("hilo")
-        
+        Select(dropdown).select_by_value(self.sort_key_for(option))
         self.logger.info(f"Sort option selected: {option}")
+
+    @page_action
+    def verify_sort(self, option, stable=False, collation=False, by_id=False):
+        """
+        Select a sort option and check the page shows the products in that order.
+
+        The option is selected and all (id, name, price) rows are read in one script
+        call (dropdown + separate read when Config.NATIVE_CLICKS is set); the
+        order is then checked in a single pass over the rows.
+
+        Args:
+            option: Option label ("Price (low to high)") or sort key ("lohi").
+            stable (bool): Also require products with equal sort values to stay
+                in name order (as a stable sort of the default listing keeps them);
+                by default ties may appear in any order.
+            collation (bool): Compare names with collation_key (case and accents
+                ignored first); by default names compare by code point, like the
+                application sorts them.
+            by_id (bool): Check only the displayed product ids against the expected
+                order of the cached catalog snapshot (see expected_order), so names
+                and prices shown on the page are not compared at all.
+
+        Returns:
+            dict: "sort_key", "ok", "rows" (list of (name, price)), "ids" and "violations",
+            a list of {"index", "previous", "current"} for rows out of order
+            ({"index", "expected", "actual"} ids with by_id).
+        """
+        sort_key = self.sort_key_for(option)
+        if Config.NATIVE_CLICKS:
+            self.select_sort_option(sort_key)
+            records = [(row['id'], row['name'], row['price'])
+                       for row in self.extract_records(self.PRODUCT_ITEMS, self.SORT_FIELDS)]
+        else:
+            records = [(self.parse_product_id(link_id), name, self.parse_price(price))
+                       for link_id, name, price in self.driver.execute_async_script(self._SORT_AND_READ_SCRIPT, sort_key)]
+        ids = [product_id for product_id, _, _ in records]
+        rows = [(name, price) for _, name, price in records]
+
+        if by_id:
+            violations = self.id_order_violations(ids, self.get_catalog_snapshot()['orders'][sort_key])
+        else:
+            violations = self.sort_violations(rows, sort_key, stable, collation)
+
+        if violations:
+            self.logger.warning(f"Products not sorted by '{sort_key}': {violations}")
+        else:
+            self.logger.info(f"Verified products sorted by '{sort_key}'")
+        return {"sort_key": sort_key, "ok": not violations, "rows": rows, "ids": ids, "violations": violations}
+
+    @classmethod
+    def sort_violations(cls, rows, sort_key, stable=False, collation=False):
+        """
+        Return the (name, price) rows out of order for a sort key (see verify_sort),
+        as a list of {"index", "previous", "current"}.
+        """
+        field, descending = cls.SORT_KEYS[sort_key]
+        names = [collation_key(name) if collation else name for name, _ in rows]
+        values = names if field == "name" else [price for _, price in rows]
+
+        violations = []
+        for index in range(1, len(rows)):
+            previous, current = values[index - 1], values[index]
+            if previous == current:
+                in_order = not stable or names[index - 1] <= names[index]
+            else:
+                in_order = (current < previous) == descending
+            if not in_order:
+                violations.append({"index": index, "previous": rows[index - 1], "current": rows[index]})
+        return violations
+
+    @staticmethod
+    def id_order_violations(ids, order):
+        """
+        Return the positions where displayed product ids leave the expected order,
+        a tuple of tie groups from expected_order (ids within a group may appear in
+        any order), as a list of {"index", "expected", "actual"}.
+        A missing product is reported with actual None, an extra or repeated one with expected ().
+        """
+        expected = [group for group in order for _ in group]
+        seen = set()
+        violations = []
+        for index in range(max(len(ids), len(expected))):
+            group = expected[index] if index < len(expected) else ()
+            actual = ids[index] if index < len(ids) else None
+            if actual in seen:
+                group = ()
+            if actual not in group:
+                violations.append({"index": index, "expected": group, "actual": actual})
+            seen.add(actual)
+        return violations
@@ -0,0 +1,66 @@
+import pytest
+import logging
+from pages.cart_page import CartPage
+from utils.command_counter import CommandCounter
+
+# Configure logger for this benchmark module
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.benchmark
+class TestDomExtractionBenchmark:
+    def test_catalog_read_command_count(self, standard_user, record_property):
+        """
+        Benchmark: WebDriver commands needed to read the product catalog
+        - Before: find_elements + one .text call per element, per field
+        - After: one execute_script call via BasePage.extract_records
+        """
+        logger.info("===== Starting Benchmark: Catalog Read Command Count =====")
+        products_page = standard_user
+
+        # Legacy access pattern, reproduced inline for comparison
+        with CommandCounter(products_page.driver) as before:
+            names = [element.text for element in products_page.find_elements(products_page.PRODUCT_NAMES)]
+            prices = [float(element.text.replace('$', ''))
+                      for element in products_page.find_elements(products_page.PRODUCT_PRICES)]
+
+        with CommandCounter(products_page.driver) as after:
+            catalog = products_page.get_catalog()
+
+        assert [product['name'] for product in catalog] == names, "Batched names differ from per-element reads"
+        assert [product['price'] for product in catalog] == prices, "Batched prices differ from per-element reads"
+
+        logger.info(f"Catalog read of {len(catalog)} products: {before.total} commands before, {after.total} after")
+        record_property("catalog_commands_before", before.total)
+        record_property("catalog_commands_after", after.total)
+        assert after.total < before.total, "Batched extraction should issue fewer WebDriver commands"
+
+        logger.info("===== Benchmark Completed: Catalog Read Command Count =====")
+
+    def test_cart_read_command_count(self, standard_user, record_property):
+        """
+        Benchmark: WebDriver commands needed to read cart names and prices
+        """
+        logger.info("===== Starting Benchmark: Cart Read Command Count =====")
+        products_page = standard_user
+        products_page.add_products_to_cart(products_page.select_random_products(3))
+        products_page.go_to_cart()
+        cart_page = CartPage(products_page.driver)
+
+        with CommandCounter(cart_page.driver) as before:
+            names = [element.text for element in cart_page.find_elements(cart_page.ITEM_NAMES)]
+            prices = [float(element.text.replace('$', ''))
+                      for element in cart_page.find_elements(cart_page.ITEM_PRICES)]
+
+        with CommandCounter(cart_page.driver) as after:
+            records = cart_page.get_item_records()
+
+        assert [item['name'] for item in records] == names, "Batched cart names differ from per-element reads"
+        assert [item['price'] for item in records] == prices, "Batched cart prices differ from per-element reads"
+
+        logger.info(f"Cart read of {len(records)} items: {before.total} commands before, {after.total} after")
+        record_property("cart_commands_before", before.total)
+        record_property("cart_commands_after", after.total)
+        assert after.total < before.total, "Batched extraction should issue fewer WebDriver commands"
+
+        logger.info("===== Benchmark Completed: Cart Read Command Count =====")
@@ -0,0 +1,73 @@
+import io
+import logging
+import queue
+import time
+import pytest
+from logging.handlers import QueueListener, RotatingFileHandler
+from utils.logger import DroppingQueueHandler, build_handlers
+
+# Configure logger for this benchmark module
+logger = logging.getLogger(__name__)
+
+# Log calls timed per setup
+CALLS = 5000
+
+
+def time_log_calls(bench_logger):
+    """Return the mean cost (microseconds) of one INFO call on the calling thread."""
+    start = time.perf_counter()
+    for i in range(CALLS):
+        bench_logger.info(f"Added to cart: product {i} ($29.99)")
+    return (time.perf_counter() - start) / CALLS * 1_000_000
+
+
+def isolated_logger(name, *handlers):
+    """Logger detached from the root, so the benchmark does not touch the suite's logging."""
+    bench_logger = logging.getLogger(name)
+    bench_logger.handlers = list(handlers)
+    bench_logger.setLevel(logging.INFO)
+    bench_logger.propagate = False
+    return bench_logger
+
+
+@pytest.mark.benchmark
+class TestLoggingBenchmark:
+    def test_per_call_overhead(self, tmp_path, record_property):
+        """
+        Benchmark: time a test thread spends in one logger.info call
+        - Before: synchronous StreamHandler + RotatingFileHandler on the calling thread
+        - After: bounded queue; formatting and batched file writes on the listener thread
+        """
+        logger.info("===== Starting Benchmark: Logging Per-Call Overhead =====")
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s')
+
+        # Legacy setup, reproduced inline for comparison
+        console_handler = logging.StreamHandler(io.StringIO())
+        console_handler.setFormatter(formatter)
+        file_handler = RotatingFileHandler(tmp_path / "sync.log", maxBytes=10*1024*1024, backupCount=7, encoding='utf-8')
+        file_handler.setFormatter(formatter)
+        before_us = time_log_calls(isolated_logger("benchmark.sync", console_handler, file_handler))
+        file_handler.close()
+
+        queue_handler = DroppingQueueHandler(queue.Queue(maxsize=CALLS * 2))
+        listener = QueueListener(
+            queue_handler.queue,
+            *build_handlers(tmp_path / "queued.log", stream=io.StringIO()),
+            respect_handler_level=True
+        )
+        listener.start()
+        after_us = time_log_calls(isolated_logger("benchmark.queued", queue_handler))
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+        written = sum(1 for _ in open(tmp_path / "queued.log", encoding="utf-8"))
+        assert written == CALLS, f"Queued logging wrote {written} of {CALLS} records"
+        assert queue_handler.dropped == 0, "No records should be dropped below queue capacity"
+
+        logger.info(f"logger.info overhead: {before_us:.1f} us before, {after_us:.1f} us after")
+        record_property("log_call_us_before", round(before_us, 2))
+        record_property("log_call_us_after", round(after_us, 2))
+        assert after_us < before_us, "Queued logging should cost the test thread less per call"
+
+        logger.info("===== Benchmark Completed: Logging Per-Call Overhead =====")
@@ -0,0 +1,170 @@
+import pytest
+import logging
+from selenium.webdriver.common.by import By
+from config.config import Config
+from pages.login_page import LoginPage
+from pages.products_page import ProductsPage
+from pages.cart_page import CartPage
+from pages.checkout_flow import CheckoutFlow
+from pages.checkout_page import CheckoutPage
+from pages.order_complete_page import OrderCompletePage
+from utils.benchmark import measure
+from utils.data_reader import get_checkout_info
+
+# Configure logger for this benchmark module
+logger = logging.getLogger(__name__)
+
+# Timings are only comparable against the bundled stand-in app (no network latency)
+pytestmark = pytest.mark.skipif(
+    Config.APP_TARGET != "local",
+    reason="page-object benchmarks run only against the local app (APP_TARGET=local)"
+)
+
+
+def check_against_baseline(benchmark_history, record_property, result):
+    """Record a benchmark result and fail if it regressed past the threshold."""
+    benchmark_history.add(result)
+    for metric in ("p50_ms", "p95_ms", "p99_ms", "commands"):
+        record_property(f"{result['name']}_{metric}", result[metric])
+    regressions = benchmark_history.compare(result)
+    assert not regressions, "Benchmark regression:\n" + "\n".join(regressions)
+
+
+@pytest.mark.benchmark
+class TestPageObjectBenchmark:
+    def test_login(self, driver, benchmark_history, record_property):
+        """
+        Benchmark: LoginPage.login up to the loaded inventory page
+        """
+        logger.info("===== Starting Benchmark: Login =====")
+        pages = {}
+
+        def open_login_page():
+            driver.delete_all_cookies()
+            pages["login"] = LoginPage(driver)
+
+        def login():
+            pages["login"].login("standard_user", "secret_sauce")
+            ProductsPage(driver).wait_for_element_to_be_present(ProductsPage.PRODUCTS_TITLE)
+
+        result = measure("login", driver, login, setup=open_login_page)
+        check_against_baseline(benchmark_history, record_property, result)
+        logger.info("===== Benchmark Completed: Login =====")
+
+    def test_get_all_product_names(self, standard_user, benchmark_history, record_property):
+        """
+        Benchmark: ProductsPage.get_all_product_names (a live read of the displayed list, never cached)
+        """
+        logger.info("===== Starting Benchmark: Get All Product Names =====")
+        products_page = standard_user
+
+        result = measure("get_all_product_names", products_page.driver, products_page.get_all_product_names)
+        check_against_baseline(benchmark_history, record_property, result)
+        logger.info("===== Benchmark Completed: Get All Product Names =====")
+
+    def test_get_catalog_snapshot_uncached(self, standard_user, benchmark_history, record_property):
+        """
+        Benchmark: ProductsPage.get_catalog_snapshot with an empty catalog cache,
+        i.e. the full extraction every cache miss pays
+        """
+        logger.info("===== Starting Benchmark: Catalog Snapshot (uncached) =====")
+        products_page = standard_user
+
+        result = measure("catalog_snapshot_uncached", products_page.driver, products_page.get_catalog_snapshot,
+                         setup=ProductsPage.invalidate_catalog_cache)
+        check_against_baseline(benchmark_history, record_property, result)
+        logger.info("===== Benchmark Completed: Catalog Snapshot (uncached) =====")
+
+    def test_select_random_products(self, standard_user, benchmark_history, record_property):
+        """
+        Benchmark: ProductsPage.select_random_products(4)
+        """
+        logger.info("===== Starting Benchmark: Select Random Products =====")
+        products_page = standard_user
+
+        result = measure("select_random_products", products_page.driver,
+                         lambda: products_page.select_random_products(4))
+        check_against_baseline(benchmark_history, record_property, result)
+        logger.info("===== Benchmark Completed: Select Random Products =====")
+
+    def test_add_products_to_cart(self, standard_user, selected_products, benchmark_history, record_property):
+        """
+        Benchmark: ProductsPage.add_products_to_cart for 4 products, from an empty cart
+        """
+        logger.info("===== Starting Benchmark: Add Products To Cart =====")
+        products_page = standard_user
+
+        result = measure("add_products_to_cart", products_page.driver,
+                         lambda: products_page.add_products_to_cart(selected_products),
+                         setup=products_page.reset_app_state)
+        check_against_baseline(benchmark_history, record_property, result)
+        logger.info("===== Benchmark Completed: Add Products To Cart =====")
+
+    def test_get_item_prices(self, standard_user, cart_with_products, benchmark_history, record_property):
+        """
+        Benchmark: CartPage.get_item_prices with 4 items in the cart
+        """
+        logger.info("===== Starting Benchmark: Get Cart Item Prices =====")
+        standard_user.go_to_cart()
+        cart_page = CartPage(standard_user.driver)
+
+        result = measure("cart_get_item_prices", cart_page.driver, cart_page.get_item_prices)
+        assert len(cart_page.get_item_prices()) == len(cart_with_products), "Cart does not hold the added products"
+        check_against_baseline(benchmark_history, record_property, result)
+        logger.info("===== Benchmark Completed: Get Cart Item Prices =====")
+
+    def test_checkout_flow(self, standard_user, selected_products, benchmark_history, record_property):
+        """
+        Benchmark: full checkout of test_08, from the inventory page with a
+        filled cart to the order confirmation
+        """
+        logger.info("===== Starting Benchmark: Checkout Flow =====")
+        products_page = standard_user
+        driver = products_page.driver
+        checkout_info = get_checkout_info()
+
+        def fill_cart():
+            products_page.reset_app_state()
+            products_page.add_products_to_cart(selected_products)
+            products_page.wait_for_cart_count(len(selected_products))
+
+        def checkout():
+            products_page.go_to_cart()
+            CartPage(driver).proceed_to_checkout()
+            checkout_page = CheckoutPage(driver)
+            checkout_page.fill_checkout_info(
+                checkout_info.first_name,
+                checkout_info.last_name,
+                checkout_info.postal_code
+            )
+            checkout_page.continue_to_overview()
+            checkout_page.click((By.ID, "finish"))
+            header = OrderCompletePage(driver).get_complete_header()
+            assert "Thank you for your order!" in header, "Order confirmation message not found!"
+
+        result = measure("checkout_flow", driver, checkout, setup=fill_cart)
+        check_against_baseline(benchmark_history, record_property, result)
+        logger.info("===== Benchmark Completed: Checkout Flow =====")
+
+    def test_checkout_flow_fused(self, standard_user, selected_products, benchmark_history, record_property):
+        """
+        Benchmark: the same checkout through CheckoutFlow (fused form filling,
+        one-call overview read and total checks)
+        """
+        logger.info("===== Starting Benchmark: Fused Checkout Flow =====")
+        products_page = standard_user
+        checkout_info = get_checkout_info()
+
+        def fill_cart():
+            products_page.reset_app_state()
+            products_page.add_products_to_cart(selected_products)
+            products_page.wait_for_cart_count(len(selected_products))
+
+        def checkout():
+            result = CheckoutFlow(products_page.driver).run(checkout_info)
+            assert not result["mismatches"], f"Checkout overview mismatches: {result['mismatches']}"
+
+        result = measure("checkout_flow_fused", products_page.driver, checkout, setup=fill_cart)
+        check_against_baseline(benchmark_history, record_property, result)
+        logger.info("===== Benchmark Completed: Fused Checkout Flow =====")
+
@@ -0,0 +1,61 @@
+import pytest
+import logging
+import statistics
+import time
+from pages.login_page import LoginPage
+from pages.products_page import ProductsPage
+from utils.session_cache import SessionCache
+
+# Configure logger for this benchmark module
+logger = logging.getLogger(__name__)
+
+# Number of timed setups per mode
+ITERATIONS = 5
+
+
+@pytest.mark.benchmark
+class TestSessionBootstrapBenchmark:
+    def test_setup_latency_with_and_without_bootstrap(self, driver, record_property):
+        """
+        Benchmark: per-test setup latency of the standard_user fixture
+        - UI mode: open login page, type credentials, click login
+        - Bootstrap mode: seed cached cookies/localStorage and open inventory.html
+        """
+        logger.info("===== Starting Benchmark: Session Bootstrap =====")
+        cache = SessionCache()
+
+        def ui_login():
+            login_page = LoginPage(driver)
+            login_page.login("standard_user", "secret_sauce")
+            products_page = ProductsPage(driver)
+            products_page.wait_for_element_to_be_present(products_page.PRODUCTS_TITLE)
+            return products_page
+
+        def bootstrap_login():
+            cache.restore(driver, "standard_user")
+            products_page = ProductsPage(driver)
+            products_page.wait_for_element_to_be_present(products_page.PRODUCTS_TITLE)
+            return products_page
+
+        # Warm-up login doubles as the one-off capture for bootstrap mode
+        ui_login()
+        cache.capture(driver, "standard_user")
+
+        timings = {}
+        for mode, setup in (("ui", ui_login), ("bootstrap", bootstrap_login)):
+            samples = []
+            for _ in range(ITERATIONS):
+                driver.delete_all_cookies()
+                start = time.perf_counter()
+                products_page = setup()
+                samples.append(time.perf_counter() - start)
+                assert "Products" in products_page.get_title(), f"{mode} setup did not reach the Products page"
+            timings[mode] = statistics.median(samples)
+            logger.info(f"{mode} setup median: {timings[mode] * 1000:.1f} ms over {ITERATIONS} runs")
+            record_property(f"{mode}_setup_median_ms", round(timings[mode] * 1000, 1))
+
+        speedup = timings["ui"] / timings["bootstrap"]
+        logger.info(f"Session bootstrap speedup: {speedup:.2f}x")
+        record_property("bootstrap_speedup", round(speedup, 2))
+
+        logger.info("===== Benchmark Completed: Session Bootstrap =====")
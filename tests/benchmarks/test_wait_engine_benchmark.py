@@ -0,0 +1,96 @@
+import pytest
+import logging
+import os
+import subprocess
+import sys
+import time
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+from config.config import Config
+from pages.login_page import LoginPage
+
+# Configure logger for this benchmark module
+logger = logging.getLogger(__name__)
+
+# Implicit wait the suite used before the wait engine took over all waiting
+LEGACY_IMPLICIT_WAIT = 10
+
+# Environment reproducing the legacy waiting: 10s implicit wait and WebDriverWait's fixed 0.5s polling
+LEGACY_WAIT_ENV = {"IMPLICIT_WAIT": str(LEGACY_IMPLICIT_WAIT), "WAIT_POLL_INTERVAL": "0.5"}
+
+# Functional suite timed by the wall-clock benchmark (benchmarks and unit tests excluded)
+SUITE_ARGS = ["tests", "--ignore=tests/benchmarks", "--ignore=tests/unit", "-q", "-p", "no:cacheprovider"]
+
+
+@pytest.mark.benchmark
+class TestWaitEngineBenchmark:
+    def test_negative_check_latency(self, driver, standard_user, record_property):
+        """
+        Benchmark: cost of an absence check on the Products page
+        - Before: implicit wait of 10s mixed with a 5s WebDriverWait
+        - After: zero implicit wait and the wait engine's fast negative path
+        """
+        logger.info("===== Starting Benchmark: Negative Check Latency =====")
+        products_page = standard_user
+
+        # Legacy behaviour, reproduced inline for comparison; the pool does not reset
+        # timeouts when the browser is returned, so the configured wait is restored here
+        driver.implicitly_wait(LEGACY_IMPLICIT_WAIT)
+        try:
+            start = time.perf_counter()
+            try:
+                WebDriverWait(driver, 5).until(EC.visibility_of_element_located(LoginPage.ERROR_MESSAGE))
+            except TimeoutException:
+                pass
+            before = time.perf_counter() - start
+        finally:
+            driver.implicitly_wait(Config.IMPLICIT_WAIT)
+
+        start = time.perf_counter()
+        absent = products_page.is_element_absent(LoginPage.ERROR_MESSAGE)
+        after = time.perf_counter() - start
+        assert absent, "Login error should not be shown on the Products page"
+
+        start = time.perf_counter()
+        present = products_page.is_element_present(LoginPage.ERROR_MESSAGE)
+        bounded = time.perf_counter() - start
+        assert not present, "Login error should not be shown on the Products page"
+
+        logger.info(f"Negative check: {before:.2f}s before, {after:.3f}s fast path, {bounded:.2f}s with probe budget")
+        record_property("negative_check_before_s", round(before, 3))
+        record_property("negative_check_fast_path_s", round(after, 3))
+        record_property("negative_check_probe_budget_s", round(bounded, 3))
+        assert after < before, "Fast negative path should beat the implicit/explicit wait mix"
+
+        logger.info("===== Benchmark Completed: Negative Check Latency =====")
+
+    def test_suite_wall_clock(self, record_property):
+        """
+        Benchmark: wall-clock time of the functional suite against the local stand-in app
+        - Before: legacy waiting (10s implicit wait, fixed 0.5s polling) via LEGACY_WAIT_ENV
+        - After: the wait engine's defaults (zero implicit wait, adaptive polling)
+        - Each mode runs the suite once in a separate pytest process with APP_TARGET=local,
+          so network latency does not blur the difference
+        """
+        logger.info("===== Starting Benchmark: Suite Wall Clock =====")
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        base_env = {name: value for name, value in os.environ.items()
+                    if name not in LEGACY_WAIT_ENV and not name.startswith("PYTEST_")}
+        base_env["APP_TARGET"] = "local"
+
+        timings = {}
+        for mode, extra_env in (("before", LEGACY_WAIT_ENV), ("after", {})):
+            start = time.perf_counter()
+            result = subprocess.run([sys.executable, "-m", "pytest", *SUITE_ARGS], cwd=root,
+                                    env=dict(base_env, **extra_env), capture_output=True, text=True)
+            timings[mode] = time.perf_counter() - start
+            summary = result.stdout.strip().splitlines()[-1] if result.stdout.strip() else ""
+            logger.info(f"Suite {mode}: {timings[mode]:.1f}s ({summary})")
+            record_property(f"suite_wall_clock_{mode}_s", round(timings[mode], 1))
+            assert result.returncode in (0, 1), f"Suite run ({mode}) did not complete:\n{result.stdout[-2000:]}"
+
+        logger.info(f"Suite wall clock: {timings['before']:.1f}s before, {timings['after']:.1f}s after")
+        assert timings["after"] < timings["before"], "The wait engine should shorten the suite's wall clock"
+
+        logger.info("===== Benchmark Completed: Suite Wall Clock =====")
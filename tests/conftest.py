@@ -1,124 +1,369 @@
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from selenium.webdriver.edge.service import Service as EdgeService
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
 from config.config import Config
 from pages.login_page import LoginPage
+from local_app.server import LocalApp
+from utils import driver_factory
+from utils.artifacts import close_pipeline, handles_for, set_current_test
+from utils.benchmark import BenchmarkHistory
+from utils.data_generator import GeneratedCase
+from utils.data_reader import DATA_DIR, DatasetCase, LazyDataset
+from utils.browser_pool import BrowserPool
+from utils.events import configure_events, get_event_log, close_events
+from utils.network_policy import NetworkPolicy, NetworkBlocker
+from utils.profiler import CommandProfiler
+from utils.report_generator import StreamingReportWriter
+from utils.session_cache import SessionCache
+import glob
+import html
 import os
+import time
 
-# Setup logging configuration from custom logger utility
-from utils.logger import setup_logging
-setup_logging()
+# Logging is configured once per process in pytest_configure (see utils/logger.py)
+from utils.logger import setup_logging, shutdown_logging, merge_logs
 
 # Get logger instance for this module
 import logging
 logger = logging.getLogger(__name__)
 
-# Create base reports directory if it doesn't exist
-reports_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "reports")
-os.makedirs(reports_dir, exist_ok=True)
 
-# Create screenshots directory inside reports folder
-screenshots_dir = os.path.join(reports_dir, "screenshots")
-os.makedirs(screenshots_dir, exist_ok=True)
+@pytest.fixture(scope="session", autouse=True)
+def app_server():
+    """
+    Fixture to start the bundled stand-in app when Config.APP_TARGET is "local".
+    Each xdist worker runs its own server on a free port, so navigations never
+    leave the machine and timings do not depend on network latency.
+    """
+    if Config.APP_TARGET != "local":
+        yield None
+        return
+
+    app = LocalApp().start()
+    Config.use_base_url(app.url)
+    yield app
+
+    # Teardown
+    app.stop()
 
 
 @pytest.fixture(scope="session")
-def driver():
-    """
-    Fixture to initialize WebDriver instance based on browser from Config.
-    Supports Chrome, Firefox, and Edge.
-    Runs once per test session.
-    """
-    logger.info("Initializing browser setup...")
-    logger.info(f"Selected Browser: {Config.BROWSER}")
-    logger.info(f"Incognito mode enabled: {Config.INCOGNITO}")
-    logger.info(f"Headless mode enabled: {Config.HEADLESS}")
-
-    # Launch Chrome
-    if Config.BROWSER.lower() == "chrome":
-        logger.debug("Configuring Chrome browser options")
-        options = Config.get_chrome_options()
-        driver = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()), options=options)
-
-    # Launch Firefox
-    elif Config.BROWSER.lower() == "firefox":
-        logger.debug("Configuring Firefox browser options")
-        options = webdriver.FirefoxOptions()
-        if Config.INCOGNITO:
-            options.add_argument("-private")
-        driver = webdriver.Firefox(service=FirefoxService(GeckoDriverManager().install()), options=options)
-
-    # Launch Edge
-    elif Config.BROWSER.lower() == "edge":
-        logger.debug("Launching Microsoft Edge browser")
-        driver = webdriver.Edge(service=EdgeService(EdgeChromiumDriverManager().install()))
-
-    else:
-        logger.error(f"Unsupported browser selected: {Config.BROWSER}")
-        raise ValueError(f"Unsupported browser: {Config.BROWSER}")
-
-    # Apply default WebDriver configurations
-    driver.implicitly_wait(Config.IMPLICIT_WAIT)
-    driver.maximize_window()
-    logger.info("Browser initialized successfully and window maximized")
-
-    yield driver  # Provide driver to test
+def browser_pool(worker_id):
+    """
+    Fixture providing the pool of warm browsers for this test process.
+    Under pytest-xdist every worker is a separate process with its own pool,
+    so 'pytest -n auto' runs one pool per core without sharing browsers.
+    """
+    pool = BrowserPool(size=Config.BROWSER_POOL_SIZE, worker_id=worker_id)
+    yield pool  # Provide pool to the driver fixture
 
     # Teardown
-    logger.info("Closing browser instance")
-    driver.quit()
+    pool.close_all()
 
 
 @pytest.fixture
-def standard_user(driver):
+def driver(request, browser_pool):
     """
-    Fixture to log in as standard_user before a test and return ProductsPage.
-    Ensures login state is reset after the test.
+    Fixture to lease a browser from the worker's pool for a single test.
+    Cookies and web storage are wiped when the lease ends, so tests are isolated.
+    With Config.PROFILE_COMMANDS on, every WebDriver command of the test is recorded.
+    """
+    with browser_pool.lease() as driver:
+        if not Config.PROFILE_COMMANDS:
+            yield driver  # Provide driver to test
+            return
+
+        profiler = CommandProfiler.attach(driver)
+        profiler.start_test(request.node.nodeid)
+        yield driver  # Provide driver to test
+        request.node.command_records = profiler.end_test()
+
+
+@pytest.fixture(autouse=True)
+def network_blocking(request):
+    """
+    Fixture to block heavy/third-party requests for tests that use a browser.
+    Active when Config.NETWORK_BLOCKING is on or the test has a network_policy marker;
+    blocked request and byte counts are attached to the test's report section.
+    """
+    marker = request.node.get_closest_marker("network_policy")
+    if "driver" not in request.fixturenames or not (Config.NETWORK_BLOCKING or marker):
+        yield None
+        return
+
+    blocker = NetworkBlocker(request.getfixturevalue("driver"))
+    blocker.apply(NetworkPolicy.from_marker(marker))
+    yield blocker
+
+    # Teardown
+    request.node.network_blocker = blocker.collect()
+    if blocker.log_available:
+        request.node.user_properties.append(("blocked_requests", blocker.blocked_requests))
+        request.node.user_properties.append(("blocked_bytes", blocker.blocked_bytes))
+        request.node.user_properties.append(("blocked_unsized_requests", blocker.unsized_requests))
+    blocker.clear()
+
+
+@pytest.fixture(scope="session")
+def session_cache():
+    """
+    Fixture providing the per-worker cache of logged-in sessions.
+    Each pytest-xdist worker is its own process, so it gets its own cache.
+    """
+    cache = SessionCache()
+    yield cache
+    cache.clear()
+
+
+@pytest.fixture(scope="session")
+def benchmark_history(request, worker_id):
+    """
+    Fixture providing the page-object benchmark history (Config.BENCHMARK_HISTORY_PATH).
+    Results are appended as one run at session end; with --benchmark-update-baseline
+    they also replace the stored baselines. Only a non-xdist run writes the file,
+    since parallel workers would skew timings and race on the history.
+    """
+    history = BenchmarkHistory()
+    yield history
+
+    # Teardown
+    if worker_id != "master":
+        logger.warning("Benchmark history is not written under pytest-xdist; run benchmarks without -n")
+        return
+    history.save(update_baseline=request.config.getoption("--benchmark-update-baseline"))
+
+
+def login_as(driver, session_cache, username, password):
+    """
+    Log in and return a ProductsPage with the inventory loaded.
+    When Config.SESSION_BOOTSTRAP is enabled, the first login for a user goes
+    through the UI and later ones are seeded from the cached session state.
     """
-    logger.info("Attempting login as standard_user")
-    login_page = LoginPage(driver)
-    login_page.login("standard_user", "secret_sauce")
-    
     from pages.products_page import ProductsPage
+
+    restored = (
+        Config.SESSION_BOOTSTRAP
+        and session_cache.restore(driver, username)
+        and "inventory" in driver.current_url
+    )
+    if not restored:
+        login_page = LoginPage(driver)
+        login_page.login(username, password)
+
     products_page = ProductsPage(driver)
-    
+
     # Wait for products page to load
     logger.debug("Waiting for Products page to load...")
     products_page.wait_for_element_to_be_present(products_page.PRODUCTS_TITLE)
+
+    # Capture only once the inventory page confirms the UI login succeeded
+    if Config.SESSION_BOOTSTRAP and not restored:
+        session_cache.capture(driver, username)
+    return products_page
+
+
+@pytest.fixture
+def standard_user(request, driver, session_cache):
+    """
+    Fixture to log in as standard_user before a test and return ProductsPage.
+    Ensures login state is reset after the test.
+    """
+    logger.info("Attempting login as standard_user")
+    products_page = login_as(driver, session_cache, "standard_user", "secret_sauce")
     logger.info("Login successful - Products page loaded")
 
     yield products_page  # Provide logged-in ProductsPage object to test
 
-    # Teardown after test execution
+    # Teardown after test execution: fast storage-level reset, timed per test
+    start = time.perf_counter()
     try:
-        if "inventory" in driver.current_url:
-            logger.debug("Resetting application state from Products page")
-            products_page.reset_app_state()
-        else:
-            logger.debug("Navigating to Products page for reset")
-            driver.get("https://www.saucedemo.com/inventory.html")
-            products_page.reset_app_state()
+        products_page.reset_app_state()
         logger.info("Application state reset successfully")
     except Exception as e:
         logger.warning(f"Could not reset app state: {e}. Navigating back to login page.")
-        driver.get("https://www.saucedemo.com/")
+        driver.get(Config.url())
+    reset_ms = round((time.perf_counter() - start) * 1000, 1)
+    request.node.user_properties.append(("teardown_reset_ms", reset_ms))
+    logger.info(f"Teardown reset took {reset_ms} ms")
+
+
+@pytest.fixture
+def login_user(driver, session_cache):
+    """
+    Fixture returning a function that logs in as any user from test_data/users.json
+    and returns the ProductsPage, for tests parametrized over users.
+    """
+    from utils.data_reader import get_users
+    passwords = {user.username: user.password for user in get_users()}
+
+    def login(username):
+        logger.info(f"Attempting login as {username}")
+        return login_as(driver, session_cache, username, passwords[username])
+
+    return login
+
+
+@pytest.fixture
+def selected_products(standard_user):
+    """
+    Fixture to pick 4 random products (reproducible through Config.RANDOM_SEED).
+    Tests that need a selection declare it here instead of relying on state
+    left behind by an earlier test, so they can run on any xdist worker.
+    """
+    return standard_user.select_random_products(4)
+
+
+@pytest.fixture
+def cart_with_products(standard_user, selected_products):
+    """
+    Fixture to add the selected products to the cart and wait for the badge.
+    Returns the list of products that were added.
+    """
+    standard_user.add_products_to_cart(selected_products)
+    assert standard_user.wait_for_cart_count(len(selected_products)), "Cart badge did not reach the selected count"
+    logger.info(f"Cart prepared with {len(selected_products)} products")
+    return selected_products
 
 
 # ---------------------- Pytest Hooks ----------------------
 
+def pytest_addoption(parser):
+    """Register custom command line options."""
+    parser.addoption(
+        "--benchmark",
+        action="store_true",
+        default=False,
+        help="Run the benchmarks under tests/benchmarks (skipped by default)"
+    )
+    parser.addoption(
+        "--benchmark-update-baseline",
+        action="store_true",
+        default=False,
+        help="Store this run's page-object benchmark results as the new baseline"
+    )
+    parser.addoption(
+        "--profile-commands",
+        action="store_true",
+        default=False,
+        help="Record every WebDriver command and add a profile to the HTML report"
+    )
+    parser.addoption(
+        "--launch-profile",
+        action="store",
+        default=None,
+        choices=sorted(Config.LAUNCH_PROFILES),
+        help="Browser launch profile (overrides the LAUNCH_PROFILE environment variable)"
+    )
+    parser.addoption(
+        "--stream-report",
+        action="store",
+        default=Config.STREAM_REPORT_PATH,
+        metavar="PATH",
+        help="Write a lightweight HTML report incrementally, one test at a time"
+    )
+    parser.addoption(
+        "--soak-volume",
+        action="store",
+        type=int,
+        default=Config.SOAK_VOLUME,
+        help="Number of generated cases per @pytest.mark.generated_data test"
+    )
+
+
+def pytest_generate_tests(metafunc):
+    """
+    Parametrize @pytest.mark.generated_data(kind) tests with --soak-volume generated cases,
+    and @pytest.mark.data_file(name, record_type) tests with one case per row of the file.
+    - Only (kind, index) / (dataset, index) is stored per case; records are built
+      or read when a test uses them, so large files are never loaded at collection.
+    - Cases are dealt round-robin into one xdist_group per worker, so
+      'pytest -n N --dist loadgroup' gives every worker an equal shard.
+    - With a volume of 0 (the default) or a missing data file the test is collected once, skipped.
+    """
+    shards = int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "1"))
+    marker = metafunc.definition.get_closest_marker("data_file")
+    if marker is not None and "dataset_row" in metafunc.fixturenames:
+        name, record_type = marker.args
+        path = os.path.join(DATA_DIR, name)
+        if not os.path.isfile(path):
+            skip = pytest.mark.skip(reason=f"{path} not found (create it with python -m utils.data_generator)")
+            metafunc.parametrize("dataset_row", [pytest.param(None, id=f"{os.path.basename(name)}-missing", marks=skip)])
+            return
+        dataset = LazyDataset(path, record_type)
+        cases = [DatasetCase(dataset, index) for index in range(len(dataset))]
+        metafunc.parametrize("dataset_row", [
+            pytest.param(case, id=repr(case), marks=pytest.mark.xdist_group(f"soak-{case.index % shards}"))
+            for case in cases
+        ])
+        return
+
+    marker = metafunc.definition.get_closest_marker("generated_data")
+    if marker is None or "generated" not in metafunc.fixturenames:
+        return
+    kind = marker.args[0]
+    volume = metafunc.config.getoption("--soak-volume")
+    if volume <= 0:
+        skip = pytest.mark.skip(reason="generated data tests run only with --soak-volume (or SOAK_VOLUME) > 0")
+        metafunc.parametrize("generated", [pytest.param(None, id=f"{kind}-off", marks=skip)])
+        return
+    metafunc.parametrize("generated", [
+        pytest.param(GeneratedCase(kind, index), id=f"{kind}-{index:06d}",
+                     marks=pytest.mark.xdist_group(f"soak-{index % shards}"))
+        for index in range(volume)
+    ])
+
+
+def pytest_collection_modifyitems(config, items):
+    """Enable the performance log for network policies and skip benchmark tests unless --benchmark is given."""
+    # Browsers start after collection: launch them with the performance log when any
+    # test applies a network policy, so its blocked requests can be counted
+    if any(item.get_closest_marker("network_policy") for item in items):
+        Config.NETWORK_PERFORMANCE_LOG = True
+    if config.getoption("--benchmark"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="benchmarks run only with --benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
 def pytest_configure(config):
-    """Attach environment details to HTML test report."""
+    """Set up logging for this process and attach environment details to HTML test report."""
+    worker_id = getattr(config, "workerinput", {}).get("workerid", "master")
+    # The controller creates the run id first; xdist workers inherit it through the environment
+    Config.run_id()
+    setup_logging(worker_id=worker_id)
+    configure_events(worker_id)
+    if config.getoption("--launch-profile"):
+        Config.LAUNCH_PROFILE = config.getoption("--launch-profile")
+    if config.getoption("--profile-commands"):
+        Config.PROFILE_COMMANDS = True
+    if not hasattr(config, "workerinput"):
+        # Only the controller writes the streaming report (it receives every worker's reports)
+        if config.getoption("--stream-report"):
+            global stream_report
+            stream_report = StreamingReportWriter(config.getoption("--stream-report"))
+    if Config.PROFILE_COMMANDS and not hasattr(config, "workerinput"):
+        # Controller process: drop per-worker profiles left over from an earlier run
+        # (workers start after this, so they never lose their own spool)
+        for path in glob.glob(os.path.join(Config.PROFILE_PATH, "commands_*.json*")):
+            os.remove(path)
+    if Config.PROFILE_COMMANDS:
+        CommandProfiler.spool_to(Config.PROFILE_PATH, worker_id)
     logger.info("Configuring pytest environment metadata")
+    config.addinivalue_line("markers", "benchmark: performance benchmark, run only with --benchmark")
+    config.addinivalue_line("markers", "network_policy(block, unblock): URL patterns to block / remove from the block list for the test")
+    config.addinivalue_line("markers", "generated_data(kind): parametrize with --soak-volume generated cases")
+    config.addinivalue_line("markers", "data_file(name, record_type): parametrize with one case per row of a test_data file")
     config._metadata = {
         "Browser": Config.BROWSER,
         "Incognito Mode": Config.INCOGNITO,
-        "Headless Mode": Config.HEADLESS,
-        "Base URL": Config.BASE_URL
+        "Launch Profile": Config.LAUNCH_PROFILE,
+        "Headless Mode": Config.get_launch_profile()["headless"],
+        "Base URL": Config.BASE_URL,
+        "Application Target": Config.APP_TARGET,
+        "Session Bootstrap": Config.SESSION_BOOTSTRAP,
+        "Browser Pool Size": Config.BROWSER_POOL_SIZE,
+        "Network Blocking": Config.NETWORK_BLOCKING,
+        "Command Profiling": Config.PROFILE_COMMANDS
     }
 
 
@@ -128,9 +373,73 @@ def pytest_html_report_title(report):
     logger.info("Custom HTML report title set")
 
 
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionfinish(session):
+    """Flush pending screenshots and events before the HTML report is built; workers hand
+    their per-process statistics to the controller."""
+    is_worker = hasattr(session.config, "workerinput")
+    # Store retention runs once, in the controller, after every worker has merged its index entries
+    close_pipeline(evict=not is_worker)
+    close_events()
+    if is_worker:
+        # Sent to the controller with the worker's "finished" event (see pytest_testnodedown)
+        from pages.products_page import ProductsPage
+        session.config.workeroutput["catalog_cache_stats"] = dict(ProductsPage.catalog_cache_stats)
+        session.config.workeroutput["startup_timings"] = list(driver_factory.startup_timings)
+        # Flush this worker's log file before the controller is told it has finished
+        shutdown_logging()
+
+
+def pytest_unconfigure(config):
+    """Finalise the streaming report's summary and merge the per-process logs into one run log."""
+    if stream_report is not None:
+        stream_report.close()
+    shutdown_logging()
+    if not hasattr(config, "workerinput"):
+        merge_logs()
+
+
+def pytest_html_results_summary(prefix, summary, postfix):
+    """Add the slowest WebDriver commands and per-method totals to the HTML report."""
+    if not Config.PROFILE_COMMANDS:
+        return
+    records = CommandProfiler.load_all(Config.PROFILE_PATH)
+    if not records:
+        return
+
+    # Flame-graph trace next to the report (flamegraph.pl / speedscope collapsed format)
+    folded_path = os.path.join(Config.PROFILE_PATH, "commands.folded")
+    with open(folded_path, "w") as file:
+        file.write("\n".join(CommandProfiler.folded(records)) + "\n")
+
+    rows = "".join(
+        f"<tr><td>{html.escape(record['test'])}</td><td>{html.escape(record['caller'])}</td>"
+        f"<td>{record['command']}</td><td>{html.escape(record['locator'] or '')}</td>"
+        f"<td>{record['duration_ms']:.1f}</td></tr>"
+        for record in CommandProfiler.top_n(records, Config.PROFILE_TOP_N)
+    )
+    methods = "".join(
+        f"<tr><td>{html.escape(name)}</td><td>{stats['count']}</td>"
+        f"<td>{stats['total_ms']:.1f}</td><td>{stats['max_ms']:.1f}</td></tr>"
+        for name, stats in CommandProfiler.aggregate(records, "caller").items()
+    )
+    postfix.append(
+        f"<h2>WebDriver command profile</h2>"
+        f"<p>{len(records)} commands, {sum(r['duration_ms'] for r in records) / 1000:.2f} s total. "
+        f"Flame-graph trace: {html.escape(folded_path)}</p>"
+        f"<h3>Top {Config.PROFILE_TOP_N} slowest commands</h3>"
+        f"<table><tr><th>Test</th><th>Caller</th><th>Command</th><th>Locator</th><th>ms</th></tr>{rows}</table>"
+        f"<h3>Time per page-object method</h3>"
+        f"<table><tr><th>Method</th><th>Commands</th><th>Total ms</th><th>Max ms</th></tr>{methods}</table>"
+    )
+
+
 def pytest_runtest_logstart(nodeid, location):
     """Log when a test starts execution."""
     logger.info(f"Starting test execution: {nodeid}")
+    set_current_test(nodeid)
+    if get_event_log() is not None:
+        get_event_log().current_test = nodeid
 
 
 def pytest_runtest_logfinish(nodeid, location):
@@ -138,11 +447,130 @@ def pytest_runtest_logfinish(nodeid, location):
     logger.info(f"Finished test execution: {nodeid}")
 
 
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Emit a structured event per test phase and attach network blocking counters,
+    the command profile and screenshots to the teardown report."""
+    outcome = yield
+    report = outcome.get_result()
+    if get_event_log() is not None:
+        get_event_log().emit(
+            f"test.{report.when}",
+            duration_ms=round(report.duration * 1000, 3),
+            outcome=report.outcome,
+        )
+    if report.when != "teardown":
+        return
+    handles = handles_for(item.nodeid)
+    if handles:
+        attach_screenshots(item, report, handles)
+    blocker = getattr(item, "network_blocker", None)
+    if blocker is not None:
+        report.sections.append(("Network blocking", blocker.summary()))
+    records = getattr(item, "command_records", None)
+    if records:
+        lines = [f"{len(records)} commands, {sum(r['duration_ms'] for r in records):.1f} ms"]
+        lines.extend(
+            f"  {name}: {stats['count']} commands, {stats['total_ms']:.1f} ms"
+            for name, stats in CommandProfiler.aggregate(records, "caller").items()
+        )
+        report.sections.append(("WebDriver commands", "\n".join(lines)))
+
+
+def attach_screenshots(item, report, handles):
+    """Wait for the test's background screenshots and link them in the report."""
+    paths, lines = [], []
+    for handle in handles:
+        try:
+            paths.append(handle.result(timeout=30))
+            lines.append(f"{handle.name}: {handle.ref()} ({paths[-1]})")
+        except Exception as e:
+            logger.error(f"Screenshot {handle.name} was not written: {e}")
+    report.sections.append(("Screenshots", "\n".join(lines)))
+    report.user_properties.append(("screenshots", paths))
+    pytest_html = item.config.pluginmanager.getplugin("html")
+    if pytest_html is not None:
+        extras = getattr(report, "extras", [])
+        extras.extend(pytest_html.extras.image(path) for path in paths)
+        report.extras = extras
+
+
+# Call-phase durations (seconds) of every test run, reported per launch profile
+test_durations = []
+
+# Requests and bytes avoided by network blocking across the run (and blocked requests of unknown size)
+blocked_totals = {"blocked_requests": 0, "blocked_bytes": 0, "blocked_unsized_requests": 0}
+
+# Time (ms) spent resetting app state in each standard_user teardown
+teardown_reset_times = []
+
+# Incremental HTML report (--stream-report), written by the controller process
+stream_report = None
+
+# Catalog cache counters and browser startup timings reported by xdist workers
+worker_catalog_cache_stats = {"hits": 0, "misses": 0}
+worker_startup_timings = []
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Collect the per-process statistics a pytest-xdist worker sent when it finished."""
+    output = getattr(node, "workeroutput", {})
+    for name, value in output.get("catalog_cache_stats", {}).items():
+        worker_catalog_cache_stats[name] += value
+    for timings in output.get("startup_timings", []):
+        worker_startup_timings.append(dict(timings, worker=node.gateway.id))
+
+
 def pytest_runtest_logreport(report):
-    """Log result of each test (pass/fail/skip)."""
+    """Log result of each test (pass/fail/skip) and stream it to the incremental report."""
+    if stream_report is not None:
+        stream_report.add_report(report)
+    if report.when == "call":
+        test_durations.append(report.duration)
+    if report.when == "teardown":
+        for name, value in report.user_properties:
+            if name in blocked_totals:
+                blocked_totals[name] += value
+            elif name == "teardown_reset_ms":
+                teardown_reset_times.append(value)
     if report.failed:
         logger.error(f"Test FAILED: {report.nodeid} - {report.longreprtext}")
     elif report.passed:
         logger.info(f"Test PASSED: {report.nodeid}")
     elif report.skipped:
         logger.warning(f"Test SKIPPED: {report.nodeid}")
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Print network blocking totals, teardown reset times, catalog cache use, browser startup phases and per-test time."""
+    if blocked_totals["blocked_requests"]:
+        terminalreporter.section("Network blocking")
+        avoided = NetworkBlocker.format_avoided(blocked_totals["blocked_requests"], blocked_totals["blocked_bytes"],
+                                                blocked_totals["blocked_unsized_requests"])
+        terminalreporter.write_line(f"{blocked_totals['blocked_requests']} requests blocked, transfer avoided: {avoided}")
+    if teardown_reset_times:
+        terminalreporter.section("Teardown reset")
+        terminalreporter.write_line(
+            f"{len(teardown_reset_times)} resets, mean {sum(teardown_reset_times) / len(teardown_reset_times):.1f} ms, "
+            f"max {max(teardown_reset_times):.1f} ms"
+        )
+    # This process's statistics plus those sent by xdist workers
+    from pages.products_page import ProductsPage
+    cache_stats = {name: value + worker_catalog_cache_stats[name] for name, value in ProductsPage.catalog_cache_stats.items()}
+    if any(cache_stats.values()):
+        terminalreporter.section("Catalog cache")
+        terminalreporter.write_line(f"{cache_stats['hits']} hits, {cache_stats['misses']} misses")
+    startup_timings = driver_factory.startup_timings + worker_startup_timings
+    if not startup_timings and not test_durations:
+        return
+    terminalreporter.section(f"Launch profile: {Config.LAUNCH_PROFILE}")
+    for timings in startup_timings:
+        worker = f"[{timings['worker']}] " if "worker" in timings else ""
+        terminalreporter.write_line(
+            f"{worker}{timings['browser']} startup: resolve {timings['resolve_ms']} ms, spawn {timings['spawn_ms']} ms, "
+            f"first navigation {timings['first_navigation_ms']} ms"
+        )
+    if test_durations:
+        mean_ms = sum(test_durations) / len(test_durations) * 1000
+        terminalreporter.write_line(f"{len(test_durations)} tests, mean {mean_ms:.1f} ms per test")
@@ -1,13 +1,14 @@
 import pytest
 from pages.login_page import LoginPage
 from utils.data_reader import get_users
+from config.config import Config
 import logging
 
 # Configure logger for this test module
 logger = logging.getLogger(__name__)
 
 class TestLogin:
-    @pytest.mark.parametrize("user", get_users())
+    @pytest.mark.parametrize("user", get_users(), ids=lambda user: user.username)
     def test_login_with_various_users(self, driver, user):
         """
         Test-Case-1: Login with various predefined users
@@ -16,14 +17,14 @@ class TestLogin:
         - Ensures locked out user gets proper error message
         """
         logger.info("===== Starting Test: Login with Various Users =====")
-        logger.info(f"Attempting login with username: {user['username']}")
+        logger.info(f"Attempting login with username: {user.username}")
 
         # Initialize login page and attempt login
         login_page = LoginPage(driver)
-        login_page.login(user["username"], user["password"])
+        login_page.login(user.username, user.password)
         logger.info("Login form submitted")
 
-        if user["username"] == "locked_out_user":
+        if user.expected_result == "failure":
             # Verify error message for locked-out user
             error_message = login_page.get_error_message()
             logger.debug(f"Error message displayed: {error_message}")
@@ -37,11 +38,29 @@ class TestLogin:
             page_title = products_page.get_title()
             logger.debug(f"Products Page Title: {page_title}")
             assert "Products" in page_title, f"Unexpected page title: {page_title}"
-            logger.info(f"User {user['username']} successfully logged in")
+            logger.info(f"User {user.username} successfully logged in")
 
             # Logout after verification to reset state
             products_page.logout()
-            assert driver.current_url == "https://www.saucedemo.com/", "Logout did not return to login page"
-            logger.info(f"User {user['username']} successfully logged out")
+            assert driver.current_url == Config.url(), "Logout did not return to login page"
+            logger.info(f"User {user.username} successfully logged out")
 
         logger.info("===== Test Completed: Login with Various Users =====")
+
+    @pytest.mark.generated_data("user")
+    def test_login_soak_generated_users(self, driver, generated):
+        """
+        Test-Case-1b: Repeated login/logout with generated valid users
+        - One case per --soak-volume (seeded by Config.DATA_SEED)
+        """
+        user = generated.record
+        logger.info(f"===== Starting Test: Login Soak ({generated}) =====")
+
+        LoginPage(driver).login(user.username, user.password)
+        from pages.products_page import ProductsPage
+        products_page = ProductsPage(driver)
+        assert "Products" in products_page.get_title(), f"User {user.username} did not reach the Products page"
+
+        products_page.logout()
+        assert driver.current_url == Config.url(), "Logout did not return to login page"
+        logger.info(f"===== Test Completed: Login Soak ({generated}) =====")
@@ -1,6 +1,7 @@
 import pytest
 from pages.login_page import LoginPage
-from utils.data_reader import get_users
+from utils.data_generator import DataGenerator
+from utils.data_reader import User, get_invalid_users
 import logging
 
 # Configure logger for this test module
@@ -26,4 +27,58 @@ class TestLoginInvalidCredentials:
             "Invalid credentials error message not displayed"
         logger.info("Invalid credentials correctly rejected")
 
-        logger.info("===== Test Completed: Login with Invalid Credentials =====")
\ No newline at end of file
+        logger.info("===== Test Completed: Login with Invalid Credentials =====")
+
+    @pytest.mark.generated_data("invalid_credentials")
+    def test_login_with_generated_invalid_credentials(self, driver, generated):
+        """
+        Test-Case-2b: Login with generated invalid credentials
+        - Empty, unknown, case-changed and padded usernames/passwords, then random unknown users
+        - Verifies the exact error message for each combination
+        """
+        user, expected_error = generated.record
+        logger.info(f"===== Starting Test: Generated Invalid Credentials ({generated}) =====")
+
+        login_page = LoginPage(driver)
+        login_page.login(user.username, user.password)
+
+        error_message = login_page.get_error_message()
+        logger.debug(f"Error message displayed: {error_message}")
+        assert expected_error in error_message, f"Expected '{expected_error}', got '{error_message}'"
+        logger.info(f"===== Test Completed: Generated Invalid Credentials ({generated}) =====")
+
+    @pytest.mark.parametrize("user", get_invalid_users(), ids=lambda user: user.username or "<empty>")
+    def test_login_with_listed_invalid_users(self, driver, user):
+        """
+        Test-Case-2c: Login with the invalid users listed in test_data.json
+        - Verifies the exact error message for each one
+        """
+        expected_error = DataGenerator.expected_error(user.username, user.password)
+        logger.info(f"===== Starting Test: Listed Invalid User ({user.username!r}) =====")
+
+        login_page = LoginPage(driver)
+        login_page.login(user.username, user.password)
+
+        error_message = login_page.get_error_message()
+        logger.debug(f"Error message displayed: {error_message}")
+        assert expected_error in error_message, f"Expected '{expected_error}', got '{error_message}'"
+        logger.info(f"===== Test Completed: Listed Invalid User ({user.username!r}) =====")
+
+    @pytest.mark.data_file("generated/invalid_credentials.jsonl", User)
+    def test_login_with_invalid_credentials_from_file(self, driver, dataset_row):
+        """
+        Test-Case-2d: Login with invalid credentials streamed from a generated data file
+        - Create the file with: python -m utils.data_generator invalid_credentials 5000 test_data/generated/invalid_credentials.jsonl
+        - One case per row; rows are read lazily, only when their test runs
+        """
+        user = dataset_row.record
+        expected_error = DataGenerator.expected_error(user.username, user.password)
+        logger.info(f"===== Starting Test: Invalid Credentials From File ({dataset_row}) =====")
+
+        login_page = LoginPage(driver)
+        login_page.login(user.username, user.password)
+
+        error_message = login_page.get_error_message()
+        logger.debug(f"Error message displayed: {error_message}")
+        assert expected_error in error_message, f"Expected '{expected_error}', got '{error_message}'"
+        logger.info(f"===== Test Completed: Invalid Credentials From File ({dataset_row}) =====")
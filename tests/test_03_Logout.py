@@ -1,6 +1,7 @@
 import pytest
 from pages.login_page import LoginPage
 from utils.data_reader import get_users
+from config.config import Config
 import logging
 
 # Configure logger for this test module
@@ -29,7 +30,7 @@ class TestLogout:
         logger.info("User clicked logout")
 
         # Verify user is redirected to login page
-        assert driver.current_url == "https://www.saucedemo.com/", "Logout did not redirect to login page"
+        assert driver.current_url == Config.url(), "Logout did not redirect to login page"
         logger.info("Logout functionality works correctly")
 
         logger.info("===== Test Completed: Logout Functionality =====")
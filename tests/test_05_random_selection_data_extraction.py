@@ -10,7 +10,6 @@ class TestProductsRandomProductSelection:
         Test-Case-5: Random selection of products and data extraction
         - Randomly selects 4 products
         - Extracts and logs product names and prices
-        - Stores product list for use in later test cases
         """
         logger.info("===== Starting Test: Random Product Selection =====")
         products_page = standard_user
@@ -27,8 +26,6 @@ class TestProductsRandomProductSelection:
         for product in selected_products:
             logger.info(f"Selected product: {product['name']}, Price: ${product['price']}")
 
-        # Store selected products in the page object for later use (e.g., cart, checkout tests)
-        standard_user.selected_products = selected_products
         logger.info("Random product selection completed successfully")
 
         logger.info("===== Test Completed: Random Product Selection =====")
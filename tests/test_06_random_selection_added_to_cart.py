@@ -1,34 +1,46 @@
 import pytest
 import logging
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import TimeoutException
 
 # Initialize logger for this module
 logger = logging.getLogger(__name__)
 
 class TestAddProductsToCart:
-    def test_add_products_to_cart(self, standard_user):
+    def test_add_products_to_cart(self, standard_user, selected_products):
         """Test-Case-6: Add selected products to cart and validate"""
         logger.info("===== Starting Test: Add Products to Cart =====")
         products_page = standard_user
         
-        # Select products if not already selected in session
-        if not hasattr(products_page, 'selected_products'):
-            logger.info("Selecting 4 random products to add to cart")
-            products_page.selected_products = products_page.select_random_products(4)
-        
         # Add products to cart
-        logger.info(f"Adding {len(products_page.selected_products)} products to cart")
-        products_page.add_products_to_cart(products_page.selected_products)
+        logger.info(f"Adding {len(selected_products)} products to cart")
+        products_page.add_products_to_cart(selected_products)
         
-        # Wait for cart count to update using explicit wait
-        WebDriverWait(products_page.driver, 10).until(
-            lambda driver: products_page.get_cart_count() == 4
-        )
+        # Wait in the page for the badge to show 4 (one async script call)
+        assert products_page.wait_for_cart_count(4), "Cart badge did not reach 4 items"
         
-        # Verify cart count
-        cart_count = products_page.get_cart_count()
-        logger.info(f"Cart count after adding products: {cart_count}")
-        assert cart_count == 4, f"Cart should have 4 items, but has {cart_count}"
+        # Verify every click moved the badge up by exactly one
+        history = [entry['count'] for entry in products_page.get_cart_history()]
+        logger.info(f"Cart count history: {history}")
+        assert history == [0, 1, 2, 3, 4], f"Unexpected cart count history: {history}"
         
         logger.info("===== Test Passed: Products successfully added to cart =====")
+
+    def test_remove_products_from_cart(self, standard_user, cart_with_products):
+        """Test-Case-6b: Remove products from the cart on the Products page and validate"""
+        logger.info("===== Starting Test: Remove Products from Cart =====")
+        products_page = standard_user
+
+        # Remove two of the products in one batch
+        to_remove = cart_with_products[:2]
+        state = products_page.remove_products_from_cart(to_remove)
+        assert [item['in_cart'] for item in state['items']] == [False, False], \
+            f"Products still in cart after removal: {state['items']}"
+        assert [item['name'] for item in state['items']] == [product['name'] for product in to_remove]
+
+        # Removing products that are no longer in the cart changes nothing
+        products_page.remove_products_from_cart(to_remove)
+        expected = len(cart_with_products) - len(to_remove)
+        assert products_page.wait_for_cart_count(expected), f"Cart badge did not drop to {expected} items"
+        logger.info(f"Cart count after removal: {products_page.get_cart_count()}")
+
+        logger.info("===== Test Passed: Products successfully removed from cart =====")
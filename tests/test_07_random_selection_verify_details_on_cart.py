@@ -1,26 +1,16 @@
 import pytest
 import logging
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import TimeoutException
 
 # Initialize logger for this module
 logger = logging.getLogger(__name__)
 
 class TestValidateCartDetails:
-    def test_validate_cart_details(self, standard_user):
+    def test_validate_cart_details(self, standard_user, cart_with_products):
         """Test-Case-7: Validate product details inside the cart"""
         logger.info("===== Starting Test: Validate Cart Details =====")
         products_page = standard_user
         
-        # Ensure cart has products before validation
-        if not hasattr(products_page, 'selected_products') or len(products_page.selected_products) == 0:
-            logger.warning("No products found in session, selecting 2 products to add")
-            products_page.selected_products = products_page.select_random_products(2)
-            products_page.add_products_to_cart(products_page.selected_products)
-            WebDriverWait(products_page.driver, 10).until(
-                lambda driver: products_page.get_cart_count() > 0
-            )
-        
         # Navigate to cart page
         logger.info("Navigating to cart page")
         products_page.go_to_cart()
@@ -48,15 +38,35 @@ class TestValidateCartDetails:
         logger.info(f"Cart item prices: {item_prices}")
         
         # Validate expected count of items
-        expected_count = len(products_page.selected_products)
+        expected_count = len(cart_with_products)
         assert len(item_names) == expected_count, f"Expected {expected_count} items, found {len(item_names)}"
         assert len(item_prices) == expected_count, f"Expected {expected_count} prices, found {len(item_prices)}"
         
         # Verify product details match what was added
-        for product in products_page.selected_products:
+        for product in cart_with_products:
             logger.info(f"Validating product in cart: {product}")
             assert product['name'] in item_names, f"Product {product['name']} not found in cart"
             assert product['price'] in item_prices, f"Product price {product['price']} not found in cart"
         
         logger.info("===== Test Passed: Cart details validated successfully =====")
-    
\ No newline at end of file
+
+    def test_remove_items_from_cart(self, standard_user, cart_with_products):
+        """Test-Case-7b: Remove several cart items in one batch and validate the rest"""
+        logger.info("===== Starting Test: Remove Items From Cart =====")
+        products_page = standard_user
+        products_page.go_to_cart()
+
+        from pages.cart_page import CartPage
+        cart_page = CartPage(products_page.driver)
+        cart_page.wait_for_cart_items()
+
+        # Remove the first product by name and the last row by index
+        names = cart_page.get_item_names()
+        state = cart_page.remove_items([names[0], len(names) - 1])
+        logger.info(f"Cart after removal: {state}")
+        assert state['removed'] == [names[0], names[-1]], f"Unexpected removed items: {state['removed']}"
+        assert state['remaining'] == names[1:-1], f"Unexpected remaining items: {state['remaining']}"
+        assert cart_page.get_item_names() == names[1:-1], "Cart rows do not match the reported post-state"
+
+        logger.info("===== Test Passed: Items removed from cart =====")
+
@@ -1,78 +1,64 @@
 import pytest
 import logging
-from utils.data_reader import get_test_data
-from selenium.webdriver.common.by import By
+from pages.checkout_flow import CheckoutFlow
+from utils.data_reader import get_checkout_info
 
 # Configure logger for this test module
 logger = logging.getLogger(__name__)
 
 class TestCheckout:
-    def test_complete_checkout(self, standard_user):
-        """Test-Case-8: Complete checkout and validate order"""
+    def test_complete_checkout(self, standard_user, cart_with_products, record_property):
+        """
+        Test-Case-8: Complete checkout and validate order
+        - Cart -> information -> overview -> complete through CheckoutFlow
+        - Overview items, item total, tax and total must match the cart
+        """
         logger.info("===== Starting Test: Complete Checkout =====")
         
         # Get the Products page object from the fixture (standard_user is a logged-in session)
         products_page = standard_user
-        logger.info("Navigated to Products page as Standard User")
+        logger.info(f"Products in cart: {[p['name'] for p in cart_with_products]}")
 
-        # Select and add products to cart if not already done
-        if not hasattr(products_page, 'selected_products'):
-            logger.info("No products selected yet, choosing 2 random products")
-            products_page.selected_products = products_page.select_random_products(2)
-            products_page.add_products_to_cart(products_page.selected_products)
-            logger.info(f"Added products to cart: {[p['name'] for p in products_page.selected_products]}")
-
-        # Go to cart page
-        products_page.go_to_cart()
-        logger.info("Navigated to Cart page")
-
-        from pages.cart_page import CartPage
-        cart_page = CartPage(products_page.driver)
-
-        # Proceed to checkout
-        cart_page.proceed_to_checkout()
-        logger.info("Proceeded to Checkout page")
-
-        from pages.checkout_page import CheckoutPage
-        checkout_page = CheckoutPage(products_page.driver)
-
-        # Fetch checkout information from test data
-        test_data = get_test_data()
-        checkout_info = test_data["checkout_info"]
+        # Fetch checkout information from test data (cached, validated record)
+        checkout_info = get_checkout_info()
         logger.info(f"Using checkout data: {checkout_info}")
 
-        # Fill in the checkout form
-        checkout_page.fill_checkout_info(
-            checkout_info["first_name"],
-            checkout_info["last_name"],
-            checkout_info["postal_code"]
-        )
-        logger.info("Filled in checkout details")
-
-        # Continue to overview page
-        checkout_page.continue_to_overview()
-        logger.info("Navigated to Checkout: Overview page")
+        # Run the whole checkout (form filled and submitted in one script call),
+        # capturing the order summary on the overview page for reporting
+        result = CheckoutFlow(products_page.driver).run(checkout_info, screenshot="order_summary")
+        record_property("checkout_stage_ms", result["timings_ms"])
+        logger.info(f"Checkout stage timings (ms): {result['timings_ms']}")
 
-        # Verify overview page title
-        overview_title = checkout_page.get_text((By.CLASS_NAME, "title"))
-        logger.debug(f"Overview Page Title: {overview_title}")
-        assert "Checkout: Overview" in overview_title, f"Unexpected overview title: {overview_title}"
-        logger.info("Verified Overview page title successfully")
+        # Verify the cart snapshot holds the added products
+        assert sorted(name for name, _ in result["cart"]) == sorted(p['name'] for p in cart_with_products), \
+            f"Cart does not hold the added products: {result['cart']}"
 
-        # Take screenshot of order summary for reporting
-        checkout_page.take_screenshot("order_summary")
-        logger.info("Captured screenshot of order summary")
-
-        # Finish checkout process
-        checkout_page.click((By.ID, "finish"))
-        logger.info("Clicked Finish button to place order")
+        # Verify overview items and totals against the cart snapshot
+        assert not result["mismatches"], f"Checkout overview mismatches: {result['mismatches']}"
+        logger.info(f"Verified overview totals: {result['summary']}")
 
         # Verify order completion page
-        from pages.order_complete_page import OrderCompletePage
-        order_complete_page = OrderCompletePage(products_page.driver)
-        complete_header = order_complete_page.get_complete_header()
-        logger.debug(f"Order Complete Header: {complete_header}")
-        assert "Thank you for your order!" in complete_header, "Order confirmation message not found!"
+        assert "Thank you for your order!" in result["header"], "Order confirmation message not found!"
         logger.info("Order completed successfully and verified confirmation message")
 
         logger.info("===== Test Completed: Complete Checkout =====")
+
+    @pytest.mark.generated_data("order")
+    def test_checkout_generated_orders(self, standard_user, generated, record_property):
+        """
+        Test-Case-8b: Checkout with a generated basket and customer profile
+        - One case per --soak-volume (seeded by Config.DATA_SEED)
+        """
+        checkout_info, (count, seed) = generated.record
+        logger.info(f"===== Starting Test: Generated Checkout ({generated}) =====")
+
+        products_page = standard_user
+        selected_products = products_page.select_random_products(count, seed=seed)
+        products_page.add_products_to_cart(selected_products)
+        assert products_page.wait_for_cart_count(len(selected_products)), "Cart badge did not reach the basket size"
+
+        result = CheckoutFlow(products_page.driver).run(checkout_info)
+        record_property("checkout_stage_ms", result["timings_ms"])
+        assert not result["mismatches"], f"Checkout overview mismatches: {result['mismatches']}"
+        assert "Thank you for your order!" in result["header"], "Order confirmation message not found!"
+        logger.info(f"===== Test Completed: Generated Checkout ({generated}) =====")
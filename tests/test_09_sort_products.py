@@ -4,47 +4,37 @@ import logging
 # Configure logger for this test module
 logger = logging.getLogger(__name__)
 
+SORT_OPTIONS = ["Name (A to Z)", "Name (Z to A)", "Price (low to high)", "Price (high to low)"]
+
+# (user, sort option, check ids only, expected to be sorted); problem_user's sort
+# dropdown is broken and always leaves the default Name (A to Z) order in place
+SORT_CASES = (
+    [("standard_user", option, False, True) for option in SORT_OPTIONS]
+    + [("problem_user", option, False, option == "Name (A to Z)") for option in SORT_OPTIONS]
+    + [("standard_user", option, True, True) for option in SORT_OPTIONS]
+)
+
+
 class TestSorting:
-    def test_sorting_functionality(self, standard_user):
+    @pytest.mark.parametrize("username, option, by_id, expected_sorted", SORT_CASES,
+                             ids=[f"{user}-{option}" + ("-ids" if by_id else "") for user, option, by_id, _ in SORT_CASES])
+    def test_sorting_functionality(self, login_user, username, option, by_id, expected_sorted):
         """
         Test-Case-9: Validate sorting functionality on the products page
-        This test validates that the product sorting feature works correctly
-        for the following options:
-          - Name (A to Z) [default]
-          - Name (Z to A)
-          - Price (low to high)
-          - Price (high to low)
+        - One case per sort option and user (Name A-Z/Z-A, Price low-high/high-low)
+        - Selecting the option and reading (name, price) rows is one script call;
+          the order is checked in one pass, ties allowed in any order
+        - The "-ids" cases check only the displayed product ids against the
+          expected order kept in the cached catalog snapshot
+        - problem_user must be reported as unsorted for every non-default option
         """
-        logger.info("===== Starting Test: Sorting Functionality =====")
-        products_page = standard_user
-        logger.info("User logged in successfully, navigating to products page")
-
-        # Validate default sorting: Name (A to Z)
-        product_names = products_page.get_all_product_names()
-        logger.debug(f"Product names (default sorting): {product_names}")
-        assert product_names == sorted(product_names), "Products should be sorted by name (A to Z) by default"
-        logger.info("Verified sorting by Name (A to Z)")
-
-        # Validate sorting: Name (Z to A)
-        products_page.select_sort_option("Name (Z to A)")
-        product_names = products_page.get_all_product_names()
-        logger.debug(f"Product names (Z to A): {product_names}")
-        assert product_names == sorted(product_names, reverse=True), "Products should be sorted by name (Z to A)"
-        logger.info("Verified sorting by Name (Z to A)")
-
-        # Validate sorting: Price (low to high)
-        products_page.select_sort_option("Price (low to high)")
-        product_prices = products_page.get_all_product_prices()
-        logger.debug(f"Product prices (low to high): {product_prices}")
-        assert product_prices == sorted(product_prices), "Products should be sorted by price (low to high)"
-        logger.info("Verified sorting by Price (low to high)")
+        logger.info(f"===== Starting Test: Sorting Functionality ({username}, {option}) =====")
+        products_page = login_user(username)
 
-        # Validate sorting: Price (high to low)
-        products_page.select_sort_option("Price (high to low)")
-        product_prices = products_page.get_all_product_prices()
-        logger.debug(f"Product prices (high to low): {product_prices}")
-        assert product_prices == sorted(product_prices, reverse=True), "Products should be sorted by price (high to low)"
-        logger.info("Verified sorting by Price (high to low)")
+        result = products_page.verify_sort(option, by_id=by_id)
+        logger.debug(f"Rows after sorting by {option}: {result['rows']}")
+        assert result["ok"] == expected_sorted, \
+            f"Sorted by {option} should be {expected_sorted} for {username}, violations: {result['violations']}"
+        logger.info(f"Verified sorting by {option} for {username}")
 
-        logger.info("All sorting options validated successfully")
-        logger.info("===== Test Completed: Sorting Functionality =====")
+        logger.info(f"===== Test Completed: Sorting Functionality ({username}, {option}) =====")
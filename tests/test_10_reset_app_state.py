@@ -1,30 +1,16 @@
 import pytest
 import logging
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import TimeoutException
 
 # Initialize logger for this module
 logger = logging.getLogger(__name__)
 
 class TestResetAppState:
-    def test_reset_app_state(self, standard_user):
+    def test_reset_app_state(self, standard_user, cart_with_products):
         """Test-Case-10: Validate 'Reset App State' functionality"""
         logger.info("===== Starting Test: Reset App State =====")
         products_page = standard_user
         
-        # Add some products if none selected
-        if not hasattr(products_page, 'selected_products'):
-            logger.info("Selecting 2 random products before reset test")
-            products_page.selected_products = products_page.select_random_products(2)
-        
-        logger.info(f"Adding {len(products_page.selected_products)} products to cart before reset")
-        products_page.add_products_to_cart(products_page.selected_products)
-        
-        # Wait for cart update
-        WebDriverWait(products_page.driver, 10).until(
-            lambda driver: products_page.get_cart_count() > 0
-        )
-        
         # Verify cart has items
         cart_count = products_page.get_cart_count()
         logger.info(f"Cart count before reset: {cart_count}")
@@ -32,19 +18,17 @@ class TestResetAppState:
         
         # Perform reset app state
         logger.info("Performing 'Reset App State'")
-        success = products_page.reset_app_state()
+        success = products_page.reset_app_state(via_ui=True)
         if success:
             logger.info("Reset App State executed successfully")
         else:
             logger.warning("Reset App State may not have executed correctly")
         
-        # Wait until cart count is reset to 0
-        WebDriverWait(products_page.driver, 10).until(
-            lambda driver: products_page.get_cart_count() == 0
-        )
+        # Wait in the page until the cart badge is gone
+        assert products_page.wait_for_cart_to_be_empty(), "Cart should be empty after reset"
         
-        cart_count_after_reset = products_page.get_cart_count()
-        logger.info(f"Cart count after reset: {cart_count_after_reset}")
-        assert cart_count_after_reset == 0, f"Cart should be empty after reset, but has {cart_count_after_reset} items"
+        history = [entry['count'] for entry in products_page.get_cart_history()]
+        logger.info(f"Cart count history: {history}")
+        assert history[-1] == 0, f"Cart should be empty after reset, history: {history}"
         
         logger.info("===== Test Passed: Reset App State functionality works correctly =====")
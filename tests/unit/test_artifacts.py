@@ -0,0 +1,36 @@
+import base64
+import pytest
+from utils import artifacts
+from utils.artifacts import close_pipeline, get_pipeline, handles_for, set_current_test
+
+PNG = base64.b64encode(b"\x89PNG\r\n\x1a\n not really an image").decode()
+
+
+class FakeDriver:
+    def get_screenshot_as_base64(self):
+        return PNG
+
+
+@pytest.fixture
+def no_pipeline(monkeypatch, tmp_path):
+    monkeypatch.setattr(artifacts, "_pipeline", None)
+    monkeypatch.setattr(artifacts, "_current_test", None)
+    monkeypatch.setattr(artifacts.Config, "SCREENSHOT_PATH", str(tmp_path / "screenshots"))
+    yield
+    close_pipeline(evict=False)
+
+
+class TestLazyPipeline:
+    def test_tracking_tests_does_not_start_a_pipeline(self, no_pipeline):
+        """Test start/teardown hooks must not create the thread pool or read the store index"""
+        set_current_test("tests/test_a.py::test_a")
+        assert handles_for("tests/test_a.py::test_a") == []
+        assert artifacts._pipeline is None
+
+    def test_screenshots_are_attributed_to_the_current_test(self, no_pipeline):
+        set_current_test("tests/test_a.py::test_a")
+        handle = get_pipeline().screenshot(FakeDriver(), "step")
+        assert handle.test == "tests/test_a.py::test_a"
+        handle.result(timeout=10)
+        assert handles_for("tests/test_a.py::test_a") == [handle]
+        assert handles_for("tests/test_a.py::test_a") == []
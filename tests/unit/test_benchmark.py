@@ -0,0 +1,59 @@
+import pytest
+from utils.benchmark import BenchmarkHistory, percentile
+
+
+def result(name="op", p50=10.0, p95=12.0, p99=15.0, commands=3):
+    return {"name": name, "p50_ms": p50, "p95_ms": p95, "p99_ms": p99, "commands": commands}
+
+
+@pytest.fixture
+def history(tmp_path):
+    history = BenchmarkHistory(path=str(tmp_path / "history.json"), threshold=0.25, tail_threshold=0.5)
+    history.data["baseline"]["op"] = result()
+    return history
+
+
+class TestBenchmarkHistoryCompare:
+    def test_within_thresholds(self, history):
+        """Growth below the thresholds is not a regression"""
+        assert history.compare(result(p50=12.4, p95=14.9, p99=22.4)) == []
+
+    def test_latency_regressions(self, history):
+        """p50/p95 are gated by the threshold, p99 by the looser tail threshold"""
+        regressions = history.compare(result(p50=12.6, p99=22.6))
+        assert len(regressions) == 2
+        assert regressions[0].startswith("op p50_ms")
+        assert regressions[1].startswith("op p99_ms")
+
+    def test_any_extra_command_is_a_regression(self, history):
+        """Command counts are deterministic, so one more command fails"""
+        assert history.compare(result(commands=4)) == ["op commands: 4 > baseline 3"]
+
+    def test_without_baseline(self, history):
+        """A metric without a baseline (or a baseline without p99) is not gated"""
+        assert history.compare(result(name="new", p50=1000)) == []
+        del history.data["baseline"]["op"]["p99_ms"]
+        assert history.compare(result(p99=1000)) == []
+
+    def test_first_save_sets_the_baseline(self, tmp_path):
+        """A new metric becomes the baseline; later saves only append runs"""
+        history = BenchmarkHistory(path=str(tmp_path / "history.json"))
+        history.add(dict(result(), samples_ms=[10.0]))
+        history.save()
+        history.add(result(p50=20.0))
+        history.save()
+
+        reloaded = BenchmarkHistory(path=str(tmp_path / "history.json"))
+        assert reloaded.data["baseline"]["op"]["p50_ms"] == 10.0
+        assert "samples_ms" not in reloaded.data["baseline"]["op"]
+        assert len(reloaded.data["runs"]) == 2
+
+
+class TestPercentile:
+    def test_interpolates_between_samples(self):
+        assert percentile([1, 2, 3, 4], 50) == 2.5
+        assert percentile([5], 99) == 5
+
+    def test_needs_samples(self):
+        with pytest.raises(ValueError):
+            percentile([], 50)
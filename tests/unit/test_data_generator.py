@@ -0,0 +1,50 @@
+from utils.data_generator import ERRORS, DataGenerator
+from utils.data_reader import CheckoutInfo, LazyDataset, User, get_users
+
+
+class TestDataGenerator:
+    def test_same_seed_same_records(self):
+        """Every record is a pure function of (seed, kind, index)"""
+        first, second = DataGenerator(seed=7), DataGenerator(seed=7)
+        for kind in DataGenerator.KINDS:
+            assert [first.generate(kind, i) for i in range(50)] == [second.generate(kind, i) for i in range(50)]
+
+    def test_records_do_not_depend_on_generation_order(self):
+        generator = DataGenerator(seed=7)
+        forward = [generator.checkout_profile(i) for i in range(20)]
+        backward = [generator.checkout_profile(i) for i in reversed(range(20))]
+        assert forward == backward[::-1]
+
+    def test_other_seed_other_records(self):
+        assert ([DataGenerator(seed=1).checkout_profile(i) for i in range(20)]
+                != [DataGenerator(seed=2).checkout_profile(i) for i in range(20)])
+
+    def test_invalid_credentials_never_log_in(self):
+        """Every generated credential has an expected error, and permutations come first"""
+        generator = DataGenerator(seed=7)
+        permutations = generator.credential_permutations()
+        for index in range(len(permutations) + 20):
+            user, expected_error = generator.invalid_credentials(index)
+            assert expected_error in ERRORS.values()
+            if index < len(permutations):
+                assert (user.username, user.password) == permutations[index]
+
+    def test_expected_error(self):
+        users = {user.username: user for user in get_users()}
+        locked = next(user for user in users.values() if user.expected_result == "failure")
+        valid = next(user for user in users.values() if user.expected_result == "success")
+        assert DataGenerator.expected_error("", "x") == ERRORS["username_required"]
+        assert DataGenerator.expected_error("x", "") == ERRORS["password_required"]
+        assert DataGenerator.expected_error("nobody", valid.password) == ERRORS["no_match"]
+        assert DataGenerator.expected_error(locked.username, locked.password) == ERRORS["locked_out"]
+        assert DataGenerator.expected_error(valid.username, valid.password) is None
+
+    def test_export_round_trips_through_lazy_dataset(self, tmp_path):
+        generator = DataGenerator(seed=7)
+        for extension in ("jsonl", "csv"):
+            path = generator.export("checkout_profile", 25, str(tmp_path / f"checkout.{extension}"))
+            dataset = LazyDataset(path, CheckoutInfo)
+            assert len(dataset) == 25
+            assert dataset[17] == generator.checkout_profile(17)
+        path = generator.export("invalid_credentials", 5, str(tmp_path / "invalid.jsonl"))
+        assert LazyDataset(path, User)[3] == generator.invalid_credentials(3)[0]
@@ -0,0 +1,81 @@
+import json
+import pytest
+from utils.data_reader import (CheckoutInfo, DataValidationError, DatasetCase, LazyDataset, User,
+                               build_record, get_test_data, get_users, load_json)
+
+
+class TestBuildRecord:
+    def test_builds_typed_record(self):
+        user = build_record(User, {"username": "a", "password": "b", "expected_result": "success"}, "users[0]")
+        assert user == User("a", "b", "success")
+        assert user["username"] == "a"
+
+    @pytest.mark.parametrize("data, message", [
+        ({"username": "a"}, "missing fields ['password']"),
+        ({"username": "a", "password": "b", "role": "x"}, "unknown fields ['role']"),
+        ({"username": "a", "password": 1}, "users[0].password: expected str"),
+        ({"username": "a", "password": "b", "expected_result": "maybe"}, "must be 'success' or 'failure'"),
+        (["a", "b"], "expected an object, got list"),
+    ])
+    def test_rejects_invalid_data(self, data, message):
+        """Schema errors name the file position and the problem"""
+        with pytest.raises(DataValidationError, match=message.replace("[", r"\[").replace("]", r"\]")):
+            build_record(User, data, "users[0]")
+
+    def test_validation_error_is_a_value_error(self):
+        with pytest.raises(ValueError):
+            build_record(CheckoutInfo, {"first_name": "a"}, "checkout_info")
+
+
+class TestCachedLoaders:
+    def test_bundled_data_is_valid(self):
+        assert all(isinstance(user, User) for user in get_users())
+
+    def test_load_json_returns_a_copy(self, tmp_path):
+        """Modifying a loaded document does not change what the next call returns"""
+        path = tmp_path / "data.json"
+        path.write_text(json.dumps({"items": [1, 2]}))
+        load_json(str(path))["items"].append(3)
+        assert load_json(str(path)) == {"items": [1, 2]}
+        get_test_data()["checkout_info"]["first_name"] = "changed"
+        assert get_test_data()["checkout_info"]["first_name"] != "changed"
+
+
+class TestLazyDataset:
+    def test_jsonl_offsets_skip_blank_lines(self, tmp_path):
+        """Each record's offset points at its line; blank lines are not records"""
+        lines = [json.dumps({"username": f"user{i}", "password": "pw"}) for i in range(3)]
+        path = tmp_path / "users.jsonl"
+        path.write_text(lines[0] + "\n\n" + lines[1] + "\n" + lines[2] + "\n")
+
+        dataset = LazyDataset(str(path), User)
+        assert list(dataset.offsets) == [0, len(lines[0]) + 2, len(lines[0]) + len(lines[1]) + 3]
+        assert len(dataset) == 3
+        assert dataset[2].username == "user2"
+        assert [user.username for user in dataset] == ["user0", "user1", "user2"]
+
+    def test_csv_rows_use_the_header(self, tmp_path):
+        path = tmp_path / "checkout.csv"
+        path.write_text("first_name,last_name,postal_code\nJohn,Doe,123\nZoë,Müller,4567\n", encoding="utf-8")
+
+        dataset = LazyDataset(str(path), CheckoutInfo)
+        assert len(dataset) == 2
+        assert dataset[1] == CheckoutInfo("Zoë", "Müller", "4567")
+
+    def test_rows_are_validated_when_read(self, tmp_path):
+        """A bad row fails only when it is accessed, with its position in the message"""
+        path = tmp_path / "users.jsonl"
+        path.write_text('{"username": "a", "password": "b"}\n{"username": "a"}\n')
+
+        dataset = LazyDataset(str(path), User)
+        assert dataset[0].username == "a"
+        with pytest.raises(DataValidationError, match=r"users.jsonl\[1\]"):
+            dataset[1]
+
+    def test_dataset_case_reads_its_row_once(self, tmp_path):
+        path = tmp_path / "users.jsonl"
+        path.write_text('{"username": "a", "password": "b"}\n')
+
+        case = DatasetCase(LazyDataset(str(path), User), 0)
+        assert repr(case) == "users-000000"
+        assert case.record is case.record
@@ -0,0 +1,147 @@
+import os
+import threading
+import time
+import pytest
+from types import SimpleNamespace
+from config.config import Config
+from utils import driver_resolver
+from utils.driver_resolver import DriverResolver, FileLock, major_version
+
+
+class TestFileLock:
+    def test_excludes_other_holders(self, tmp_path):
+        """A second holder waits until the first releases the lock"""
+        path = str(tmp_path / "test.lock")
+        events = []
+
+        def hold():
+            with FileLock(path):
+                events.append("second")
+
+        with FileLock(path):
+            thread = threading.Thread(target=hold)
+            thread.start()
+            time.sleep(0.3)
+            events.append("first")
+        thread.join(timeout=5)
+        assert events == ["first", "second"]
+        assert not os.path.exists(path)
+
+    def test_times_out(self, tmp_path):
+        path = str(tmp_path / "test.lock")
+        with FileLock(path):
+            with pytest.raises(TimeoutError):
+                with FileLock(path, timeout=0.2):
+                    pass
+
+    def test_removes_stale_lock(self, tmp_path):
+        """A lock file older than 'stale_after' is treated as abandoned"""
+        path = str(tmp_path / "test.lock")
+        open(path, "w").close()
+        os.utime(path, (time.time() - 600, time.time() - 600))
+        with FileLock(path, timeout=1, stale_after=300):
+            pass
+
+
+@pytest.fixture
+def browser(tmp_path, monkeypatch):
+    """Stand-in for the installed browser: its binary, its version and how often it was probed"""
+    installed = SimpleNamespace(binary=str(tmp_path / "chrome"), version="120.0.6099.71", probes=0)
+    open(installed.binary, "w").close()
+
+    def probe(browser):
+        installed.probes += 1
+        return installed.version
+
+    monkeypatch.setattr(driver_resolver, "browser_binary", lambda browser: installed.binary)
+    monkeypatch.setattr(driver_resolver, "installed_browser_version", probe)
+    return installed
+
+
+def update(browser, version):
+    """Install another browser version: new version string and a newer binary mtime"""
+    browser.version = version
+    later = os.path.getmtime(browser.binary) + 60
+    os.utime(browser.binary, (later, later))
+
+
+@pytest.fixture
+def resolver(tmp_path, browser):
+    (tmp_path / "drivers").mkdir()
+    return DriverResolver(cache_dir=str(tmp_path / "drivers"))
+
+
+@pytest.fixture
+def driver_binary(tmp_path):
+    path = tmp_path / "chromedriver"
+    path.write_text("")
+    return str(path)
+
+
+class TestDriverResolver:
+    def test_resolves_once_and_pins(self, resolver, driver_binary, monkeypatch):
+        """The first resolution is pinned in the manifest; later ones read it"""
+        calls = []
+
+        def resolve_online(browser, installed_version):
+            calls.append(browser)
+            return resolver._entry(driver_binary, "120.0.6099.71", "webdriver_manager")
+
+        monkeypatch.setattr(resolver, "_resolve_online", resolve_online)
+        assert resolver.resolve("Chrome") == driver_binary
+        assert DriverResolver(resolver.cache_dir).resolve("chrome") == driver_binary
+        assert calls == ["chrome"]
+
+    def test_major_version_change_resolves_again(self, resolver, browser, driver_binary):
+        """A pin made for another browser major version is not reused"""
+        resolver._write_manifest({"chrome": resolver._entry(driver_binary, "119.0.6045.105", "webdriver_manager")})
+        assert resolver._cached_entry("chrome", resolver.installed_version("chrome")) is None
+        update(browser, "119.0.6045.200")
+        assert resolver._cached_entry("chrome", resolver.installed_version("chrome"))["path"] == driver_binary
+
+    def test_falls_back_to_path_then_selenium_manager(self, resolver, driver_binary, monkeypatch):
+        monkeypatch.setattr(resolver, "_resolve_online", lambda browser, installed_version: None)
+        monkeypatch.setattr(driver_resolver.shutil, "which", lambda name: None)
+        assert resolver.resolve("chrome") is None
+
+        monkeypatch.setattr(driver_resolver.shutil, "which", lambda name: driver_binary)
+        assert resolver.resolve("chrome") == driver_binary
+        assert resolver._read_manifest()["chrome"]["source"] == "PATH"
+
+    def test_invalidate(self, resolver, driver_binary):
+        resolver._write_manifest({"chrome": resolver._entry(driver_binary, None, "PATH"),
+                                  "firefox": resolver._entry(driver_binary, None, "PATH")})
+        resolver.invalidate("Chrome")
+        assert list(resolver._read_manifest()) == ["firefox"]
+        resolver.invalidate()
+        assert resolver._read_manifest() == {}
+
+    def test_installed_version_probed_once_per_binary(self, resolver, browser):
+        """Every resolver (process) reads the probed version from the manifest until the binary changes"""
+        assert resolver.installed_version("chrome") == "120.0.6099.71"
+        assert DriverResolver(resolver.cache_dir).installed_version("chrome") == "120.0.6099.71"
+        assert browser.probes == 1
+
+        update(browser, "121.0.6167.85")
+        assert DriverResolver(resolver.cache_dir).installed_version("chrome") == "121.0.6167.85"
+        assert browser.probes == 2
+
+    def test_installed_version_ttl_without_binary(self, resolver, browser, monkeypatch):
+        """When the browser binary cannot be located the probe is reused for BROWSER_VERSION_TTL"""
+        monkeypatch.setattr(driver_resolver, "browser_binary", lambda browser: None)
+        resolver.installed_version("chrome")
+        resolver.installed_version("chrome")
+        assert browser.probes == 1
+        monkeypatch.setattr(Config, "BROWSER_VERSION_TTL", 0)
+        resolver.installed_version("chrome")
+        assert browser.probes == 2
+
+    def test_invalidate_probes_again(self, resolver, browser):
+        resolver.installed_version("chrome")
+        resolver.invalidate("chrome")
+        resolver.installed_version("chrome")
+        assert browser.probes == 2
+
+    def test_major_version(self):
+        assert major_version("120.0.6099.71") == "120"
+        assert major_version(None) is None
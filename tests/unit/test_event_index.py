@@ -0,0 +1,42 @@
+import json
+from utils import event_index
+
+
+def event(action, **fields):
+    return json.dumps({"ts": "2026-01-01T10:00:00.000", "run": "run1", "worker": "gw0", "action": action, **fields}) + "\n"
+
+
+class TestEventIndexBuild:
+    def test_only_new_complete_lines_are_indexed(self, tmp_path):
+        """Each build reads from the stored offset and leaves a partial last line for the next one"""
+        path = tmp_path / "events" / "run1" / "gw0.jsonl"
+        path.parent.mkdir(parents=True)
+        connection = event_index.connect(str(tmp_path / "index.sqlite"))
+        directory = str(tmp_path / "events")
+
+        path.write_text(event("a") + event("b"))
+        assert event_index.build(connection, directory) == 2
+        assert event_index.build(connection, directory) == 0
+
+        partial = event("d")
+        with open(path, "a") as file:
+            file.write(event("c") + partial[:10])
+        assert event_index.build(connection, directory) == 1
+        offset = connection.execute("SELECT offset FROM files").fetchone()[0]
+        assert offset == len((event("a") + event("b") + event("c")).encode())
+
+        with open(path, "a") as file:
+            file.write(partial[10:])
+        assert event_index.build(connection, directory) == 1
+        actions = [row[0] for row in connection.execute("SELECT action FROM events ORDER BY rowid")]
+        assert actions == ["a", "b", "c", "d"]
+
+    def test_files_are_tracked_separately(self, tmp_path):
+        directory = tmp_path / "events"
+        for worker in ("gw0", "gw1"):
+            (directory / "run1").mkdir(parents=True, exist_ok=True)
+            (directory / "run1" / f"{worker}.jsonl").write_text(event("test.call", worker=worker, duration_ms=5))
+        connection = event_index.connect(str(tmp_path / "index.sqlite"))
+
+        assert event_index.build(connection, str(directory)) == 2
+        assert connection.execute("SELECT COUNT(*) FROM files").fetchone()[0] == 2
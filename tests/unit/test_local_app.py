@@ -0,0 +1,20 @@
+import pytest
+from local_app.server import LocalApp
+
+
+class TestLocalApp:
+    def test_bind_error_is_raised_from_start(self):
+        """Starting on a port already in use fails instead of hanging"""
+        app = LocalApp(host="127.0.0.1", port=0).start()
+        try:
+            with pytest.raises(OSError):
+                LocalApp(host="127.0.0.1", port=app.port).start(timeout=5)
+        finally:
+            app.stop()
+
+    @pytest.mark.parametrize("path", ["/../server.py", "/../static_evil/x", "/missing.html"])
+    def test_static_files_stay_inside_the_static_directory(self, path):
+        assert LocalApp()._read_static(path) is None
+
+    def test_static_file_is_served(self):
+        assert LocalApp()._read_static("/index.html")
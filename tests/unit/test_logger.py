@@ -0,0 +1,94 @@
+import logging
+import queue
+import threading
+import time
+from config.config import Config
+from utils.logger import DroppingQueueHandler, build_handlers
+
+
+def record(level, message="message"):
+    return logging.LogRecord("test", level, __file__, 1, message, None, None)
+
+
+class TestDroppingQueueHandler:
+    def test_records_below_warning_are_dropped_when_full(self):
+        """A full queue drops DEBUG/INFO records and counts them instead of blocking"""
+        handler = DroppingQueueHandler(queue.Queue(maxsize=1))
+        handler.emit(record(logging.INFO, "kept"))
+        handler.emit(record(logging.INFO, "dropped"))
+        handler.emit(record(logging.DEBUG, "dropped"))
+
+        assert handler.dropped == 2
+        assert handler.queue.get_nowait().getMessage() == "kept"
+        assert handler.queue.empty()
+
+    def test_warnings_wait_for_space(self):
+        """WARNING and above block until the listener frees a slot, so they are never lost"""
+        handler = DroppingQueueHandler(queue.Queue(maxsize=1))
+        handler.emit(record(logging.INFO, "first"))
+
+        def drain():
+            time.sleep(0.3)
+            handler.queue.get()
+
+        thread = threading.Thread(target=drain)
+        thread.start()
+        start = time.monotonic()
+        handler.emit(record(logging.ERROR, "failure"))
+        waited = time.monotonic() - start
+        thread.join()
+
+        assert waited >= 0.2
+        assert handler.dropped == 0
+        assert handler.queue.get_nowait().getMessage() == "failure"
+
+    def test_tracebacks_are_rendered_before_enqueueing(self):
+        """The exception is formatted on the calling thread, while it still exists"""
+        handler = DroppingQueueHandler(queue.Queue())
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            import sys
+            failing = logging.LogRecord("test", logging.ERROR, __file__, 1, "failed", None, sys.exc_info())
+        handler.emit(failing)
+
+        queued = handler.queue.get_nowait()
+        assert queued.exc_info is None
+        assert "ValueError: boom" in queued.exc_text
+
+
+class TestBatchedFileOutput:
+    def test_records_reach_the_file_in_batches(self, tmp_path, monkeypatch):
+        """The file handler writes once LOG_BATCH_SIZE records are buffered"""
+        monkeypatch.setattr(Config, "LOG_BATCH_SIZE", 3)
+        log_file = tmp_path / "worker.log"
+        _, batched = build_handlers(str(log_file), logging.DEBUG)
+        try:
+            batched.handle(record(logging.INFO, "one"))
+            batched.handle(record(logging.INFO, "two"))
+            assert log_file.read_text() == ""
+            batched.handle(record(logging.INFO, "three"))
+            assert log_file.read_text().count("\n") == 3
+        finally:
+            batched.close()
+
+    def test_errors_flush_immediately(self, tmp_path, monkeypatch):
+        """An ERROR record flushes the buffer, together with the records before it"""
+        monkeypatch.setattr(Config, "LOG_BATCH_SIZE", 100)
+        log_file = tmp_path / "worker.log"
+        _, batched = build_handlers(str(log_file), logging.DEBUG)
+        try:
+            batched.handle(record(logging.INFO, "context"))
+            batched.handle(record(logging.ERROR, "failure"))
+            lines = log_file.read_text().splitlines()
+            assert [line.rsplit(" - ", 1)[1] for line in lines] == ["context", "failure"]
+        finally:
+            batched.close()
+
+    def test_close_flushes_the_remainder(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(Config, "LOG_BATCH_SIZE", 100)
+        log_file = tmp_path / "worker.log"
+        _, batched = build_handlers(str(log_file), logging.DEBUG)
+        batched.handle(record(logging.INFO, "pending"))
+        batched.close()
+        assert "pending" in log_file.read_text()
@@ -0,0 +1,58 @@
+import os
+from config.config import Config
+from utils.logger import merge_logs
+
+
+def write_log(path, lines):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("".join(line + "\n" for line in lines))
+
+
+class TestMergeLogs:
+    def test_records_are_interleaved_by_timestamp(self, tmp_path, monkeypatch):
+        """Records of every worker file end up in one file, ordered by timestamp"""
+        monkeypatch.setattr(Config, "LOG_PATH", str(tmp_path))
+        write_log(str(tmp_path / "run1" / "gw0.log"), [
+            "2026-01-01 10:00:00,100 - a - INFO - first",
+            "2026-01-01 10:00:00,300 - a - INFO - third",
+        ])
+        write_log(str(tmp_path / "run1" / "gw1.log"), [
+            "2026-01-01 10:00:00,200 - b - INFO - second",
+            "2026-01-01 10:00:00,400 - b - INFO - fourth",
+        ])
+
+        merged = merge_logs("run1")
+
+        with open(merged, encoding="utf-8") as file:
+            messages = [line.rsplit(" - ", 1)[1].strip() for line in file]
+        assert messages == ["first", "second", "third", "fourth"]
+        assert merged == os.path.join(str(tmp_path), "test_execution_run1.log")
+
+    def test_tracebacks_stay_with_their_record(self, tmp_path, monkeypatch):
+        """Continuation lines (tracebacks) are not separated from the record they belong to"""
+        monkeypatch.setattr(Config, "LOG_PATH", str(tmp_path))
+        write_log(str(tmp_path / "run1" / "gw0.log"), [
+            "2026-01-01 10:00:00,100 - a - ERROR - failed",
+            "Traceback (most recent call last):",
+            "ValueError: boom",
+        ])
+        write_log(str(tmp_path / "run1" / "gw1.log"), [
+            "2026-01-01 10:00:00,200 - b - INFO - later",
+        ])
+
+        with open(merge_logs("run1"), encoding="utf-8") as file:
+            lines = file.read().splitlines()
+        assert lines[1:3] == ["Traceback (most recent call last):", "ValueError: boom"]
+        assert lines[3].endswith("later")
+
+    def test_parts_are_removed_unless_kept(self, tmp_path, monkeypatch):
+        """remove_parts deletes the per-process files; without logs nothing is written"""
+        monkeypatch.setattr(Config, "LOG_PATH", str(tmp_path))
+        write_log(str(tmp_path / "run1" / "master.log"), ["2026-01-01 10:00:00,100 - a - INFO - only"])
+
+        merge_logs("run1", remove_parts=False)
+        assert os.path.exists(tmp_path / "run1" / "master.log")
+        merge_logs("run1")
+        assert not os.path.exists(tmp_path / "run1")
+        assert merge_logs("run2") is None
@@ -0,0 +1,68 @@
+import json
+import pytest
+from config.config import Config
+from utils.network_policy import NetworkBlocker
+
+
+def log_entry(method, **params):
+    return {"message": json.dumps({"message": {"method": method, "params": params}})}
+
+
+def loaded(request_id, url, size):
+    return [log_entry("Network.requestWillBeSent", requestId=request_id, request={"url": url}),
+            log_entry("Network.loadingFinished", requestId=request_id, encodedDataLength=size)]
+
+
+def blocked(request_id, url):
+    return [log_entry("Network.requestWillBeSent", requestId=request_id, request={"url": url}),
+            log_entry("Network.loadingFailed", requestId=request_id, blockedReason="inspector")]
+
+
+class FakeDriver:
+    def __init__(self, entries):
+        self.entries = entries
+
+    def execute_cdp_cmd(self, command, params):
+        return {}
+
+    def get_log(self, log_type):
+        entries, self.entries = self.entries, []
+        return entries
+
+
+@pytest.fixture(autouse=True)
+def no_known_sizes(monkeypatch):
+    monkeypatch.setattr(NetworkBlocker, "_known_sizes", {})
+    monkeypatch.setattr(Config, "NETWORK_ESTIMATE_SIZES", False)
+
+
+class TestNetworkBlocker:
+    def test_sizes_learned_from_unblocked_loads(self):
+        NetworkBlocker(FakeDriver(loaded("1", "https://a/img.png", 2048))).collect()
+        blocker = NetworkBlocker(FakeDriver(blocked("2", "https://a/img.png"))).collect()
+        assert (blocker.blocked_requests, blocker.blocked_bytes, blocker.unsized_requests) == (1, 2048, 0)
+        assert "Avoided transfer: 2.0 KB" in blocker.summary()
+
+    def test_unknown_sizes_are_not_reported_as_zero(self):
+        """Without a known size (and no HEAD estimate) the avoided transfer is unknown, not 0 KB"""
+        blocker = NetworkBlocker(FakeDriver(blocked("1", "https://a/x.png") + blocked("2", "https://a/y.png")))
+        blocker.collect()
+        assert (blocker.blocked_requests, blocker.blocked_bytes, blocker.unsized_requests) == (2, 0, 2)
+        assert "Avoided transfer: unknown" in blocker.summary()
+        assert "0.0 KB" not in blocker.summary()
+
+    def test_format_avoided(self):
+        assert NetworkBlocker.format_avoided(0, 0, 0) == "0.0 KB"
+        assert NetworkBlocker.format_avoided(3, 1024, 1) == "at least 1.0 KB (1 of 3 requests of unknown size)"
+        assert NetworkBlocker.format_avoided(3, 0, 3).startswith("unknown")
+
+
+class TestPerformanceLogCapability:
+    @pytest.mark.parametrize("browser, capability", [("chrome", "goog:loggingPrefs"), ("edge", "ms:loggingPrefs")])
+    def test_vendor_specific_logging_prefs(self, monkeypatch, browser, capability):
+        """msedgedriver reads the performance log preference from ms:loggingPrefs"""
+        monkeypatch.setattr(Config, "NETWORK_PERFORMANCE_LOG", True)
+        capabilities = Config.get_browser_options(browser).to_capabilities()
+        assert capabilities[capability] == {"performance": "ALL"}
+        other = ({"goog:loggingPrefs", "ms:loggingPrefs"} - {capability}).pop()
+        assert other not in capabilities
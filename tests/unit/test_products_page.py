@@ -0,0 +1,84 @@
+from types import SimpleNamespace
+from config.config import Config
+from pages.products_page import ProductsPage, collation_key
+
+
+PRODUCTS = (
+    {"id": 4, "name": "Backpack", "price": 29.99},
+    {"id": 0, "name": "Bike Light", "price": 9.99},
+    {"id": 1, "name": "Bolt T-Shirt", "price": 15.99},
+    {"id": 2, "name": "Onesie", "price": 7.99},
+    {"id": 3, "name": "Red T-Shirt", "price": 15.99},
+)
+
+
+class TestExpectedOrder:
+    def test_groups_ties(self):
+        """Products with equal sort values share one tie group"""
+        assert ProductsPage.expected_order(PRODUCTS, "lohi") == ((2,), (0,), (1, 3), (4,))
+        assert ProductsPage.expected_order(PRODUCTS, "za") == ((3,), (2,), (1,), (0,), (4,))
+
+    def test_id_order_violations(self):
+        """Ids within a tie group may appear in any order; anything else is reported"""
+        order = ProductsPage.expected_order(PRODUCTS, "hilo")
+        assert ProductsPage.id_order_violations([4, 3, 1, 0, 2], order) == []
+        assert ProductsPage.id_order_violations([4, 1, 3, 0, 2], order) == []
+        assert ProductsPage.id_order_violations([4, 3, 0, 1, 2], order) == [
+            {"index": 2, "expected": (1, 3), "actual": 0},
+            {"index": 3, "expected": (0,), "actual": 1},
+        ]
+
+    def test_missing_extra_and_repeated_ids(self):
+        order = ProductsPage.expected_order(PRODUCTS, "lohi")
+        assert ProductsPage.id_order_violations([2, 0, 1, 3], order) == [
+            {"index": 4, "expected": (4,), "actual": None}]
+        assert ProductsPage.id_order_violations([2, 0, 1, 3, 4, 5], order) == [
+            {"index": 5, "expected": (), "actual": 5}]
+        assert ProductsPage.id_order_violations([2, 0, 1, 1, 4], order) == [
+            {"index": 3, "expected": (), "actual": 1}]
+
+
+class TestSortViolations:
+    def test_ties_allowed_unless_stable(self):
+        rows = [("Onesie", 7.99), ("Red T-Shirt", 15.99), ("Bolt T-Shirt", 15.99)]
+        assert ProductsPage.sort_violations(rows, "lohi") == []
+        assert ProductsPage.sort_violations(rows, "lohi", stable=True) == [
+            {"index": 2, "previous": rows[1], "current": rows[2]}]
+
+    def test_descending(self):
+        rows = [("b", 1.0), ("a", 2.0)]
+        assert ProductsPage.sort_violations(rows, "za") == []
+        assert len(ProductsPage.sort_violations(rows, "hilo")) == 1
+
+
+class TestCatalogKey:
+    def page(self, **driver):
+        page = ProductsPage.__new__(ProductsPage)
+        page.driver = SimpleNamespace(**driver)
+        return page
+
+    def test_keyed_on_application_and_user(self):
+        """The key needs no browser round trip and changes with the logged-in user"""
+        assert self.page(session_user="standard_user").catalog_key() == (Config.BASE_URL, "standard_user")
+        assert self.page(session_user="problem_user").catalog_key() == (Config.BASE_URL, "problem_user")
+
+    def test_no_key_without_a_known_user(self):
+        """A driver nobody is known to be logged in on bypasses the cache"""
+        assert self.page().catalog_key() is None
+        assert self.page(session_user=None).catalog_key() is None
+
+
+class TestCollation:
+    def test_collation_key_order(self):
+        """Base letters first, then accents, then case"""
+        names = ["eclair", "Banana", "éclair", "apple", "Eclair"]
+        assert sorted(names, key=collation_key) == ["apple", "Banana", "Eclair", "eclair", "éclair"]
+
+    def test_sort_check_with_collation(self):
+        """verify_sort(collation=True) accepts dictionary order that code point order rejects"""
+        rows = [("apple", 1.0), ("Banana", 1.0), ("Eclair", 1.0), ("éclair", 1.0)]
+        assert ProductsPage.sort_violations(rows, "az", collation=True) == []
+        assert ProductsPage.sort_violations(rows, "az") == [
+            {"index": 1, "previous": rows[0], "current": rows[1]}]
+        assert ProductsPage.sort_violations(rows[::-1], "za", collation=True) == []
+        assert len(ProductsPage.sort_violations(rows[::-1], "az", collation=True)) == 3
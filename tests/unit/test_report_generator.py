@@ -0,0 +1,23 @@
+from utils.report_generator import StreamingReportWriter
+
+
+class TestStreamingReportWriter:
+    def test_counts_and_summary(self, tmp_path):
+        writer = StreamingReportWriter(str(tmp_path / "report.html"))
+        writer.add({"name": "test_a", "status": "passed", "duration": 0.5})
+        writer.add({"name": "test_b", "status": "failed", "duration": 1.0, "error": "AssertionError"})
+        writer.close()
+        assert writer.counts == {"total": 2, "passed": 1, "failed": 1, "skipped": 0}
+        content = (tmp_path / "report.html").read_text()
+        assert "Status:         complete" in content
+        assert "Error: AssertionError" in content
+
+    def test_unknown_status_is_counted_in_the_total(self, tmp_path):
+        """Statuses outside passed/failed/skipped (e.g. xfailed) do not raise"""
+        writer = StreamingReportWriter(str(tmp_path / "report.html"))
+        writer.add({"name": "test_x", "status": "xfailed", "duration": 0.1})
+        writer.add({"name": "test_y", "status": "xfailed", "duration": 0.1})
+        writer.close()
+        assert writer.counts["total"] == 2
+        assert writer.counts["xfailed"] == 2
+        assert "Total Tests:           2" in (tmp_path / "report.html").read_text()
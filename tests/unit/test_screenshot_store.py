@@ -0,0 +1,109 @@
+import os
+import pytest
+from config.config import Config
+from utils import screenshot_store
+from utils.screenshot_store import ScreenshotStore, bands, hamming
+
+
+@pytest.fixture
+def store_root(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "SCREENSHOT_DHASH_DISTANCE", 0)
+    monkeypatch.setattr(Config, "SCREENSHOT_KEEP_RUNS", 20)
+    monkeypatch.setattr(Config, "SCREENSHOT_MAX_BYTES", 10 * 1024 * 1024)
+    return str(tmp_path)
+
+
+def blob_files(root):
+    return sorted(name for _, _, names in os.walk(os.path.join(root, "blobs")) for name in names)
+
+
+class TestScreenshotStoreDedup:
+    def test_identical_images_share_one_blob(self, store_root):
+        """The same bytes are written once and referenced by every entry"""
+        store = ScreenshotStore(store_root, "run1")
+        first = store.put(b"image-a", "png", "test_x", "step1")
+        second = store.put(b"image-a", "png", "test_y", "step1")
+        third = store.put(b"image-b", "png", "test_y", "step2")
+        store.close(evict=False)
+
+        assert first == second != third
+        assert len(blob_files(store_root)) == 2
+        index = store._read_index()
+        assert [entry["hash"] for entry in index["runs"][0]["entries"]] == [first, second, third]
+
+    def test_near_duplicates_are_opt_in(self, store_root, monkeypatch):
+        """Similar dHashes reuse a blob only with SCREENSHOT_DHASH_DISTANCE > 0"""
+        fingerprints = {b"a": "00000000000000ff", b"b": "00000000000000fe", b"c": "ff00000000000000"}
+        monkeypatch.setattr(screenshot_store, "dhash", lambda raw: fingerprints[raw])
+
+        exact = ScreenshotStore(store_root, "run1")
+        assert exact.put(b"a", "png", "t", "1") != exact.put(b"b", "png", "t", "2")
+
+        monkeypatch.setattr(Config, "SCREENSHOT_DHASH_DISTANCE", 2)
+        near = ScreenshotStore(os.path.join(store_root, "near"), "run1")
+        a = near.put(b"a", "png", "t", "1")
+        assert near.put(b"b", "png", "t", "2") == a
+        assert near.put(b"c", "png", "t", "3") != a
+
+    def test_bands_share_a_key_within_the_distance(self):
+        """Hashes within distance d share one of d + 1 bands (pigeonhole)"""
+        a = "0123456789abcdef"
+        b = f"{int(a, 16) ^ 0b10001000100:016x}"
+        assert hamming(a, b) == 3
+        assert set(bands(a, 4)) & set(bands(b, 4))
+
+
+class TestScreenshotStoreEviction:
+    def test_oldest_runs_and_their_blobs_are_evicted(self, store_root, monkeypatch):
+        """Runs beyond SCREENSHOT_KEEP_RUNS go first; blobs only they referenced are deleted"""
+        monkeypatch.setattr(Config, "SCREENSHOT_KEEP_RUNS", 2)
+        shared = None
+        for run in ("run1", "run2", "run3"):
+            store = ScreenshotStore(store_root, run)
+            shared = store.put(b"shared", "png", "t", "common")
+            store.put(run.encode(), "png", "t", "own")
+            store.close(evict=True)
+
+        index = ScreenshotStore(store_root, "run3")._read_index()
+        assert [run["run_id"] for run in index["runs"]] == ["run2", "run3"]
+        assert shared in index["blobs"]
+        assert len(blob_files(store_root)) == 3
+
+    def test_current_run_is_kept_over_the_byte_limit(self, store_root, monkeypatch):
+        """The run being written is never evicted, even when it alone exceeds the limit"""
+        monkeypatch.setattr(Config, "SCREENSHOT_MAX_BYTES", 1)
+        for run in ("run1", "run2"):
+            store = ScreenshotStore(store_root, run)
+            store.put(run.encode() * 10, "png", "t", "own")
+            store.close(evict=True)
+
+        index = ScreenshotStore(store_root, "run2")._read_index()
+        assert [run["run_id"] for run in index["runs"]] == ["run2"]
+        assert len(blob_files(store_root)) == 1
+
+    def test_blobs_reused_by_an_unmerged_run_are_kept(self, store_root, monkeypatch):
+        """A concurrent run that deduplicated against a blob keeps it alive until it has merged"""
+        monkeypatch.setattr(Config, "SCREENSHOT_KEEP_RUNS", 1)
+        old = ScreenshotStore(store_root, "run1")
+        reused = old.put(b"reused", "png", "t", "1")
+        old.close(evict=False)
+
+        concurrent = ScreenshotStore(store_root, "run2")
+        assert concurrent.put(b"reused", "png", "t", "1") == reused
+        evicting = ScreenshotStore(store_root, "run3")
+        evicting.put(b"other", "png", "t", "1")
+        evicting.close(evict=True)
+        assert os.path.exists(concurrent.path_for(reused))
+
+        concurrent.close(evict=False)
+        index = concurrent._read_index()
+        assert reused in index["blobs"]
+        assert os.listdir(os.path.join(store_root, "active")) == []
+
+    def test_blob_deleted_before_reuse_is_written_again(self, store_root):
+        """Reusing a blob another run's eviction already deleted writes it back"""
+        first = ScreenshotStore(store_root, "run1")
+        digest = first.put(b"image", "png", "t", "1")
+        os.remove(first.path_for(digest))
+        assert first.put(b"image", "png", "t", "2") == digest
+        assert os.path.exists(first.path_for(digest))
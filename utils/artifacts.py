@@ -0,0 +1,192 @@
+import base64
+import io
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from config.config import Config
+from utils.screenshot_store import ScreenshotStore
+
+logger = logging.getLogger(__name__)
+
+
+class ScreenshotHandle(os.PathLike):
+    """
+    Reference to a screenshot that is being written in the background.
+
+    - Path-like, as take_screenshot's return value always was: os.fspath(handle),
+      str(handle), open(handle) and os.path functions wait for the write and
+      use the stored blob's path.
+    - result() waits for the write and returns the stored blob's path.
+    - ref() is the stable "sha256:<digest>" reference into the ScreenshotStore;
+      identical screenshots from any run share one reference.
+    - 'test' is the node id of the test that took it, so the report hooks
+      can attach it to the right test.
+    """
+
+    def __init__(self, name, test, future):
+        self.name = name
+        self.test = test
+        self._future = future
+
+    def done(self):
+        """True once the screenshot has been written (or failed)."""
+        return self._future.done()
+
+    def result(self, timeout=None):
+        """Wait for the write to finish and return the blob's file path."""
+        return self._future.result(timeout)
+
+    def ref(self, timeout=None):
+        """Wait for the write to finish and return the stable store reference."""
+        return "sha256:" + os.path.basename(self.result(timeout)).split(".")[0]
+
+    def __fspath__(self):
+        return self.result()
+
+    def __str__(self):
+        return self.result()
+
+    def __repr__(self):
+        return f"ScreenshotHandle({self.name!r}, test={self.test!r})"
+
+
+class ArtifactPipeline:
+    """
+    Writes screenshots off the test's critical path.
+
+    - The test thread only pays for get_screenshot_as_base64(), the single
+      WebDriver round trip that has to happen while the page is on screen.
+    - Decoding, optional downscaling/recompression (JPEG/WebP, needs Pillow)
+      and storing in the content-addressed ScreenshotStore run on a small
+      thread pool.
+    - At most 'max_pending' screenshots are in flight; taking another one
+      blocks until a slot frees up, so memory stays bounded.
+    - flush() waits for everything queued; close() also stops the workers.
+    - Screenshots are attributed to the test set with set_current_test().
+    """
+
+    def __init__(self, directory=None, workers=None, max_pending=None,
+                 image_format=None, max_width=None, quality=None):
+        self.store = ScreenshotStore(directory)
+        self.image_format = (image_format or Config.SCREENSHOT_FORMAT).lower()
+        self.max_width = max_width or Config.SCREENSHOT_MAX_WIDTH
+        self.quality = quality or Config.SCREENSHOT_QUALITY
+        if (self.image_format != "png" or self.max_width) and not self._pillow_available():
+            logger.warning("Pillow is not installed; screenshots are written as full-size PNG")
+            self.image_format, self.max_width = "png", None
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers or Config.ARTIFACT_WORKERS,
+            thread_name_prefix="artifacts"
+        )
+        self._slots = threading.BoundedSemaphore(max_pending or Config.ARTIFACT_QUEUE_SIZE)
+        self._handles = []
+        self._lock = threading.Lock()
+
+    def screenshot(self, driver, name):
+        """Capture the browser now and queue the write; returns a ScreenshotHandle."""
+        data = driver.get_screenshot_as_base64()
+
+        test = _current_test
+        self._slots.acquire()
+        future = self._executor.submit(self._write, data, name, test)
+        future.add_done_callback(lambda _: self._slots.release())
+        handle = ScreenshotHandle(name, test, future)
+        with self._lock:
+            self._handles.append(handle)
+        logger.debug(f"Screenshot queued: {name}")
+        return handle
+
+    def handles_for(self, test):
+        """Remove and return the handles taken during the given test."""
+        with self._lock:
+            taken = [handle for handle in self._handles if handle.test == test]
+            self._handles = [handle for handle in self._handles if handle.test != test]
+        return taken
+
+    def flush(self, timeout=None):
+        """Wait until every queued screenshot is written."""
+        with self._lock:
+            pending = list(self._handles)
+        for handle in pending:
+            try:
+                handle.result(timeout)
+            except Exception as e:
+                logger.error(f"Screenshot {handle.name} could not be written: {e}")
+
+    def close(self, evict=True):
+        """Flush pending writes, stop the worker threads and update the store index."""
+        self.flush()
+        self._executor.shutdown(wait=True)
+        self.store.close(evict)
+
+    def _extension(self):
+        return "jpg" if self.image_format == "jpeg" else self.image_format
+
+    def _write(self, data, name, test):
+        raw = base64.b64decode(data)
+        if self.image_format != "png" or self.max_width:
+            raw = self._recompress(raw)
+        path = self.store.path_for(self.store.put(raw, self._extension(), test, name))
+        logger.info(f"Screenshot saved: {path}")
+        return path
+
+    @staticmethod
+    def _pillow_available():
+        try:
+            import PIL  # noqa: F401
+            return True
+        except ImportError:
+            return False
+
+    def _recompress(self, raw):
+        from PIL import Image
+        image = Image.open(io.BytesIO(raw))
+        if self.max_width and image.width > self.max_width:
+            image = image.resize((self.max_width, round(image.height * self.max_width / image.width)))
+        if self.image_format == "jpeg":
+            image = image.convert("RGB")
+        output = io.BytesIO()
+        image.save(output, format=self.image_format.upper(), quality=self.quality)
+        return output.getvalue()
+
+
+# Pipeline shared by every page object in this process (created on first use)
+_pipeline = None
+_pipeline_lock = threading.Lock()
+
+# Node id of the running test; kept outside the pipeline so tracking it does not start one
+_current_test = None
+
+
+def set_current_test(test_id):
+    """Attribute screenshots taken from now on to the given test."""
+    global _current_test
+    _current_test = test_id
+
+
+def get_pipeline():
+    """Return this process's ArtifactPipeline, creating it on first use."""
+    global _pipeline
+    with _pipeline_lock:
+        if _pipeline is None:
+            _pipeline = ArtifactPipeline()
+        return _pipeline
+
+
+def handles_for(test):
+    """Remove and return the screenshot handles taken during a test ([] if no pipeline was started)."""
+    with _pipeline_lock:
+        pipeline = _pipeline
+    return pipeline.handles_for(test) if pipeline is not None else []
+
+
+def close_pipeline(evict=True):
+    """Flush and stop the pipeline, if one was started; evict=True applies store retention."""
+    global _pipeline
+    with _pipeline_lock:
+        pipeline, _pipeline = _pipeline, None
+    if pipeline is not None:
+        pipeline.close(evict)
+    elif evict:
+        ScreenshotStore().close(evict=True)
@@ -0,0 +1,141 @@
+import json
+import logging
+import math
+import os
+import statistics
+import time
+from datetime import datetime
+from config.config import Config
+from utils.command_counter import CommandCounter
+
+logger = logging.getLogger(__name__)
+
+
+def percentile(samples, pct):
+    """Return the pct-th percentile of samples using linear interpolation."""
+    ordered = sorted(samples)
+    if not ordered:
+        raise ValueError("percentile() needs at least one sample")
+    rank = (len(ordered) - 1) * pct / 100
+    low, high = math.floor(rank), math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def measure(name, driver, operation, setup=None, repeat=None):
+    """
+    Time an operation 'repeat' times and count the WebDriver commands it issues.
+
+    Args:
+        name (str): Metric name stored in the history file.
+        driver: WebDriver instance the operation runs against.
+        operation: Callable being measured.
+        setup: Optional callable run (untimed) before every repetition.
+        repeat (int): Number of timed repetitions (default Config.BENCHMARK_REPEAT).
+
+    Returns:
+        dict: p50/p95/p99 latency in ms, median command count and raw samples.
+    """
+    repeat = repeat or Config.BENCHMARK_REPEAT
+    samples_ms = []
+    command_counts = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        with CommandCounter(driver) as counter:
+            start = time.perf_counter()
+            operation()
+            samples_ms.append((time.perf_counter() - start) * 1000)
+        command_counts.append(counter.total)
+
+    result = {
+        "name": name,
+        "repeat": repeat,
+        "p50_ms": round(percentile(samples_ms, 50), 2),
+        "p95_ms": round(percentile(samples_ms, 95), 2),
+        "p99_ms": round(percentile(samples_ms, 99), 2),
+        "commands": int(statistics.median(command_counts)),
+        "samples_ms": [round(sample, 2) for sample in samples_ms],
+    }
+    logger.info(
+        f"Benchmark {name}: p50 {result['p50_ms']} ms, p95 {result['p95_ms']} ms, "
+        f"p99 {result['p99_ms']} ms, {result['commands']} commands"
+    )
+    return result
+
+
+class BenchmarkHistory:
+    """
+    JSON history of benchmark runs with a baseline to compare against.
+
+    File layout:
+        {"baseline": {name: result}, "runs": [{"timestamp": ..., "results": {name: result}}]}
+
+    - A metric with no baseline yet becomes the baseline on first save().
+    - compare() flags a regression when p50/p95 latency grows by more than
+      the threshold (Config.BENCHMARK_REGRESSION_THRESHOLD), p99 by more than
+      the tail threshold (Config.BENCHMARK_TAIL_REGRESSION_THRESHOLD), or the
+      command count grows at all, since command counts are deterministic.
+    """
+
+    # Latency metrics checked against the baseline
+    LATENCY_METRICS = ("p50_ms", "p95_ms")
+    TAIL_METRICS = ("p99_ms",)
+
+    def __init__(self, path=None, threshold=None, tail_threshold=None):
+        self.path = path or Config.BENCHMARK_HISTORY_PATH
+        self.threshold = Config.BENCHMARK_REGRESSION_THRESHOLD if threshold is None else threshold
+        self.tail_threshold = Config.BENCHMARK_TAIL_REGRESSION_THRESHOLD if tail_threshold is None else tail_threshold
+        self.data = self._load()
+        self.pending = {}
+
+    def _load(self):
+        try:
+            with open(self.path, "r") as file:
+                return json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {"baseline": {}, "runs": []}
+
+    def compare(self, result):
+        """Return a list of human-readable regressions of result against its baseline."""
+        baseline = self.data["baseline"].get(result["name"])
+        if baseline is None:
+            return []
+        regressions = []
+        thresholds = [(metric, self.threshold) for metric in self.LATENCY_METRICS]
+        thresholds += [(metric, self.tail_threshold) for metric in self.TAIL_METRICS]
+        for metric, threshold in thresholds:
+            if metric not in baseline:
+                continue  # baseline recorded before the metric was gated
+            limit = baseline[metric] * (1 + threshold)
+            if result[metric] > limit:
+                regressions.append(
+                    f"{result['name']} {metric}: {result[metric]} ms > {limit:.2f} ms "
+                    f"(baseline {baseline[metric]} ms + {threshold:.0%})"
+                )
+        if result["commands"] > baseline["commands"]:
+            regressions.append(
+                f"{result['name']} commands: {result['commands']} > baseline {baseline['commands']}"
+            )
+        return regressions
+
+    def add(self, result):
+        """Queue a result to be written by save()."""
+        self.pending[result["name"]] = result
+
+    def save(self, update_baseline=False):
+        """Append the queued results as one run and write the history file."""
+        if not self.pending:
+            return
+        self.data["runs"].append({
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "results": self.pending,
+        })
+        for name, result in self.pending.items():
+            if update_baseline or name not in self.data["baseline"]:
+                self.data["baseline"][name] = {key: value for key, value in result.items() if key != "samples_ms"}
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "w") as file:
+            json.dump(self.data, file, indent=2)
+        logger.info(f"Benchmark history updated: {self.path}")
+        self.pending = {}
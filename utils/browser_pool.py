@@ -0,0 +1,88 @@
+import logging
+import threading
+from contextlib import contextmanager
+from utils.driver_factory import create_driver
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserPool:
+    """
+    Pool of warm browsers owned by one test process (one per pytest-xdist worker).
+
+    - Browsers are launched lazily, up to 'size', and reused across tests.
+    - Each test gets an exclusive lease; when the lease ends the browser's
+      cookies and web storage are wiped so no state leaks into the next lease.
+    - A browser that cannot be cleaned is discarded instead of being reused.
+    """
+
+    # Clears web storage for the origin currently loaded in the browser
+    _CLEAR_STORAGE_SCRIPT = """
+        try { window.localStorage.clear(); } catch (e) {}
+        try { window.sessionStorage.clear(); } catch (e) {}
+    """
+
+    def __init__(self, size=1, factory=create_driver, worker_id="master"):
+        self.size = size
+        self.factory = factory
+        self.worker_id = worker_id
+        self._idle = []
+        self._all = []
+        self._available = threading.Semaphore(size)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def lease(self):
+        """Yield a browser for exclusive use and clean it when the lease ends."""
+        self._available.acquire()
+        try:
+            driver = self._acquire()
+            try:
+                yield driver
+            finally:
+                self._release(driver)
+        finally:
+            self._available.release()
+
+    def _acquire(self):
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        logger.info(f"[{self.worker_id}] Launching browser {len(self._all) + 1} of {self.size}")
+        driver = self.factory()
+        with self._lock:
+            self._all.append(driver)
+        return driver
+
+    def _release(self, driver):
+        try:
+            driver.delete_all_cookies()
+            driver.execute_script(self._CLEAR_STORAGE_SCRIPT)
+            driver.get("about:blank")
+            driver.session_user = None
+        except Exception as e:
+            logger.warning(f"[{self.worker_id}] Discarding browser that could not be reset: {e}")
+            self._discard(driver)
+            return
+        with self._lock:
+            self._idle.append(driver)
+
+    def _discard(self, driver):
+        with self._lock:
+            if driver in self._all:
+                self._all.remove(driver)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def close_all(self):
+        """Quit every browser owned by the pool."""
+        logger.info(f"[{self.worker_id}] Closing {len(self._all)} browser instance(s)")
+        with self._lock:
+            drivers, self._all, self._idle = self._all, [], []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.warning(f"[{self.worker_id}] Error while closing browser: {e}")
@@ -0,0 +1,59 @@
+import logging
+import time
+from collections import Counter
+
+logger = logging.getLogger(__name__)
+
+
+class CommandCounter:
+    """
+    Context manager that counts WebDriver commands sent by a driver.
+
+    Wraps the driver's execute() for the duration of the block, so every
+    HTTP round trip to the browser driver (find, click, getText, script...)
+    is tallied by command name. Blocks may nest; each restores the execute()
+    it wrapped. Subclasses record more per command by overriding on_command().
+
+    Usage:
+        with CommandCounter(driver) as counter:
+            page.get_all_product_names()
+        print(counter.total, counter.by_command)
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.by_command = Counter()
+        self._previous_execute = None
+
+    @property
+    def total(self):
+        """Total number of commands issued inside the block."""
+        return sum(self.by_command.values())
+
+    def on_command(self, command, params, duration_ms):
+        """Called after every command with its latency; the base class only counts."""
+
+    def __enter__(self):
+        # An outer counter or profiler may already wrap execute(); restored on exit
+        self._previous_execute = vars(self.driver).get("execute")
+        wrapped_execute = self.driver.execute
+
+        def counting_execute(driver_command, params=None):
+            self.by_command[driver_command] += 1
+            start = time.perf_counter()
+            try:
+                return wrapped_execute(driver_command, params)
+            finally:
+                self.on_command(driver_command, params, (time.perf_counter() - start) * 1000)
+
+        self.driver.execute = counting_execute
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._previous_execute is not None:
+            self.driver.execute = self._previous_execute
+        else:
+            # Drop the instance attribute so the class method is used again
+            del self.driver.execute
+        logger.debug(f"WebDriver commands issued: {self.total} {dict(self.by_command)}")
+        return False
@@ -0,0 +1,187 @@
+"""
+Seeded synthetic test data for load-style runs.
+
+Every record is a pure function of (seed, kind, index), so case N is the same
+on every machine and every xdist worker, and nothing has to be generated or
+held in memory ahead of time.
+
+Usage:
+    python -m utils.data_generator checkout_profile 10000 test_data/generated/checkout.jsonl
+    python -m utils.data_generator invalid_credentials 5000 test_data/generated/invalid.csv
+"""
+import argparse
+import csv
+import json
+import os
+import random
+import string
+from config.config import Config
+from utils.data_reader import CheckoutInfo, User, get_users
+
+FIRST_NAMES = ["John", "Maria", "Wei", "Aisha", "Olga", "Carlos", "Yuki", "Amara", "Liam", "Zoë",
+               "Jean-Luc", "Siobhán", "Mohammed", "Priya", "Björn", "Ngozi", "Mateo", "Hana"]
+LAST_NAMES = ["Doe", "García", "Chen", "Okafor", "Ivanova", "Smith", "Tanaka", "O'Brien", "Müller",
+              "Nguyen", "Kowalski", "Da Silva", "Haddad", "Patel", "Johansson", "Adeyemi"]
+
+ERRORS = {
+    "username_required": "Epic sadface: Username is required",
+    "password_required": "Epic sadface: Password is required",
+    "no_match": "Epic sadface: Username and password do not match any user in this service",
+    "locked_out": "Epic sadface: Sorry, this user has been locked out.",
+}
+
+
+class DataGenerator:
+    """
+    Deterministic generator of checkout profiles, invalid login credentials and baskets.
+
+    - checkout_profile(i): CheckoutInfo with varied (including non-ASCII) names.
+    - invalid_credentials(i): (User, expected error message); the first cases
+      enumerate every username/password variant permutation, later ones add
+      random unknown users.
+    - basket(i): (product count, selection seed) for ProductsPage.select_random_products.
+    - order(i): (checkout_profile(i), basket(i)) for end-to-end checkouts.
+    """
+
+    KINDS = ("user", "checkout_profile", "invalid_credentials", "basket", "order")
+
+    def __init__(self, seed=None):
+        self.seed = Config.DATA_SEED if seed is None else seed
+        self._permutations = None
+
+    def _rng(self, kind, index):
+        return random.Random(f"{self.seed}:{kind}:{index}")
+
+    def generate(self, kind, index):
+        """Return record 'index' of the given kind."""
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown generated data kind: {kind}")
+        return getattr(self, kind)(index)
+
+    def user(self, index):
+        """A predefined user able to log in (cycled through in a seeded order)."""
+        users = [user for user in get_users() if user.expected_result == "success"]
+        return users[self._rng("user", index).randrange(len(users))]
+
+    def checkout_profile(self, index):
+        rng = self._rng("checkout_profile", index)
+        return CheckoutInfo(
+            first_name=rng.choice(FIRST_NAMES),
+            last_name=rng.choice(LAST_NAMES),
+            postal_code="".join(rng.choices(string.digits, k=rng.choice((4, 5, 6)))),
+        )
+
+    def invalid_credentials(self, index):
+        permutations = self.credential_permutations()
+        if index < len(permutations):
+            username, password = permutations[index]
+        else:
+            rng = self._rng("invalid_credentials", index)
+            username = "user_" + "".join(rng.choices(string.ascii_lowercase + string.digits, k=8))
+            password = rng.choice([get_users()[0].password, "wrong_" + "".join(rng.choices(string.ascii_letters, k=6))])
+        return User(username, password, "failure"), self.expected_error(username, password)
+
+    def basket(self, index):
+        rng = self._rng("basket", index)
+        return rng.randint(1, 6), rng.getrandbits(32)
+
+    def order(self, index):
+        return self.checkout_profile(index), self.basket(index)
+
+    def credential_permutations(self):
+        """Every invalid combination of username and password variants (built once)."""
+        if self._permutations is None:
+            valid_users = [user.username for user in get_users()]
+            usernames = valid_users + [
+                "", "unknown_user", valid_users[0].upper(), f" {valid_users[0]}", f"{valid_users[0]} ",
+            ]
+            password = get_users()[0].password
+            passwords = [password, "", "wrong_password", password.upper(), f"{password} "]
+            self._permutations = [
+                (username, password)
+                for username in usernames
+                for password in passwords
+                if self.expected_error(username, password) is not None
+            ]
+        return self._permutations
+
+    @staticmethod
+    def expected_error(username, password):
+        """Login error the app shows for these credentials (None if the login succeeds)."""
+        users = {user.username: user for user in get_users()}
+        if not username:
+            return ERRORS["username_required"]
+        if not password:
+            return ERRORS["password_required"]
+        if username not in users or password != users[username].password:
+            return ERRORS["no_match"]
+        if users[username].expected_result == "failure":
+            return ERRORS["locked_out"]
+        return None
+
+    def export(self, kind, count, path):
+        """Write 'count' records of a kind to a JSONL or CSV file (readable by LazyDataset)."""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        rows = (self._as_dict(self.generate(kind, index)) for index in range(count))
+        with open(path, "w", encoding="utf-8", newline="") as file:
+            if path.endswith(".csv"):
+                first = next(rows)
+                writer = csv.DictWriter(file, fieldnames=list(first))
+                writer.writeheader()
+                writer.writerow(first)
+                writer.writerows(rows)
+            else:
+                for row in rows:
+                    file.write(json.dumps(row, ensure_ascii=False) + "\n")
+        return path
+
+    @staticmethod
+    def _as_dict(record):
+        # Flattens records and (record, ...) tuples into one row; the expected error
+        # of invalid credentials is left out, expected_error() derives it again
+        if isinstance(record, tuple) and all(isinstance(part, int) for part in record):
+            return {"count": record[0], "seed": record[1]}
+        row = {}
+        for part in record if isinstance(record, tuple) else (record,):
+            if isinstance(part, (User, CheckoutInfo)):
+                row.update((field, getattr(part, field)) for field in part.__slots__)
+            elif isinstance(part, tuple):
+                row.update(count=part[0], seed=part[1])
+        return row
+
+
+class GeneratedCase:
+    """
+    One lazily generated parameter: only (kind, index) is stored at collection
+    time; the record is built when the test first reads 'record'.
+    """
+
+    __slots__ = ("kind", "index", "_record")
+
+    def __init__(self, kind, index):
+        self.kind = kind
+        self.index = index
+        self._record = None
+
+    @property
+    def record(self):
+        if self._record is None:
+            self._record = DataGenerator().generate(self.kind, self.index)
+        return self._record
+
+    def __repr__(self):
+        return f"{self.kind}-{self.index:06d}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m utils.data_generator", description="Export generated test data")
+    parser.add_argument("kind", choices=DataGenerator.KINDS)
+    parser.add_argument("count", type=int)
+    parser.add_argument("path", help="Output file (.jsonl or .csv)")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+    print(DataGenerator(args.seed).export(args.kind, args.count, args.path))
+
+
+if __name__ == "__main__":
+    main()
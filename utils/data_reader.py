@@ -1,27 +1,244 @@
+import copy
+import csv
+import io
 import json
 import os
+from array import array
+from functools import lru_cache
+
+# Directory holding the JSON/JSONL/CSV test data files
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "test_data")
+
+
+class DataValidationError(ValueError):
+    """Raised when a test data file does not match its expected schema."""
+
+
+class User:
+    """Login credentials and the expected login outcome ("success" or "failure")."""
+
+    __slots__ = ("username", "password", "expected_result")
+
+    FIELDS = {"username": str, "password": str, "expected_result": str}
+    REQUIRED = ("username", "password")
+
+    def __init__(self, username, password, expected_result="failure"):
+        self.username = username
+        self.password = password
+        self.expected_result = expected_result
+
+    def __getitem__(self, key):
+        # Dict-style access, so existing tests using user["username"] keep working
+        return getattr(self, key)
+
+    def __eq__(self, other):
+        return type(other) is type(self) and all(getattr(self, f) == getattr(other, f) for f in self.__slots__)
+
+    def __repr__(self):
+        return f"User({self.username!r}, expected_result={self.expected_result!r})"
+
+
+class CheckoutInfo:
+    """Customer details entered on the checkout form."""
+
+    __slots__ = ("first_name", "last_name", "postal_code")
+
+    FIELDS = {"first_name": str, "last_name": str, "postal_code": str}
+    REQUIRED = ("first_name", "last_name", "postal_code")
+
+    def __init__(self, first_name, last_name, postal_code):
+        self.first_name = first_name
+        self.last_name = last_name
+        self.postal_code = postal_code
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def __eq__(self, other):
+        return type(other) is type(self) and all(getattr(self, f) == getattr(other, f) for f in self.__slots__)
+
+    def __repr__(self):
+        return f"CheckoutInfo({self.first_name!r}, {self.last_name!r}, {self.postal_code!r})"
+
+
+def build_record(record_type, data, where):
+    """
+    Validate a plain dict against a record type's schema and build the record.
+
+    Args:
+        record_type: User or CheckoutInfo.
+        data (dict): Raw values read from a file.
+        where (str): File and position, used in error messages.
+    """
+    if not isinstance(data, dict):
+        raise DataValidationError(f"{where}: expected an object, got {type(data).__name__}")
+    missing = [field for field in record_type.REQUIRED if field not in data]
+    unknown = [field for field in data if field not in record_type.FIELDS]
+    if missing or unknown:
+        raise DataValidationError(f"{where}: missing fields {missing}, unknown fields {unknown}")
+    for field, value in data.items():
+        if not isinstance(value, record_type.FIELDS[field]):
+            raise DataValidationError(f"{where}.{field}: expected {record_type.FIELDS[field].__name__}")
+    if record_type is User and data.get("expected_result", "failure") not in ("success", "failure"):
+        raise DataValidationError(f"{where}.expected_result: must be 'success' or 'failure'")
+    return record_type(**data)
+
+
+@lru_cache(maxsize=32)
+def _load_json(path, mtime_ns):
+    # mtime_ns is part of the cache key: an edited file is parsed and validated again
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def load_json(path):
+    """
+    Parse a JSON file once per file version (cached until its modification time changes).
+    Returns a copy, so callers may modify it without affecting the cache.
+    """
+    return copy.deepcopy(_load_json(path, os.stat(path).st_mtime_ns))
+
+
+@lru_cache(maxsize=32)
+def _users(path, mtime_ns):
+    data = _load_json(path, mtime_ns)
+    if not isinstance(data, list):
+        raise DataValidationError(f"{path}: expected a list of users")
+    return tuple(build_record(User, user, f"{path}[{i}]") for i, user in enumerate(data))
+
+
+@lru_cache(maxsize=32)
+def _test_data(path, mtime_ns):
+    data = _load_json(path, mtime_ns)
+    if not isinstance(data, dict) or "checkout_info" not in data:
+        raise DataValidationError(f"{path}: expected an object with 'checkout_info'")
+    checkout_info = build_record(CheckoutInfo, data["checkout_info"], f"{path}.checkout_info")
+    invalid_users = tuple(
+        build_record(User, user, f"{path}.invalid_users[{i}]")
+        for i, user in enumerate(data.get("invalid_users", []))
+    )
+    return checkout_info, invalid_users
+
+
+def _data_file(name):
+    path = os.path.join(DATA_DIR, name)
+    return path, os.stat(path).st_mtime_ns
+
 
 def get_users():
     """
-    Reads the users.json file from the 'test_data' directory and returns its contents.
+    Return the predefined users in test_data/users.json as User records.
     Used for fetching predefined users (username & password) for login tests.
+    The file is parsed and validated once, and again only after it changes.
     """
-    # Build the absolute path to users.json file (two directories up -> test_data folder)
-    file_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "test_data", "users.json")
-    
-    # Open the file and load its contents as a Python object (list/dict depending on JSON structure)
-    with open(file_path, 'r') as file:
-        return json.load(file)
+    return list(_users(*_data_file("users.json")))
+
+
+def get_checkout_info():
+    """Return the checkout profile from test_data/test_data.json as a CheckoutInfo record."""
+    return _test_data(*_data_file("test_data.json"))[0]
+
+
+def get_invalid_users():
+    """Return the invalid login credentials from test_data/test_data.json as User records."""
+    return list(_test_data(*_data_file("test_data.json"))[1])
 
 
 def get_test_data():
     """
     Reads the test_data.json file from the 'test_data' directory and returns its contents.
     Used for fetching generic test data (like product selections, expected values, etc.).
+    Validated and cached like get_users(); returns a fresh copy on each call.
     """
-    # Build the absolute path to test_data.json file (two directories up -> test_data folder)
-    file_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "test_data", "test_data.json")
-    
-    # Open the file and load its contents as a Python object (list/dict depending on JSON structure)
-    with open(file_path, 'r') as file:
-        return json.load(file)
+    path, mtime_ns = _data_file("test_data.json")
+    _test_data(path, mtime_ns)  # Validate
+    return copy.deepcopy(_load_json(path, mtime_ns))
+
+
+class LazyDataset:
+    """
+    Random-access, streaming view of a large JSONL or CSV file of records.
+
+    - Only the byte offset of each row is kept in memory (8 bytes per row, built
+      on first use by one sequential scan); rows are parsed when accessed.
+    - Iterating streams the file without building the offsets.
+    - Each row is validated against the record type as it is read.
+    - CSV files need a header row and one record per line.
+
+    Usage:
+        users = LazyDataset("test_data/generated/users.jsonl", User)
+        len(users), users[1234], [user.username for user in users]
+
+    Tests marked @pytest.mark.data_file(name, record_type) are parametrised with
+    one DatasetCase per row (see tests/conftest.py).
+    """
+
+    def __init__(self, path, record_type):
+        self.path = path
+        self.record_type = record_type
+        self.is_csv = path.endswith(".csv")
+        self._offsets = None
+        self._header = None
+
+    def __iter__(self):
+        with open(self.path, "r", encoding="utf-8", newline="") as file:
+            if self.is_csv:
+                for i, row in enumerate(csv.DictReader(file)):
+                    yield build_record(self.record_type, row, f"{self.path}:{i + 2}")
+            else:
+                for i, line in enumerate(file):
+                    if line.strip():
+                        yield build_record(self.record_type, json.loads(line), f"{self.path}:{i + 1}")
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, index):
+        offset = self.offsets[index]
+        with open(self.path, "rb") as file:
+            file.seek(offset)
+            line = file.readline().decode("utf-8")
+        if self.is_csv:
+            data = next(csv.DictReader(io.StringIO(line), fieldnames=self._header))
+        else:
+            data = json.loads(line)
+        return build_record(self.record_type, data, f"{self.path}[{index}]")
+
+    @property
+    def offsets(self):
+        """Byte offset of every record in the file (built once)."""
+        if self._offsets is None:
+            offsets = array("Q")
+            with open(self.path, "rb") as file:
+                if self.is_csv:
+                    self._header = next(csv.reader([file.readline().decode("utf-8")]))
+                position = file.tell()
+                for line in file:
+                    if line.strip():
+                        offsets.append(position)
+                    position += len(line)
+            self._offsets = offsets
+        return self._offsets
+
+
+class DatasetCase:
+    """
+    One row of a LazyDataset as a test parameter: only (dataset, index) is held
+    at collection time; the row is read and validated when the test first reads 'record'.
+    """
+
+    __slots__ = ("dataset", "index", "_record")
+
+    def __init__(self, dataset, index):
+        self.dataset = dataset
+        self.index = index
+        self._record = None
+
+    @property
+    def record(self):
+        if self._record is None:
+            self._record = self.dataset[self.index]
+        return self._record
+
+    def __repr__(self):
+        return f"{os.path.splitext(os.path.basename(self.dataset.path))[0]}-{self.index:06d}"
@@ -0,0 +1,87 @@
+import logging
+import time
+from selenium import webdriver
+from selenium.common.exceptions import SessionNotCreatedException
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from selenium.webdriver.edge.service import Service as EdgeService
+from config.config import Config
+from utils.driver_resolver import DriverResolver, DRIVER_BINARIES
+
+logger = logging.getLogger(__name__)
+
+# Startup timings (ms) of every browser launched by this process, one dict per browser
+startup_timings = []
+
+
+def create_driver():
+    """
+    Launch a new WebDriver instance based on the browser from Config.
+    Supports Chrome, Firefox, and Edge.
+    Records how long each startup phase took (resolve, spawn, first navigation).
+    """
+    logger.info("Initializing browser setup...")
+    logger.info(f"Selected Browser: {Config.BROWSER}")
+    profile = Config.get_launch_profile()
+    logger.info(f"Launch profile: {Config.LAUNCH_PROFILE}")
+    logger.info(f"Incognito mode enabled: {Config.INCOGNITO}")
+    logger.info(f"Headless mode enabled: {profile['headless']}")
+    browser = Config.BROWSER.lower()
+    if browser not in DRIVER_BINARIES:
+        logger.error(f"Unsupported browser selected: {Config.BROWSER}")
+        raise ValueError(f"Unsupported browser: {Config.BROWSER}")
+    timings = {"browser": browser, "profile": Config.LAUNCH_PROFILE}
+
+    # Resolve the driver executable (pinned in the local manifest after the first run)
+    resolver = DriverResolver()
+    start = time.perf_counter()
+    driver_path = resolver.resolve(browser)
+    timings["resolve_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    start = time.perf_counter()
+
+    try:
+        driver = _launch(browser, driver_path)
+    except SessionNotCreatedException as e:
+        # Typically a pinned driver that no longer matches the browser: resolve it again, once
+        logger.warning(f"Session not created with {driver_path}: {e.msg}. Re-resolving the driver...")
+        resolver.invalidate(browser)
+        driver_path = resolver.resolve(browser)
+        driver = _launch(browser, driver_path)
+
+    # Apply default WebDriver configurations
+    driver.implicitly_wait(Config.IMPLICIT_WAIT)
+    if profile["maximize"]:
+        driver.maximize_window()
+    timings["spawn_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    logger.info("Browser initialized successfully")
+
+    # First navigation warms the browser up and lands it on the application's origin
+    start = time.perf_counter()
+    driver.get(Config.url())
+    timings["first_navigation_ms"] = round((time.perf_counter() - start) * 1000, 1)
+
+    startup_timings.append(timings)
+    logger.info(
+        f"Browser startup ({Config.LAUNCH_PROFILE}): resolve {timings['resolve_ms']} ms, spawn {timings['spawn_ms']} ms, "
+        f"first navigation {timings['first_navigation_ms']} ms"
+    )
+    return driver
+
+
+def _launch(browser, driver_path):
+    """Start the browser with the given driver executable (None lets Selenium Manager pick one)"""
+    options = Config.get_browser_options(browser)
+
+    # Launch Chrome
+    if browser == "chrome":
+        logger.debug("Configuring Chrome browser options")
+        return webdriver.Chrome(service=ChromeService(driver_path), options=options)
+
+    # Launch Firefox
+    if browser == "firefox":
+        logger.debug("Configuring Firefox browser options")
+        return webdriver.Firefox(service=FirefoxService(driver_path), options=options)
+
+    # Launch Edge
+    logger.debug("Launching Microsoft Edge browser")
+    return webdriver.Edge(service=EdgeService(driver_path), options=options)
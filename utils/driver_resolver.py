@@ -0,0 +1,253 @@
+import json
+import logging
+import os
+import shutil
+import time
+from datetime import datetime
+from config.config import Config
+
+logger = logging.getLogger(__name__)
+
+# Executable names used for the offline PATH lookup
+DRIVER_BINARIES = {
+    "chrome": "chromedriver",
+    "firefox": "geckodriver",
+    "edge": "msedgedriver",
+}
+
+# Browser executables whose modification time tells when the installed browser changed:
+# names looked up on PATH, then the default install locations on macOS and Windows
+BROWSER_BINARIES = {
+    "chrome": ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser",
+               "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+               r"C:\Program Files\Google\Chrome\Application\chrome.exe"],
+    "firefox": ["firefox",
+                "/Applications/Firefox.app/Contents/MacOS/firefox",
+                r"C:\Program Files\Mozilla Firefox\firefox.exe"],
+    "edge": ["microsoft-edge", "microsoft-edge-stable",
+             "/Applications/Microsoft Edge.app/Contents/MacOS/Microsoft Edge",
+             r"C:\Program Files (x86)\Microsoft\Edge\Application\msedge.exe"],
+}
+
+
+def _driver_manager(browser):
+    """Return the webdriver_manager instance for a browser (imported lazily)."""
+    if browser == "chrome":
+        from webdriver_manager.chrome import ChromeDriverManager
+        return ChromeDriverManager()
+    if browser == "firefox":
+        from webdriver_manager.firefox import GeckoDriverManager
+        return GeckoDriverManager()
+    if browser == "edge":
+        from webdriver_manager.microsoft import EdgeChromiumDriverManager
+        return EdgeChromiumDriverManager()
+    raise ValueError(f"Unsupported browser: {browser}")
+
+
+# Installed browser versions detected by this process, by browser
+_installed_versions = {}
+
+
+def installed_browser_version(browser):
+    """Return the version of the browser installed on this machine (None if unknown), detected once per process."""
+    if browser not in _installed_versions:
+        try:
+            _installed_versions[browser] = _driver_manager(browser).driver.get_browser_version_from_os()
+        except Exception as e:
+            logger.debug(f"Could not detect the installed {browser} version: {e}")
+            _installed_versions[browser] = None
+    return _installed_versions[browser]
+
+
+def browser_binary(browser):
+    """Return the path of the installed browser executable, None if it cannot be located."""
+    for candidate in BROWSER_BINARIES.get(browser, []):
+        path = candidate if os.path.isabs(candidate) else shutil.which(candidate)
+        if path and os.path.isfile(path):
+            return path
+    return None
+
+
+def major_version(version):
+    """Return the major part of a version string ("120.0.6099.71" -> "120"), None if unknown."""
+    return str(version).split(".")[0] if version else None
+
+
+class FileLock:
+    """
+    Minimal cross-platform inter-process lock based on exclusive file creation.
+    A lock file older than 'stale_after' seconds is assumed abandoned and removed.
+    """
+
+    def __init__(self, path, timeout=120, stale_after=300, poll_interval=0.1):
+        self.path = path
+        self.timeout = timeout
+        self.stale_after = stale_after
+        self.poll_interval = poll_interval
+
+    def __enter__(self):
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(fd, str(os.getpid()).encode())
+                os.close(fd)
+                return self
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(self.path) > self.stale_after:
+                        logger.warning(f"Removing stale lock file: {self.path}")
+                        os.remove(self.path)
+                        continue
+                except FileNotFoundError:
+                    continue
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Could not acquire lock {self.path} within {self.timeout} seconds")
+                time.sleep(self.poll_interval)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        return False
+
+
+class DriverResolver:
+    """
+    Resolve browser driver executables once per machine.
+
+    - Resolved paths and browser versions are pinned in a JSON manifest
+      (Config.DRIVER_CACHE_DIR/manifest.json), so later sessions and every
+      pytest-xdist worker skip webdriver_manager's version probing entirely.
+    - A pin is reused only while the installed browser has the same major
+      version as the one it was resolved for; after a browser update the
+      driver is resolved again.
+    - The installed browser version (a subprocess to detect) is recorded in
+      the manifest too, and probed again only when the browser binary's mtime
+      changes (or after Config.BROWSER_VERSION_TTL when it cannot be located).
+    - Writes to the manifest are serialised with a lock file, so parallel
+      workers resolve a missing driver only once.
+    - When online resolution fails, falls back to a driver found on PATH,
+      and finally to None, which lets Selenium Manager resolve the driver itself.
+    """
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir or Config.DRIVER_CACHE_DIR
+        self.manifest_path = os.path.join(self.cache_dir, "manifest.json")
+        self.lock_path = os.path.join(self.cache_dir, "manifest.lock")
+
+    def resolve(self, browser):
+        """Return the driver executable path for 'browser' (or None for Selenium Manager)."""
+        browser = browser.lower()
+        installed = self.installed_version(browser)
+        entry = self._cached_entry(browser, installed)
+        if entry:
+            logger.debug(f"Driver for {browser} resolved from manifest: {entry['path']}")
+            return entry["path"]
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with FileLock(self.lock_path):
+            # Another worker may have resolved it while we waited for the lock
+            entry = self._cached_entry(browser, installed)
+            if entry:
+                return entry["path"]
+
+            entry = self._resolve_online(browser, installed) or self._resolve_offline(browser, installed)
+            if entry is None:
+                logger.warning(f"No {browser} driver found; leaving resolution to Selenium Manager")
+                return None
+
+            manifest = self._read_manifest()
+            manifest[browser] = entry
+            self._write_manifest(manifest)
+            logger.info(f"Pinned {browser} driver {entry['path']} (browser {entry['browser_version']}, via {entry['source']})")
+            return entry["path"]
+
+    def invalidate(self, browser=None):
+        """Drop one browser (or all browsers) from the manifest, forcing re-resolution and a new version probe."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with FileLock(self.lock_path):
+            manifest = self._read_manifest()
+            if browser is None:
+                manifest.clear()
+                _installed_versions.clear()
+            else:
+                manifest.pop(browser.lower(), None)
+                manifest.get("installed_browsers", {}).pop(browser.lower(), None)
+                _installed_versions.pop(browser.lower(), None)
+            self._write_manifest(manifest)
+
+    def installed_version(self, browser):
+        """
+        Return the installed browser version, from the manifest while the browser
+        binary is unchanged; otherwise probe it and record the result.
+        """
+        binary = browser_binary(browser)
+        mtime = os.path.getmtime(binary) if binary else None
+        probe = self._read_manifest().get("installed_browsers", {}).get(browser)
+        if probe and probe.get("binary") == binary and (
+                probe.get("binary_mtime") == mtime if binary
+                else time.time() - probe.get("probed_at", 0) < Config.BROWSER_VERSION_TTL):
+            return probe.get("version")
+
+        _installed_versions.pop(browser, None)
+        version = installed_browser_version(browser)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with FileLock(self.lock_path):
+            manifest = self._read_manifest()
+            manifest.setdefault("installed_browsers", {})[browser] = {
+                "version": version, "binary": binary, "binary_mtime": mtime, "probed_at": time.time(),
+            }
+            self._write_manifest(manifest)
+        logger.debug(f"Probed installed {browser} version: {version} ({binary or 'binary not found'})")
+        return version
+
+    def _cached_entry(self, browser, installed_version):
+        entry = self._read_manifest().get(browser)
+        if not (entry and entry.get("path") and os.path.isfile(entry["path"])):
+            return None
+        pinned = major_version(entry.get("browser_version"))
+        installed = major_version(installed_version)
+        if pinned and installed and pinned != installed:
+            logger.info(f"Pinned {browser} driver was resolved for browser {pinned}, installed is {installed}; resolving again")
+            return None
+        return entry
+
+    def _resolve_online(self, browser, installed_version):
+        try:
+            manager = _driver_manager(browser)
+            path = manager.install()
+        except Exception as e:
+            logger.warning(f"Online driver resolution for {browser} failed: {e}")
+            return None
+        return self._entry(path, installed_version, "webdriver_manager")
+
+    def _resolve_offline(self, browser, installed_version):
+        path = shutil.which(DRIVER_BINARIES[browser])
+        if path is None:
+            return None
+        return self._entry(path, installed_version, "PATH")
+
+    @staticmethod
+    def _entry(path, browser_version, source):
+        return {
+            "path": path,
+            "browser_version": browser_version,
+            "source": source,
+            "resolved_at": datetime.now().isoformat(timespec="seconds"),
+        }
+
+    def _read_manifest(self):
+        try:
+            with open(self.manifest_path, "r") as file:
+                return json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _write_manifest(self, manifest):
+        # Write to a temp file and swap it in, so readers never see a partial manifest
+        temp_path = f"{self.manifest_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as file:
+            json.dump(manifest, file, indent=2)
+        os.replace(temp_path, self.manifest_path)
@@ -0,0 +1,159 @@
+"""
+Query structured test events across runs.
+
+Builds (incrementally) a SQLite index over the JSONL files written by
+utils/events.py and answers common performance questions.
+
+Usage:
+    python -m utils.event_index build [--events logs/events] [--db logs/events/index.sqlite]
+    python -m utils.event_index slowest [--days 7] [--limit 20]
+    python -m utils.event_index flaky-locators [--days 30]
+    python -m utils.event_index trend [test substring] [--days 30]
+"""
+import argparse
+import glob
+import json
+import os
+import sqlite3
+from datetime import datetime, timedelta
+from config.config import Config
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS events (
+        ts TEXT, run TEXT, worker TEXT, test TEXT, page TEXT, action TEXT,
+        locator TEXT, duration_ms REAL, outcome TEXT, depth INTEGER
+    );
+    CREATE INDEX IF NOT EXISTS events_ts ON events (ts);
+    CREATE INDEX IF NOT EXISTS events_action ON events (action, page);
+    CREATE INDEX IF NOT EXISTS events_locator ON events (locator);
+    CREATE INDEX IF NOT EXISTS events_test ON events (test, action);
+    -- Bytes of each JSONL file already indexed, so rebuilding only reads new lines
+    CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, offset INTEGER);
+"""
+
+COLUMNS = ("ts", "run", "worker", "test", "page", "action", "locator", "duration_ms", "outcome", "depth")
+
+
+def connect(db_path=None):
+    """Open (and create if needed) the event index."""
+    db_path = db_path or Config.EVENT_INDEX_PATH
+    os.makedirs(os.path.dirname(db_path), exist_ok=True)
+    connection = sqlite3.connect(db_path)
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def build(connection, directory=None):
+    """Index new lines of every JSONL event file; returns the number of events added."""
+    directory = directory or Config.EVENT_LOG_PATH
+    added = 0
+    for path in sorted(glob.glob(os.path.join(directory, "*", "*.jsonl"))):
+        row = connection.execute("SELECT offset FROM files WHERE path = ?", (path,)).fetchone()
+        offset = row[0] if row else 0
+        if os.path.getsize(path) <= offset:
+            continue
+        with open(path, "r", encoding="utf-8") as file:
+            file.seek(offset)
+            rows = []
+            while True:
+                line = file.readline()
+                # Stop at a partial last line; it is picked up by the next build
+                if not line.endswith("\n"):
+                    break
+                event = json.loads(line)
+                rows.append(tuple(event.get(column) for column in COLUMNS))
+                offset = file.tell()
+        connection.executemany(f"INSERT INTO events VALUES ({', '.join('?' * len(COLUMNS))})", rows)
+        connection.execute("INSERT OR REPLACE INTO files VALUES (?, ?)", (path, offset))
+        added += len(rows)
+    connection.commit()
+    return added
+
+
+def since(days):
+    """ISO timestamp 'days' ago (matches the 'ts' column format)."""
+    return (datetime.now() - timedelta(days=days)).isoformat(timespec="milliseconds")
+
+
+def slowest(connection, days=7, limit=20):
+    """Page actions with the highest mean duration."""
+    return connection.execute("""
+        SELECT page, action, locator, COUNT(*) AS calls,
+               ROUND(AVG(duration_ms), 1) AS mean_ms, ROUND(MAX(duration_ms), 1) AS max_ms
+        FROM events
+        WHERE page IS NOT NULL AND ts >= ?
+        GROUP BY page, action, locator
+        ORDER BY mean_ms DESC
+        LIMIT ?
+    """, (since(days), limit)).fetchall()
+
+
+def flaky_locators(connection, days=30, limit=20):
+    """Locators that both succeeded and failed, ordered by failure rate."""
+    return connection.execute("""
+        SELECT locator, COUNT(*) AS calls, SUM(outcome != 'ok') AS failures,
+               ROUND(100.0 * SUM(outcome != 'ok') / COUNT(*), 1) AS failure_pct,
+               COUNT(DISTINCT run) AS runs
+        FROM events
+        WHERE locator IS NOT NULL AND ts >= ?
+        GROUP BY locator
+        HAVING failures > 0 AND failures < calls
+        ORDER BY failure_pct DESC, calls DESC
+        LIMIT ?
+    """, (since(days), limit)).fetchall()
+
+
+def trend(connection, test="", days=30):
+    """Call-phase duration of matching tests, per run."""
+    return connection.execute("""
+        SELECT run, test, ROUND(duration_ms, 1) AS duration_ms, outcome
+        FROM events
+        WHERE action = 'test.call' AND test LIKE ? AND ts >= ?
+        ORDER BY test, ts
+    """, (f"%{test}%", since(days))).fetchall()
+
+
+def print_table(headers, rows):
+    """Print rows as an aligned text table."""
+    rows = [["" if value is None else str(value) for value in row] for row in rows]
+    widths = [max([len(header)] + [len(row[i]) for row in rows]) for i, header in enumerate(headers)]
+    print("  ".join(header.ljust(width) for header, width in zip(headers, widths)))
+    for row in rows:
+        print("  ".join(value.ljust(width) for value, width in zip(row, widths)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m utils.event_index", description=__doc__.splitlines()[1])
+    parser.add_argument("--db", default=None, help="Index file (default Config.EVENT_INDEX_PATH)")
+    parser.add_argument("--events", default=None, help="Event log directory (default Config.EVENT_LOG_PATH)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("build", help="Index new events")
+    slowest_parser = commands.add_parser("slowest", help="Slowest page actions")
+    slowest_parser.add_argument("--days", type=float, default=7)
+    slowest_parser.add_argument("--limit", type=int, default=20)
+    flaky_parser = commands.add_parser("flaky-locators", help="Locators that fail intermittently")
+    flaky_parser.add_argument("--days", type=float, default=30)
+    flaky_parser.add_argument("--limit", type=int, default=20)
+    trend_parser = commands.add_parser("trend", help="Per-run duration of tests")
+    trend_parser.add_argument("test", nargs="?", default="")
+    trend_parser.add_argument("--days", type=float, default=30)
+    args = parser.parse_args(argv)
+
+    connection = connect(args.db)
+    # Every query sees the latest events
+    added = build(connection, args.events)
+    if args.command == "build":
+        print(f"Indexed {added} new events")
+    elif args.command == "slowest":
+        print_table(("page", "action", "locator", "calls", "mean_ms", "max_ms"),
+                    slowest(connection, args.days, args.limit))
+    elif args.command == "flaky-locators":
+        print_table(("locator", "calls", "failures", "failure_pct", "runs"),
+                    flaky_locators(connection, args.days, args.limit))
+    elif args.command == "trend":
+        print_table(("run", "test", "duration_ms", "outcome"), trend(connection, args.test, args.days))
+    connection.close()
+
+
+if __name__ == "__main__":
+    main()
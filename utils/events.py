@@ -0,0 +1,127 @@
+import functools
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from config.config import Config
+
+
+class EventLog:
+    """
+    Structured JSONL event log of one process.
+
+    - One JSON object per line: ts, run, worker, test, page, action, locator,
+      duration_ms, outcome (plus any extra fields).
+    - Written to Config.EVENT_LOG_PATH/<run id>/<worker>.jsonl; the file is
+      opened on the first event, so a run without events creates nothing.
+    - Query many runs at once with 'python -m utils.event_index'.
+    """
+
+    def __init__(self, worker_id="master", directory=None):
+        self.worker_id = worker_id
+        self.path = os.path.join(directory or Config.EVENT_LOG_PATH, Config.run_id(), f"{worker_id}.jsonl")
+        self.current_test = None
+        self._file = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def emit(self, action, page=None, locator=None, duration_ms=None, outcome="ok", **fields):
+        """Append one event for the current test."""
+        event = {
+            "ts": datetime.now().isoformat(timespec="milliseconds"),
+            "run": Config.run_id(),
+            "worker": self.worker_id,
+            "test": self.current_test,
+            "page": page,
+            "action": action,
+            "locator": locator,
+            "duration_ms": duration_ms,
+            "outcome": outcome,
+            **fields,
+        }
+        line = json.dumps(event, default=str) + "\n"
+        with self._lock:
+            if self._file is None:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(line)
+
+    def close(self):
+        """Flush and close the event file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    @property
+    def depth(self):
+        """Nesting level of page actions on this thread (0 = called from test code)."""
+        return getattr(self._local, "depth", 0)
+
+    @depth.setter
+    def depth(self, value):
+        self._local.depth = value
+
+
+# Event log of this process (None until configure_events is called)
+_event_log = None
+
+
+def configure_events(worker_id="master"):
+    """Start this process's event log (no-op when Config.EVENT_LOG is off)."""
+    global _event_log
+    if Config.EVENT_LOG and _event_log is None:
+        _event_log = EventLog(worker_id)
+    return _event_log
+
+
+def get_event_log():
+    """Return this process's EventLog, or None when events are off."""
+    return _event_log
+
+
+def close_events():
+    """Close this process's event log."""
+    global _event_log
+    if _event_log is not None:
+        _event_log.close()
+        _event_log = None
+
+
+def page_action(method):
+    """
+    Decorator emitting a timed event for a page-object method.
+    The first argument is recorded as the locator when it is a (By, value) tuple;
+    other arguments (which may hold passwords or user data) are never recorded.
+    """
+    action = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        events = _event_log
+        if events is None:
+            return method(self, *args, **kwargs)
+
+        locator = args[0] if args and isinstance(args[0], tuple) and len(args[0]) == 2 else None
+        depth = events.depth
+        events.depth = depth + 1
+        outcome = "ok"
+        start = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        except Exception as e:
+            outcome = type(e).__name__
+            raise
+        finally:
+            events.depth = depth
+            events.emit(
+                action,
+                page=type(self).__name__,
+                locator=f"{locator[0]}={locator[1]}" if locator else None,
+                duration_ms=round((time.perf_counter() - start) * 1000, 3),
+                outcome=outcome,
+                depth=depth,
+            )
+
+    return wrapper
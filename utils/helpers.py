@@ -1,46 +1,32 @@
 import logging
-from datetime import datetime
 
 def setup_logging():
     """
     Configure logging for the test framework.
     
-    - Logs will be written both to a file (test_execution.log) and the console.
-    - Log format includes timestamp, module name, log level, and message.
-    - Default log level is INFO (can be adjusted if needed).
+    Kept for older callers; delegates to utils.logger.setup_logging, the single
+    bootstrap (queue-based console + per-process file logging). The worker id comes
+    from PYTEST_XDIST_WORKER, and a call after logging is set up changes nothing.
     """
-    logging.basicConfig(
-        level=logging.INFO,  # Set default logging level to INFO
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Define log format
-        handlers=[
-            logging.FileHandler("test_execution.log"),  # Save logs to file
-            logging.StreamHandler()                     # Also print logs to console
-        ]
-    )
+    from utils.logger import setup_logging as bootstrap_logging
+    return bootstrap_logging()
 
 
 def take_screenshot(driver, name):
     """
-    Capture and save a screenshot of the current browser state.
+    Capture a screenshot of the current browser state.
     
     Args:
         driver: Selenium WebDriver instance.
         name (str): Custom name for the screenshot (usually the test name).
     
     Returns:
-        str: Full file path of the saved screenshot.
+        ScreenshotHandle: Path-like path of the screenshot, stored in the background
+        under reports/screenshots/; using it as a path (or handle.result()) waits for
+        the file, handle.ref() for its stable reference.
     """
-    # Create a unique filename using the provided name and a timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{name}_{timestamp}.png"
-    filepath = f"reports/screenshots/{filename}"
+    from utils.artifacts import get_pipeline
+    handle = get_pipeline().screenshot(driver, name)
+    logging.info(f"Screenshot captured: {name}")  # The file is written in the background
     
-    # Ensure the 'reports/screenshots' directory exists before saving
-    import os
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    
-    # Save screenshot to the defined filepath
-    driver.save_screenshot(filepath)
-    logging.info(f"Screenshot saved: {filepath}")  # Log the location of saved screenshot
-    
-    return filepath
+    return handle
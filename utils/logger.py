@@ -1,82 +1,51 @@
+import atexit
+import glob
+import heapq
 import logging
 import os
-from datetime import datetime
-from logging.handlers import RotatingFileHandler
+import queue
+import re
+import shutil
+import threading
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
+from config.config import Config
 
-class Logger:
+class DroppingQueueHandler(QueueHandler):
     """
-    A custom logger class that sets up both console and file logging.
-    Uses rotating file handler to prevent oversized log files.
+    QueueHandler for a bounded queue.
+
+    - Records are enqueued unformatted; formatting happens on the listener
+      thread (only exception tracebacks are rendered here, while they exist).
+    - When the queue is full, records below WARNING are dropped and counted,
+      WARNING and above wait for space, so failures are never lost.
     """
-    def __init__(self, name=__name__, log_level=logging.INFO):
-        # Create logger instance
-        self.logger = logging.getLogger(name)
-        self.logger.setLevel(log_level)
-        
-        # Clear existing handlers to avoid duplicate logs if re-initialized
-        if self.logger.handlers:
-            self.logger.handlers.clear()
-        
-        # Create 'logs' directory (project_root/logs) if it doesn't exist
-        log_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "logs")
-        os.makedirs(log_dir, exist_ok=True)
-        
-        # Define formatters
-        console_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        
-        file_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s'
-        )
-        
-        # Console handler for live log display in terminal
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(log_level)
-        console_handler.setFormatter(console_formatter)
-        
-        # File handler with log rotation (to prevent unlimited log size)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_file = os.path.join(log_dir, f"test_execution_{timestamp}.log")
-        
-        file_handler = RotatingFileHandler(
-            log_file,
-            maxBytes=10*1024*1024,  # Each log file max size: 10MB
-            backupCount=5,          # Keep up to 5 backup log files
-            encoding='utf-8'
-        )
-        file_handler.setLevel(log_level)
-        file_handler.setFormatter(file_formatter)
-        
-        # Add handlers to logger
-        self.logger.addHandler(console_handler)
-        self.logger.addHandler(file_handler)
-    
-    def get_logger(self):
-        """Return the configured logger instance."""
-        return self.logger
 
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
 
-def setup_logging(log_level=logging.INFO):
+    def prepare(self, record):
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if record.levelno >= logging.WARNING:
+                self.queue.put(record)
+            else:
+                self.dropped += 1
+
+
+def build_handlers(log_file, log_level=logging.INFO, stream=None):
     """
-    Set up a root logger configuration for global logging.
-    
-    - Creates 'logs' directory if it doesn't exist.
-    - Configures console + rotating file handlers.
-    - Can be called once in test framework setup.
+    Create the console and rotating file handlers used by the framework.
+    The file handler is wrapped in a MemoryHandler, so records reach the disk in
+    batches of Config.LOG_BATCH_SIZE (or immediately for ERROR and above).
     """
-    # Create logs directory at project root
-    log_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "logs")
-    os.makedirs(log_dir, exist_ok=True)
-    
-    # Get root logger
-    root_logger = logging.getLogger()
-    root_logger.setLevel(log_level)
-    
-    # Clear any existing handlers to avoid duplicate logs
-    if root_logger.handlers:
-        root_logger.handlers.clear()
-    
     # Define formatters
     console_formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -87,14 +56,11 @@ def setup_logging(log_level=logging.INFO):
     )
     
     # Console handler
-    console_handler = logging.StreamHandler()
+    console_handler = logging.StreamHandler(stream)
     console_handler.setLevel(log_level)
     console_handler.setFormatter(console_formatter)
     
     # File handler with daily log file rotation
-    timestamp = datetime.now().strftime("%Y%m%d")
-    log_file = os.path.join(log_dir, f"automation_{timestamp}.log")
-    
     file_handler = RotatingFileHandler(
         log_file,
         maxBytes=10*1024*1024,  # 10MB max size
@@ -103,21 +69,139 @@ def setup_logging(log_level=logging.INFO):
     )
     file_handler.setLevel(log_level)
     file_handler.setFormatter(file_formatter)
+
+    # Batch file writes; errors still flush straight away
+    batched_file_handler = MemoryHandler(
+        capacity=Config.LOG_BATCH_SIZE,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True
+    )
+    batched_file_handler.setLevel(log_level)
+    return [console_handler, batched_file_handler]
+
+
+# Background writer of the root logger's queue (one per process)
+_listener = None
+_queue_handler = None
+_configured_file = None
+_lock = threading.Lock()
+
+
+def setup_logging(log_level=None, worker_id=None):
+    """
+    Set up the root logger for this process; safe to call any number of times.
     
-    # Add both handlers to root logger
-    root_logger.addHandler(console_handler)
-    root_logger.addHandler(file_handler)
-    
+    - Nothing happens at import: the logs directory and file are created on the first call.
+    - Each process (pytest-xdist worker) writes its own file,
+      logs/<run id>/<worker_id>.log, so processes never share a file handle.
+      worker_id defaults to PYTEST_XDIST_WORKER ("master" outside xdist workers).
+    - Test code only puts records on a bounded queue (Config.LOG_QUEUE_SIZE);
+      a QueueListener thread formats them and writes console + rotating file output.
+    - Once set up, later calls are no-ops returning the root logger, whatever their
+      arguments; call shutdown_logging() first to set logging up again.
+    """
+    global _listener, _queue_handler, _configured_file
+    log_level = log_level or Config.LOG_LEVEL
+    worker_id = worker_id or os.environ.get("PYTEST_XDIST_WORKER", "master")
+    log_file = os.path.join(Config.LOG_PATH, Config.run_id(), f"{worker_id}.log")
+
+    with _lock:
+        root_logger = logging.getLogger()
+        if _listener is not None:
+            if _configured_file != log_file:
+                logging.getLogger(__name__).debug(f"Logging already set up ({_configured_file}); ignoring {log_file}")
+            return root_logger
+
+        os.makedirs(os.path.dirname(log_file), exist_ok=True)
+        root_logger.setLevel(log_level)
+
+        # Only the queue handler runs on the calling thread
+        _queue_handler = DroppingQueueHandler(queue.Queue(maxsize=Config.LOG_QUEUE_SIZE))
+        _listener = QueueListener(
+            _queue_handler.queue,
+            *build_handlers(log_file, log_level),
+            respect_handler_level=True
+        )
+        _listener.start()
+        root_logger.addHandler(_queue_handler)
+        _configured_file = log_file
+        atexit.register(shutdown_logging)
+
     return root_logger
 
 
-# Global logger instance (can be imported across framework)
-logger = Logger(__name__).get_logger()
+def shutdown_logging():
+    """Drain the log queue, flush batched file output and stop the writer thread."""
+    with _lock:
+        _shutdown()
+
+
+def _shutdown():
+    global _listener, _queue_handler, _configured_file
+    if _listener is None:
+        return
+    if _queue_handler.dropped:
+        logging.getLogger(__name__).warning(
+            f"{_queue_handler.dropped} log records below WARNING were dropped (log queue full)"
+        )
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    logging.getLogger().removeHandler(_queue_handler)
+    _listener = None
+    _queue_handler = None
+    _configured_file = None
+
+
+# Log lines start with "2025-09-03 19:23:13,123"; other lines continue the previous record
+_TIMESTAMP = re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}")
+
+
+def _records(path):
+    """Yield (timestamp, text) per log record of a file, keeping tracebacks with their record."""
+    with open(path, "r", encoding="utf-8") as file:
+        timestamp, lines = "", []
+        for line in file:
+            match = _TIMESTAMP.match(line)
+            if match and lines:
+                yield timestamp, "".join(lines)
+                lines = []
+            if match:
+                timestamp = match.group(0)
+            lines.append(line)
+        if lines:
+            yield timestamp, "".join(lines)
+
+
+def merge_logs(run_id=None, output=None, remove_parts=True):
+    """
+    Interleave every process's log file of a run into one log ordered by timestamp.
+    Streams through the files (heapq.merge), so memory use does not grow with log size.
+    With remove_parts, the per-process files are deleted once merged.
+    Returns the merged file path, or None if the run has no logs.
+    """
+    run_dir = os.path.join(Config.LOG_PATH, run_id or Config.run_id())
+    # Rotated backups (<worker>.log.1, ...) hold older records of the same worker
+    paths = sorted(glob.glob(os.path.join(run_dir, "*.log*")))
+    if not paths:
+        return None
+    output = output or os.path.join(Config.LOG_PATH, f"test_execution_{os.path.basename(run_dir)}.log")
+    with open(output, "w", encoding="utf-8") as merged:
+        for _, text in heapq.merge(*(_records(path) for path in paths), key=lambda record: record[0]):
+            merged.write(text)
+    if remove_parts:
+        shutil.rmtree(run_dir, ignore_errors=True)
+    return output
 
 
 if __name__ == "__main__":
     # Test the logger functionality
+    setup_logging(logging.DEBUG)
+    logger = logging.getLogger(__name__)
     logger.info("Logger configuration test - INFO level")
     logger.debug("Logger configuration test - DEBUG level")
     logger.warning("Logger configuration test - WARNING level")
     logger.error("Logger configuration test - ERROR level")
+    shutdown_logging()
+    print(f"Merged log: {merge_logs()}")
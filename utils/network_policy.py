@@ -0,0 +1,147 @@
+import json
+import logging
+import urllib.request
+from fnmatch import fnmatch
+from config.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class NetworkPolicy:
+    """
+    Blacklist/whitelist of URL patterns to block in the browser.
+
+    - 'block' patterns use Chrome's wildcard syntax ('*' matches anything).
+    - 'unblock' patterns remove entries from the block list: each block pattern
+      that fnmatch-es an unblock pattern is dropped, e.g. unblock=['*.svg'] lets
+      a test that checks product images keep SVGs while the defaults block them.
+      This edits the pattern list only; it cannot carve single URLs out of a
+      pattern that stays blocked (Network.setBlockedURLs has no exceptions).
+    """
+
+    def __init__(self, block=None, unblock=None):
+        self.block = list(Config.NETWORK_BLOCK_PATTERNS if block is None else block)
+        self.unblock = list(unblock or [])
+
+    @classmethod
+    def from_marker(cls, marker):
+        """Build a policy from a @pytest.mark.network_policy(block=[...], unblock=[...]) marker."""
+        if marker is None:
+            return cls()
+        return cls(block=marker.kwargs.get("block"), unblock=marker.kwargs.get("unblock"))
+
+    @property
+    def blocked_patterns(self):
+        """Block patterns left after removing the unblocked ones."""
+        return [pattern for pattern in self.block
+                if not any(fnmatch(pattern, unblocked) for unblocked in self.unblock)]
+
+
+class NetworkBlocker:
+    """
+    Applies a NetworkPolicy to a Chromium driver through CDP and counts what it saved.
+
+    - Uses Network.setBlockedURLs, so blocked requests never leave the browser.
+    - Reads the 'performance' log (Config.NETWORK_PERFORMANCE_LOG) to count
+      blocked requests per test; without it the counts are reported as unavailable.
+    - Estimates avoided bytes from sizes learned from earlier unblocked loads;
+      unknown sizes cost one HEAD request only with Config.NETWORK_ESTIMATE_SIZES.
+      Blocked requests whose size stays unknown are counted separately and never
+      reported as 0 bytes.
+    """
+
+    # Transfer sizes learned across the session, keyed by URL (None: size could not be learned)
+    _known_sizes = {}
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.supported = hasattr(driver, "execute_cdp_cmd")
+        self.blocked_requests = 0
+        self.blocked_bytes = 0
+        self.unsized_requests = 0
+        self.blocked_urls = []
+        self.log_available = True
+
+    def apply(self, policy):
+        """Enable blocking for the policy's patterns and start counting from zero."""
+        if not self.supported:
+            logger.debug("Network blocking is only available on Chromium browsers")
+            return
+        self._drain_log()
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": policy.blocked_patterns})
+        logger.debug(f"Blocking URL patterns: {policy.blocked_patterns}")
+
+    def clear(self):
+        """Remove all blocking, so the next lease of this browser starts unrestricted."""
+        if self.supported:
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+
+    def collect(self):
+        """Tally blocked requests and bytes from the performance log since apply()."""
+        if not self.supported:
+            return self
+        requests = {}
+        for entry in self._drain_log():
+            message = json.loads(entry["message"])["message"]
+            params = message.get("params", {})
+            method = message.get("method")
+            if method == "Network.requestWillBeSent":
+                requests[params["requestId"]] = params["request"]["url"]
+            elif method == "Network.responseReceived":
+                requests[params["requestId"]] = params["response"]["url"]
+            elif method == "Network.loadingFinished":
+                url = requests.get(params["requestId"])
+                if url:
+                    self._known_sizes[url] = int(params.get("encodedDataLength", 0))
+            elif method == "Network.loadingFailed" and params.get("blockedReason"):
+                url = requests.get(params["requestId"], "")
+                self.blocked_requests += 1
+                self.blocked_urls.append(url)
+                size = self._estimate_size(url)
+                if size is None:
+                    self.unsized_requests += 1
+                else:
+                    self.blocked_bytes += size
+        return self
+
+    def summary(self):
+        """Human-readable summary for the report section."""
+        if not self.log_available:
+            return "Blocked requests: unavailable (browser started without the performance log)"
+        lines = [f"Blocked requests: {self.blocked_requests}",
+                 f"Avoided transfer: {self.format_avoided(self.blocked_requests, self.blocked_bytes, self.unsized_requests)}"]
+        lines.extend(f"  {url}" for url in self.blocked_urls)
+        return "\n".join(lines)
+
+    @staticmethod
+    def format_avoided(blocked_requests, blocked_bytes, unsized_requests):
+        """Describe the avoided transfer without passing unknown sizes off as 0 KB."""
+        if unsized_requests and unsized_requests >= blocked_requests:
+            return "unknown (no blocked resource was seen unblocked)"
+        if unsized_requests:
+            return f"at least {blocked_bytes / 1024:.1f} KB ({unsized_requests} of {blocked_requests} requests of unknown size)"
+        return f"{blocked_bytes / 1024:.1f} KB"
+
+    def _drain_log(self):
+        try:
+            return self.driver.get_log("performance")
+        except Exception as e:
+            if self.log_available:
+                logger.warning(f"Performance log unavailable, blocked requests cannot be counted: {e}")
+            self.log_available = False
+            return []
+
+    def _estimate_size(self, url):
+        """Transfer size of a URL in bytes, or None if it is not known."""
+        if url not in self._known_sizes:
+            if not Config.NETWORK_ESTIMATE_SIZES:
+                return None
+            try:
+                request = urllib.request.Request(url, method="HEAD")
+                with urllib.request.urlopen(request, timeout=2) as response:
+                    length = response.headers.get("Content-Length")
+                    self._known_sizes[url] = int(length) if length else None
+            except Exception:
+                self._known_sizes[url] = None
+        return self._known_sizes[url]
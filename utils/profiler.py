@@ -0,0 +1,140 @@
+import glob
+import inspect
+import json
+import logging
+import os
+from collections import defaultdict
+from utils.command_counter import CommandCounter
+
+logger = logging.getLogger(__name__)
+
+
+class CommandProfiler(CommandCounter):
+    """
+    Records every WebDriver command a driver sends, with timing and call site.
+
+    - A CommandCounter that stays entered for the life of the driver, so it
+      sees every command sent through driver.execute.
+    - Each record holds the command name, locator (for find commands),
+      latency, the test being run and the page-object method that issued it.
+    - Records are kept per test and handed over by end_test(); with a spool
+      set (spool_to), they are also appended to commands_<worker>.jsonl, so
+      memory holds only the running test's records.
+    - Records aggregate per test and per page-object method, and export as a
+      collapsed-stack trace ("test;Page.method;command <microseconds>") that
+      flamegraph.pl and speedscope can render directly.
+
+    Usage:
+        profiler = CommandProfiler.attach(driver)
+        profiler.start_test("tests/test_01_Login.py::TestLogin::test_x")
+        ...
+        profiler.end_test()
+    """
+
+    # Per-process spool file the records of finished tests are appended to (None = off)
+    _spool_path = None
+
+    def __init__(self, driver):
+        super().__init__(driver)
+        self.current_test = None
+        self._records_by_test = {}
+        self.__enter__()
+
+    @classmethod
+    def attach(cls, driver):
+        """Return the profiler already wrapping this driver, or wrap it now."""
+        profiler = getattr(driver, "_command_profiler", None)
+        if profiler is None:
+            profiler = cls(driver)
+            driver._command_profiler = profiler
+        return profiler
+
+    @classmethod
+    def spool_to(cls, directory, worker_id="master"):
+        """Append the records of every finished test of this process to <directory>/commands_<worker_id>.jsonl."""
+        os.makedirs(directory, exist_ok=True)
+        cls._spool_path = os.path.join(directory, f"commands_{worker_id}.jsonl")
+
+    def start_test(self, test_id):
+        """Attribute subsequent commands to the given test."""
+        self.current_test = test_id
+        self._records_by_test.setdefault(test_id, [])
+
+    def end_test(self):
+        """Stop attributing commands to a test and return (and spool) that test's records."""
+        test_id, self.current_test = self.current_test, None
+        records = self._records_by_test.pop(test_id, [])
+        if records and self._spool_path:
+            with open(self._spool_path, "a") as file:
+                file.writelines(json.dumps(record) + "\n" for record in records)
+        return records
+
+    def on_command(self, command, params, duration_ms):
+        if self.current_test is not None:
+            self._records_by_test[self.current_test].append({
+                "test": self.current_test,
+                "command": command,
+                "locator": self._locator(params),
+                "caller": self._caller(),
+                "duration_ms": round(duration_ms, 3),
+            })
+
+    @staticmethod
+    def _locator(params):
+        if params and "using" in params and "value" in params:
+            return f"{params['using']}={params['value']}"
+        return None
+
+    @staticmethod
+    def _caller():
+        """Name of the outermost page-object method on the stack (e.g. 'ProductsPage.get_catalog')."""
+        from pages.base_page import BasePage
+        caller = None
+        frame = inspect.currentframe()
+        while frame is not None:
+            owner = frame.f_locals.get("self")
+            if frame.f_globals.get("__name__") == "utils.events":
+                pass  # page_action decorator frames, not page-object methods
+            elif isinstance(owner, BasePage):
+                caller = f"{type(owner).__name__}.{frame.f_code.co_name}"
+            elif caller is not None:
+                break
+            frame = frame.f_back
+        return caller or "<test code>"
+
+    # ---------------------- Aggregation ----------------------
+
+    @staticmethod
+    def aggregate(records, key):
+        """Group records by 'key' into {value: {"count", "total_ms", "max_ms"}}, slowest first."""
+        groups = defaultdict(lambda: {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+        for record in records:
+            group = groups[record[key]]
+            group["count"] += 1
+            group["total_ms"] += record["duration_ms"]
+            group["max_ms"] = max(group["max_ms"], record["duration_ms"])
+        return dict(sorted(groups.items(), key=lambda item: item[1]["total_ms"], reverse=True))
+
+    @staticmethod
+    def top_n(records, n=20):
+        """Return the n slowest individual commands."""
+        return sorted(records, key=lambda record: record["duration_ms"], reverse=True)[:n]
+
+    @staticmethod
+    def folded(records):
+        """Collapsed-stack lines for flame graphs, weighted by microseconds."""
+        stacks = defaultdict(float)
+        for record in records:
+            stacks[f"{record['test']};{record['caller']};{record['command']}"] += record["duration_ms"] * 1000
+        return [f"{stack} {int(weight)}" for stack, weight in sorted(stacks.items())]
+
+    # ---------------------- Persistence ----------------------
+
+    @staticmethod
+    def load_all(directory):
+        """Load and merge the records spooled by every process of the run."""
+        records = []
+        for path in sorted(glob.glob(os.path.join(directory, "commands_*.jsonl"))):
+            with open(path, "r") as file:
+                records.extend(json.loads(line) for line in file if line.strip())
+        return records
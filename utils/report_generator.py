@@ -1,100 +1,159 @@
-import json
+import html
+import os
 from datetime import datetime
 
+# Page head; the summary block follows it and is rewritten in place as results arrive
+REPORT_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>{title}</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        .summary { background-color: #f5f5f5; padding: 15px; border-radius: 5px; white-space: pre; }
+        .test { margin-bottom: 10px; padding: 10px; border-left: 5px solid; }
+        .passed { border-color: #28a745; background-color: #d4edda; }
+        .failed { border-color: #dc3545; background-color: #f8d7da; }
+        .skipped { border-color: #ffc107; background-color: #fff3cd; }
+        .screenshot { max-width: 100%; height: auto; margin-top: 10px; }
+        pre { white-space: pre-wrap; }
+    </style>
+</head>
+<body>
+    <h1>{title}</h1>
+"""
+
+# Fixed-width summary, so updating it never shifts the results written after it
+SUMMARY_TEMPLATE = """    <div class="summary"><h2>Summary</h2>
+Status:         {status:<10}
+Total Tests:    {total:>8}
+Passed:         {passed:>8}
+Failed:         {failed:>8}
+Skipped:        {skipped:>8}
+Started:        {started}
+Last Update:    {updated}
+</div>
+    <h2>Test Details</h2>
+"""
+
+REPORT_FOOT = """</body>
+</html>
+"""
+
+
+class StreamingReportWriter:
+    """
+    HTML report written incrementally, one test at a time.
+
+    - Each result is appended and flushed as soon as it arrives, so only the
+      counters (and tests still in progress) are held in memory.
+    - The summary block at the top has a fixed width and is rewritten in place
+      after every result; a report of an aborted run still shows correct
+      counts with status "running". close() marks it "complete".
+    - Screenshots are <img loading="lazy">, so opening a large report does not
+      load every image up front.
+
+    Usage:
+        writer = StreamingReportWriter("reports/test_report.html")
+        writer.add({"name": ..., "status": "passed", "duration": 1.2})
+        writer.close()
+    """
+
+    def __init__(self, filename="test_report.html", title="Test Execution Report"):
+        self.filename = filename
+        self.counts = {"total": 0, "passed": 0, "failed": 0, "skipped": 0}
+        self.started = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._pending = {}
+
+        directory = os.path.dirname(os.path.abspath(filename))
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._file = open(filename, "wb")
+        self._file.write(REPORT_HEAD.replace("{title}", html.escape(title)).encode("utf-8"))
+        self._summary_offset = self._file.tell()
+        self._file.write(self._summary("running"))
+        self._file.flush()
+
+    def add(self, result):
+        """
+        Append one result and refresh the summary.
+
+        Args:
+            result (dict): name, status (passed/failed/skipped; any other status such as
+                "error" or "xfailed" is counted in the total only), duration (seconds),
+                optional error (str) and screenshots (list of file paths).
+        """
+        status = result["status"]
+        self.counts["total"] += 1
+        self.counts[status] = self.counts.get(status, 0) + 1
+
+        block = [f'    <div class="test {html.escape(status)}">',
+                 f"        <h3>{html.escape(result['name'])}</h3>",
+                 f"        <p>Status: <strong>{html.escape(status)}</strong></p>",
+                 f"        <p>Duration: {float(result['duration']):.2f} seconds</p>"]
+        for path in result.get("screenshots", []):
+            src = html.escape(os.path.relpath(path, self._directory).replace(os.sep, "/"))
+            block.append(f'        <p><a href="{src}" target="_blank">'
+                         f'<img class="screenshot" src="{src}" loading="lazy" alt="screenshot"></a></p>')
+        if result.get("error"):
+            block.append(f"        <pre>Error: {html.escape(result['error'])}</pre>")
+        block.append("    </div>\n")
+
+        self._file.write("\n".join(block).encode("utf-8"))
+        self._rewrite_summary("running")
+
+    def add_report(self, report):
+        """
+        Collect a pytest TestReport phase; writes one result per test at teardown.
+        Only tests still running are buffered, so memory does not grow with the run.
+        """
+        if report.when in ("setup", "call"):
+            outcome = self._pending.setdefault(report.nodeid, {"status": "passed", "duration": 0.0, "error": None})
+            outcome["duration"] += report.duration
+            if not report.passed and outcome["status"] == "passed":
+                outcome["status"] = report.outcome
+                outcome["error"] = report.longreprtext
+            return
+
+        outcome = self._pending.pop(report.nodeid, {"status": "passed", "duration": 0.0, "error": None})
+        if report.failed and outcome["status"] == "passed":
+            outcome["status"], outcome["error"] = "failed", report.longreprtext
+        screenshots = next((value for name, value in report.user_properties if name == "screenshots"), [])
+        self.add({"name": report.nodeid, "screenshots": screenshots, **outcome})
+
+    def close(self):
+        """Finalise the summary and close the document."""
+        if self._file.closed:
+            return
+        self._file.write(REPORT_FOOT.encode("utf-8"))
+        self._rewrite_summary("complete")
+        self._file.close()
+
+    def _summary(self, status):
+        return SUMMARY_TEMPLATE.format(
+            status=status,
+            started=self.started,
+            updated=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            **self.counts
+        ).encode("utf-8")
+
+    def _rewrite_summary(self, status):
+        end = self._file.tell()
+        self._file.seek(self._summary_offset)
+        self._file.write(self._summary(status))
+        self._file.seek(end)
+        self._file.flush()
+
+
 def generate_html_report(test_results, filename="test_report.html"):
     """Generate HTML test report with test results summary and details"""
-    
-    # HTML template with placeholders for dynamic test results
-    html_template = """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>Test Execution Report</title>
-        <style>
-            body { font-family: Arial, sans-serif; margin: 20px; }
-            .summary { background-color: #f5f5f5; padding: 15px; border-radius: 5px; }
-            .test { margin-bottom: 10px; padding: 10px; border-left: 5px solid; }
-            .passed { border-color: #28a745; background-color: #d4edda; }
-            .failed { border-color: #dc3545; background-color: #f8d7da; }
-            .skipped { border-color: #ffc107; background-color: #fff3cd; }
-            .screenshot { max-width: 100%; height: auto; margin-top: 10px; }
-        </style>
-    </head>
-    <body>
-        <h1>Test Execution Report</h1>
-        
-        <!-- Summary section -->
-        <div class="summary">
-            <h2>Summary</h2>
-            <p>Total Tests: {total_tests}</p>
-            <p>Passed: {passed}</p>
-            <p>Failed: {failed}</p>
-            <p>Skipped: {skipped}</p>
-            <p>Execution Time: {execution_time}</p>
-        </div>
-        
-        <!-- Detailed results -->
-        <h2>Test Details</h2>
-        {test_details}
-    </body>
-    </html>
-    """
-    
-    # -------------------------
-    # Calculate summary counts
-    # -------------------------
-    total_tests = len(test_results)  # Total number of executed tests
-    passed = sum(1 for result in test_results if result['status'] == 'passed')
-    failed = sum(1 for result in test_results if result['status'] == 'failed')
-    skipped = sum(1 for result in test_results if result['status'] == 'skipped')
-    
-    # -------------------------
-    # Build detailed test results
-    # -------------------------
-    test_details = ""
+    writer = StreamingReportWriter(filename)
     for result in test_results:
-        status_class = result['status']  # CSS class for test status (passed/failed/skipped)
-        
-        # Add test block with name, status, and duration
-        test_details += f"""
-        <div class="test {status_class}">
-            <h3>{result['name']}</h3>
-            <p>Status: <strong>{result['status']}</strong></p>
-            <p>Duration: {result['duration']} seconds</p>
-        """
-        
-        # Add screenshot link if available
-        if result.get('screenshot'):
-            test_details += f"""
-            <p>Screenshot: <a href="{result['screenshot']}" target="_blank">View Screenshot</a></p>
-            """
-        
-        # Add error message if available
-        if result.get('error'):
-            test_details += f"""
-            <p>Error: {result['error']}</p>
-            """
-        
-        # Close test block div
-        test_details += "</div>"
-    
-    # -------------------------
-    # Fill template with data
-    # -------------------------
-    html_content = html_template.format(
-        total_tests=total_tests,
-        passed=passed,
-        failed=failed,
-        skipped=skipped,
-        execution_time=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),  # Current timestamp
-        test_details=test_details
-    )
-    
-    # -------------------------
-    # Save report to HTML file
-    # -------------------------
-    with open(filename, 'w') as f:
-        f.write(html_content)
-    
+        # Older callers pass a single 'screenshot' path
+        if result.get("screenshot") and "screenshots" not in result:
+            result = dict(result, screenshots=[result["screenshot"]])
+        writer.add(result)
+    writer.close()
+
     # Return filename for reference
     return filename
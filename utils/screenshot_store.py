@@ -0,0 +1,251 @@
+import hashlib
+import io
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from config.config import Config
+from utils.driver_resolver import FileLock
+
+logger = logging.getLogger(__name__)
+
+
+def dhash(raw, size=8):
+    """
+    64-bit difference hash of an image (needs Pillow), or None without Pillow.
+    Near-identical screenshots (a blinking caret, a changed timestamp) differ
+    in only a few bits, unlike their sha256.
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+    image = Image.open(io.BytesIO(raw)).convert("L").resize((size + 1, size))
+    pixels = list(image.getdata())
+    bits = 0
+    for row in range(size):
+        for col in range(size):
+            left = pixels[row * (size + 1) + col]
+            right = pixels[row * (size + 1) + col + 1]
+            bits = (bits << 1) | (left > right)
+    return f"{bits:016x}"
+
+
+def hamming(a, b):
+    """Number of differing bits between two hex-encoded hashes."""
+    return bin(int(a, 16) ^ int(b, 16)).count("1")
+
+
+def bands(fingerprint, count, bits=64):
+    """
+    Split a hex-encoded hash into 'count' bit ranges, as (band number, value) keys.
+    Two hashes within count - 1 bits of each other share at least one key (pigeonhole).
+    """
+    value = int(fingerprint, 16)
+    bounds = [bits * i // count for i in range(count + 1)]
+    return [(i, (value >> bounds[i]) & ((1 << (bounds[i + 1] - bounds[i])) - 1)) for i in range(count)]
+
+
+class ScreenshotStore:
+    """
+    Content-addressed, deduplicating screenshot storage.
+
+    Layout under 'root' (Config.SCREENSHOT_PATH):
+        blobs/<2 hex>/<sha256>.<ext>   one file per distinct image
+        index.json                     runs -> [{test, step, hash, taken}], blobs -> {hash: {ext, size, dhash}}
+        active/<run id>.<pid>          marker of a process that has not merged its entries yet
+
+    - Identical images are stored once (same sha256).
+    - Opt-in: with Config.SCREENSHOT_DHASH_DISTANCE > 0 and Pillow installed, an
+      image within that many bits of an existing one (perceptual dHash) reuses
+      that blob. Candidates come from a band index, not a scan of every blob.
+    - Index entries are buffered per process and merged into index.json under
+      a lock on close(), so pytest-xdist workers share one index and one run.
+    - close(evict=True) evicts the oldest runs beyond Config.SCREENSHOT_KEEP_RUNS
+      or Config.SCREENSHOT_MAX_BYTES and deletes blobs no run references anymore.
+      Under xdist only the controller evicts, after every worker has merged.
+    - Reusing a blob touches its mtime. Eviction spares unreferenced blobs touched
+      since the oldest other active process started, since that process may
+      reference them in entries it has not merged yet.
+    """
+
+    # Markers older than this belong to a process that died without close()
+    ACTIVE_MARKER_TIMEOUT = 24 * 3600
+
+    def __init__(self, root=None, run_id=None):
+        self.root = root or Config.SCREENSHOT_PATH
+        self.run_id = run_id or Config.run_id()
+        self.index_path = os.path.join(self.root, "index.json")
+        self.lock_path = os.path.join(self.root, "index.lock")
+        self._blobs = self._read_index()["blobs"]
+        self._entries = []
+        self._lock = threading.Lock()
+        self._band_index = None
+        self._band_index_count = None
+        self._active_marker = None
+
+    def path_for(self, digest):
+        """Absolute path of the blob with the given sha256."""
+        return os.path.join(self.root, "blobs", digest[:2], f"{digest}.{self._blobs[digest]['ext']}")
+
+    def put(self, raw, ext, test, step):
+        """Store image bytes for a test step and return the blob's sha256."""
+        digest = hashlib.sha256(raw).hexdigest()
+        with self._lock:
+            self._mark_active()
+            if digest not in self._blobs or not self._touch(digest):
+                fingerprint = dhash(raw) if Config.SCREENSHOT_DHASH_DISTANCE > 0 else None
+                near = self._near_duplicate(fingerprint)
+                digest = near if near and self._touch(near) else self._write_blob(digest, raw, ext, fingerprint)
+            self._entries.append({
+                "test": test,
+                "step": step,
+                "hash": digest,
+                "taken": datetime.now().isoformat(timespec="milliseconds"),
+            })
+        return digest
+
+    def _near_duplicate(self, fingerprint):
+        if fingerprint is None:
+            return None
+        if self._band_index is None or self._band_index_count != self._band_count():
+            self._band_index, self._band_index_count = {}, self._band_count()
+            for digest, blob in self._blobs.items():
+                self._index_bands(digest, blob.get("dhash"))
+        if self._band_count() is None:
+            candidates = {digest for digest, blob in self._blobs.items() if blob.get("dhash")}
+        else:
+            candidates = set()
+            for key in bands(fingerprint, self._band_count()):
+                candidates.update(self._band_index.get(key, ()))
+        for digest in sorted(candidates):
+            if hamming(fingerprint, self._blobs[digest]["dhash"]) <= Config.SCREENSHOT_DHASH_DISTANCE:
+                logger.debug(f"Screenshot is a near duplicate of {digest}")
+                return digest
+        return None
+
+    @staticmethod
+    def _band_count():
+        # distance + 1 bands guarantee a shared band; beyond 16 bands of 4 bits
+        # (distances that loose match almost anything) every blob is a candidate
+        distance = Config.SCREENSHOT_DHASH_DISTANCE
+        return distance + 1 if distance < 16 else None
+
+    def _index_bands(self, digest, fingerprint):
+        if fingerprint is None or self._band_index is None or self._band_index_count is None:
+            return
+        for key in bands(fingerprint, self._band_index_count):
+            self._band_index.setdefault(key, set()).add(digest)
+
+    def _touch(self, digest):
+        # Marks a reused blob as in use; False if another run's eviction already deleted it
+        try:
+            os.utime(self.path_for(digest))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def _mark_active(self):
+        if self._active_marker is None:
+            self._active_marker = os.path.join(self.root, "active", f"{self.run_id}.{os.getpid()}")
+            os.makedirs(os.path.dirname(self._active_marker), exist_ok=True)
+            open(self._active_marker, "w").close()
+
+    def _oldest_active_start(self):
+        """Start time of the oldest other process still writing entries, or None."""
+        directory = os.path.join(self.root, "active")
+        try:
+            names = os.listdir(directory)
+        except FileNotFoundError:
+            return None
+        starts = []
+        for name in names:
+            path = os.path.join(directory, name)
+            if path == self._active_marker:
+                continue
+            try:
+                started = os.path.getmtime(path)
+            except FileNotFoundError:
+                continue
+            if time.time() - started < self.ACTIVE_MARKER_TIMEOUT:
+                starts.append(started)
+        return min(starts, default=None)
+
+    def _write_blob(self, digest, raw, ext, fingerprint):
+        self._blobs[digest] = {"ext": ext, "size": len(raw), "dhash": fingerprint}
+        self._index_bands(digest, fingerprint)
+        path = self.path_for(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as file:
+                file.write(raw)
+            os.replace(temp_path, path)
+        return digest
+
+    def close(self, evict=True):
+        """Merge this process's entries into the index and optionally apply retention."""
+        with self._lock:
+            entries, self._entries = self._entries, []
+        if not entries and not (evict and os.path.exists(self.index_path)):
+            return
+        os.makedirs(self.root, exist_ok=True)
+        with FileLock(self.lock_path):
+            index = self._read_index()
+            if entries:
+                for digest, blob in self._blobs.items():
+                    index["blobs"].setdefault(digest, blob)
+                run = next((run for run in index["runs"] if run["run_id"] == self.run_id), None)
+                if run is None:
+                    run = {"run_id": self.run_id, "entries": []}
+                    index["runs"].append(run)
+                run["entries"].extend(entries)
+            if evict:
+                self._evict(index)
+            self._write_index(index)
+        if self._active_marker is not None:
+            try:
+                os.remove(self._active_marker)
+            except FileNotFoundError:
+                pass
+            self._active_marker = None
+
+    def _evict(self, index):
+        def run_bytes():
+            referenced = {entry["hash"] for run in index["runs"] for entry in run["entries"]}
+            return sum(index["blobs"][digest]["size"] for digest in referenced if digest in index["blobs"])
+
+        # Oldest runs go first; the current run is always kept
+        while len(index["runs"]) > 1 and (
+                len(index["runs"]) > Config.SCREENSHOT_KEEP_RUNS or run_bytes() > Config.SCREENSHOT_MAX_BYTES):
+            oldest = 1 if index["runs"][0]["run_id"] == self.run_id else 0
+            evicted = index["runs"].pop(oldest)
+            logger.info(f"Evicted screenshots of run {evicted['run_id']}")
+
+        referenced = {entry["hash"] for run in index["runs"] for entry in run["entries"]}
+        active_since = self._oldest_active_start()
+        for digest in [digest for digest in index["blobs"] if digest not in referenced]:
+            path = os.path.join(self.root, "blobs", digest[:2], f"{digest}.{index['blobs'][digest]['ext']}")
+            try:
+                if active_since is not None and os.path.getmtime(path) >= active_since:
+                    logger.debug(f"Kept blob {digest}: possibly reused by a run that has not merged yet")
+                    continue
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            del index["blobs"][digest]
+
+    def _read_index(self):
+        try:
+            with open(self.index_path, "r") as file:
+                return json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {"runs": [], "blobs": {}}
+
+    def _write_index(self, index):
+        temp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as file:
+            json.dump(index, file, indent=2)
+        os.replace(temp_path, self.index_path)
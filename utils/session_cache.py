@@ -0,0 +1,80 @@
+import logging
+from config.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class SessionCache:
+    """
+    Per-worker cache of logged-in browser sessions.
+
+    - The first login for a user goes through the UI and the resulting
+      cookies and localStorage entries are captured.
+    - Later logins seed the captured state straight into the driver and open
+      the inventory page, skipping the login form entirely.
+    """
+
+    # Script used to snapshot every localStorage entry as a plain dict
+    _READ_STORAGE_SCRIPT = """
+        var state = {};
+        for (var i = 0; i < window.localStorage.length; i++) {
+            var key = window.localStorage.key(i);
+            state[key] = window.localStorage.getItem(key);
+        }
+        return state;
+    """
+
+    # Script used to replace localStorage with a previously captured snapshot
+    _WRITE_STORAGE_SCRIPT = """
+        window.localStorage.clear();
+        var state = arguments[0];
+        for (var key in state) {
+            window.localStorage.setItem(key, state[key]);
+        }
+    """
+
+    def __init__(self):
+        self._sessions = {}
+
+    def has(self, username):
+        """Return True if a session snapshot exists for the given user."""
+        return username in self._sessions
+
+    def capture(self, driver, username):
+        """
+        Snapshot cookies and localStorage of the current (logged-in) session.
+        Must be called while the browser is on the application's origin.
+        """
+        cookies = driver.get_cookies()
+        storage = driver.execute_script(self._READ_STORAGE_SCRIPT)
+        self._sessions[username] = {"cookies": cookies, "storage": storage}
+        logger.info(f"Captured session for {username}: {len(cookies)} cookies, {len(storage)} storage keys")
+
+    def restore(self, driver, username):
+        """
+        Seed a captured session into the driver and open the inventory page.
+        Returns False if no snapshot exists for the user.
+        """
+        session = self._sessions.get(username)
+        if session is None:
+            return False
+
+        # Cookies can only be set for the origin currently loaded in the browser
+        if not driver.current_url.startswith(Config.BASE_URL):
+            driver.get(Config.BASE_URL)
+
+        driver.delete_all_cookies()
+        for cookie in session["cookies"]:
+            # Re-add as a browser-session cookie so a captured expiry cannot lapse mid-run
+            cookie = {key: value for key, value in cookie.items() if key != "expiry"}
+            driver.add_cookie(cookie)
+        driver.execute_script(self._WRITE_STORAGE_SCRIPT, session["storage"])
+
+        driver.get(Config.url("inventory.html"))
+        driver.session_user = username
+        logger.info(f"Restored cached session for {username}")
+        return True
+
+    def clear(self):
+        """Forget all captured sessions."""
+        self._sessions.clear()
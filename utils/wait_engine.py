@@ -0,0 +1,75 @@
+import time
+import logging
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
+from config.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class WaitEngine:
+    """
+    Single owner of all waiting done by the page objects.
+
+    - Runs with the driver's implicit wait at zero, so every poll is one
+      immediate WebDriver round trip instead of a hidden implicit wait.
+    - Polls start fast (Config.WAIT_POLL_INTERVAL) and back off geometrically
+      up to Config.WAIT_MAX_POLL_INTERVAL, so quick conditions return quickly
+      and slow ones do not flood the driver with requests.
+    - Timeouts default to a per-condition budget from Config.WAIT_BUDGETS.
+    """
+
+    # Exceptions treated as "condition not met yet" while polling
+    IGNORED_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+
+    def __init__(self, driver, poll_interval=None, max_poll_interval=None, backoff=None):
+        self.driver = driver
+        self.poll_interval = poll_interval or Config.WAIT_POLL_INTERVAL
+        self.max_poll_interval = max_poll_interval or Config.WAIT_MAX_POLL_INTERVAL
+        self.backoff = backoff or Config.WAIT_BACKOFF
+
+    @staticmethod
+    def budget(name):
+        """Return the time budget in seconds for a named kind of condition."""
+        return Config.WAIT_BUDGETS.get(name, Config.WAIT_BUDGETS["default"])
+
+    def until(self, condition, timeout=None, budget="default", message=""):
+        """
+        Poll condition(driver) until it returns a truthy value and return that value.
+        Raises TimeoutException once the timeout (or the named budget) is spent.
+        """
+        timeout = self.budget(budget) if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        interval = self.poll_interval
+        while True:
+            try:
+                value = condition(self.driver)
+                if value:
+                    return value
+            except self.IGNORED_EXCEPTIONS:
+                pass
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutException(message or f"Condition not met within {timeout} seconds")
+            time.sleep(min(interval, remaining))
+            interval = min(interval * self.backoff, self.max_poll_interval)
+
+    def until_not(self, condition, timeout=None, budget="default", message=""):
+        """
+        Poll condition(driver) until it returns a falsy value.
+        Returns True, or raises TimeoutException once the budget is spent.
+        """
+        def negated(driver):
+            try:
+                return not condition(driver)
+            except self.IGNORED_EXCEPTIONS:
+                return True
+
+        return self.until(negated, timeout, budget, message)
+
+    def probe(self, locator):
+        """
+        Fast negative path: look the locator up exactly once, without waiting.
+        Returns the (possibly empty) list of matching elements.
+        """
+        return self.driver.find_elements(*locator)